@@ -15,9 +15,19 @@
 from xml.etree import ElementTree
 import validate
 import interface
-import common
+import naming
 import string
 
+# Incremented whenever the names of objects may have changed. The names
+# cached by each object are only used if made in the current generation.
+name_generation = 0
+
+def names_changed():
+    """Record a change to the object tree so all cached names are remade."""
+    global name_generation
+    name_generation += 1
+    return
+
 class AllJoynObject:
     """This class contains the information in a <node ... > found an AllJoyn
     xml file.
@@ -29,6 +39,7 @@ class AllJoynObject:
     name = string          # The name of this object as found in the xml.
     parent = AllJoynObject # The parent AllJoynObject (<node ...>) if it exists.
     indent = int           # The indent to use for __str__().
+    frozen = bool          # True once made read-only by Service.freeze().
     """
 
     def __init__(self, object_name, our_parent=None):
@@ -36,8 +47,17 @@ class AllJoynObject:
         self.name = object_name
         self.parent = our_parent
         self.interfaces = []      # The interface instances at this node.
+        # The index in interfaces of each interface keyed by its id().
+        self.__interface_index = {}
         self.alljoyn_objects = {} # The child objects.
         self.indent = 0
+        # True once the service is frozen. See Service.freeze().
+        self.frozen = False
+
+        # (name_generation, full name) once the full name is known.
+        self.__full_name = None
+        # [name_generation, coded name, camel cased coded name].
+        self.__coded_names = None
 
         # The index in the service collection of objects.
         # This is set to the proper value in service::get_objects()
@@ -45,60 +65,170 @@ class AllJoynObject:
         return
 
     def parse(self, xml, service, lax_naming):
-        """Parses the xml to acquire the interface."""
+        """Parses the xml to acquire the interface.
+
+        The <node> tree is parsed with an explicit stack instead of recursion
+        so there is no limit to its depth."""
+        full_name = self.get_full_name()
+        self.start_parse(xml, service, full_name)
+
+        # Each entry is [object, xml, xml children, child_count, full_name].
+        stack = [[self, xml, iter(list(xml)), 0, full_name]]
+
+        while stack:
+            entry = stack[-1]
+            o = entry[0]
+            path = entry[4]
+            child_xml = next(entry[2], None)
+
+            if child_xml is None:
+                stack.pop()
+                o.finish_parse(entry[1], entry[3])
+
+                if stack:
+                    stack[-1][0].finish_child(o, service)
+            elif child_xml.tag == "interface":
+                entry[3] += 1
+                o.parse_interface(child_xml, service, lax_naming, path)
+            elif child_xml.tag == "node":
+                entry[3] += 1
+
+                new_node = o.make_child(child_xml)
+                new_path = o.get_child_full_name(new_node, path)
+
+                if not new_node.is_skipped(service, new_path):
+                    new_node.start_parse(child_xml, service, new_path)
+                    stack.append([new_node, child_xml, iter(list(child_xml)),
+                                  0, new_path])
+            else:
+                # Don't count this as a valid child.
+                o.ignore_xml(child_xml)
+
+        return
+
+    def start_parse(self, xml, service, full_name = None):
+        """Prepare to parse the <node> xml of this object.
+
+        The children of the <node> are not needed so this may be called as
+        soon as the start tag has been read. full_name is the full name of
+        this object if it is already known."""
+        self.__check_not_frozen()
 
         # Since we are parsing a new object the service cache is now invalid.
         service.delete_object_cache()
 
-        self.__validate_name(xml)
+        self.__validate_name(xml, full_name)
         # print("Parsing the AllJoynObject '{0}'.".format(self.name))
+        return
 
-        # Make a list of all the objects at this level.
-        xml_root_objects = list(xml)
+    def parse_interface(self, xml, service, lax_naming, full_name = None):
+        """Parse one <interface> child of this object and add it.
 
-        child_count = 0
+        The interface is not parsed if it is rejected by the parse filter. An
+        <interface> with only a name is read from the service's catalogues if
+        it is in one of them. full_name is the full name of this object if
+        it is already known."""
+        if not self.accepts_interface(xml, service, full_name):
+            return
 
-        for o in xml_root_objects:
-            if o.tag == "interface":
-                child_count += 1
+        i = None
 
-                i = interface.Interface()
-                i.parse(o, lax_naming)
+        # An <interface> without children may name a catalogue interface.
+        if len(xml) == 0:
+            i = service.get_catalogue_interface(xml)
 
-                # Ignore the built in interfaces.
-                built_in = {"org.freedesktop.DBus.Peer",
-                            "org.freedesktop.DBus.Introspectable",
-                            "org.freedesktop.DBus.Properties",
-                            "org.freedesktop.DBus.ObjectManager"}
+        if i is None:
+            i = interface.Interface()
+            i.parse(xml, lax_naming)
 
-                if i.interface_full_name in built_in:
-                    print("Ignoring built in interface '{0}'".format(i.interface_full_name))
-                    continue
+        self.add_interface(xml, i, service)
+        return
 
-                # If this is new interface it is added. If it is not a new
-                # interface the existing one is returned.
-                i = service.add_interface(i, o)
-                self.interfaces.append(i)
-                i.add_parent(self)
-            elif o.tag == "node":
-                child_count += 1
+    def add_interface(self, xml, i, service):
+        """Add a completely parsed interface from the <interface> xml."""
+        self.__check_not_frozen()
+
+        # Ignore the built in interfaces.
+        built_in = {"org.freedesktop.DBus.Peer",
+                    "org.freedesktop.DBus.Introspectable",
+                    "org.freedesktop.DBus.Properties",
+                    "org.freedesktop.DBus.ObjectManager"}
+
+        if i.interface_full_name in built_in:
+            print("Ignoring built in interface '{0}'".format(i.interface_full_name))
+            return
+
+        # If this is new interface it is added. If it is not a new
+        # interface the existing one is returned.
+        i = service.add_interface(i, xml)
+        self.__append_interface(i)
+        i.add_parent(self)
+        return
 
-                new_node_name = o.get("name")
+    def make_child(self, xml):
+        """Create, but do not add, the child object for this <node> xml.
 
-                if new_node_name in self.alljoyn_objects:
-                    error_format = "Duplicate node name '{0}'."
-                    error = error_format.format(new_node_name)
-                    error = validate.get_xml_error(o, error)
-                    raise validate.ValidateException(error)
+        Only the attributes of the xml are used."""
+        new_node_name = xml.get("name")
 
-                new_node = AllJoynObject(new_node_name, self)
-                new_node.parse(o, service, lax_naming)
-                self.alljoyn_objects[new_node_name] = new_node
-            else:
-                # Don't count this as a valid child.
-                warn_format = "\nWarning! Ignoring xml object '{0}'."
-                print(warn_format.format(o.tag))
+        if new_node_name in self.alljoyn_objects:
+            error_format = "Duplicate node name '{0}'."
+            error = error_format.format(new_node_name)
+            error = validate.get_xml_error(xml, error)
+            raise validate.ValidateException(error)
+
+        return AllJoynObject(new_node_name, self)
+
+    def add_child(self, child):
+        """Add a completely parsed child object to this object."""
+        self.__check_not_frozen()
+        self.alljoyn_objects[child.name] = child
+        return
 
+    def finish_child(self, child, service):
+        """Add a completely parsed child object unless it has been emptied.
+
+        An object is emptied when the parse filter removes all of its
+        interfaces and children. It is then dropped."""
+        if (service.parse_filter is None or
+            child.interfaces or child.alljoyn_objects):
+            self.add_child(child)
+
+        return
+
+    def is_skipped(self, service, full_name = None):
+        """Return True if the parse filter skips this object and its children.
+
+        A skipped object is never parsed."""
+        if service.parse_filter is None or not self.name:
+            return False
+
+        if full_name is None:
+            full_name = self.get_full_name()
+
+        return service.parse_filter.skips_object(full_name)
+
+    def accepts_interface(self, xml, service, full_name = None):
+        """Return True if the parse filter keeps this <interface> xml."""
+        f = service.parse_filter
+
+        if f is None:
+            return True
+
+        if full_name is None:
+            full_name = self.get_full_name()
+
+        return (f.accepts_interface(xml.get("name")) and
+                f.accepts_object(full_name))
+
+    def ignore_xml(self, xml):
+        """Report an unexpected child of <node> which is being ignored."""
+        warn_format = "\nWarning! Ignoring xml object '{0}'."
+        validate.warning(xml, warn_format, xml.tag)
+        return
+
+    def finish_parse(self, xml, child_count):
+        """Complete the parse of this object once all its children are known."""
         if child_count <= 0:
             mess = "Child interfaces and/or nodes expected."
             mess = validate.get_xml_error(xml, mess)
@@ -106,8 +236,44 @@ class AllJoynObject:
 
         return
 
+    def merge(self, other, service):
+        """Merge the interfaces and child objects of 'other' into this object.
+
+        The interfaces used are the ones with the same name in service."""
+        self.__check_not_frozen()
+        stack = [(self, other)]
+
+        while stack:
+            o, other_o = stack.pop()
+
+            for i in other_o.interfaces:
+                i = service.get_interface(i.interface_full_name)
+
+                if o.get_interface_index(i) is None:
+                    o.__append_interface(i)
+                    i.add_parent(o)
+
+            # Pushed in reverse so the children are merged in sorted order.
+            for key in sorted(other_o.alljoyn_objects, reverse = True):
+                child = o.alljoyn_objects.get(key)
+
+                if child is None:
+                    child = AllJoynObject(key, o)
+                    o.add_child(child)
+
+                stack.append((child, other_o.alljoyn_objects[key]))
+
+        return
+
     def get_full_name(self):
-        """Get the full name of this object."""
+        """Get the full name of this object.
+
+        The name is cached until names_changed() is called."""
+        cached = self.__full_name
+
+        if cached is not None and cached[0] == name_generation:
+            return cached[1]
+
         full_name = self.name
         p = self.parent
 
@@ -119,32 +285,78 @@ class AllJoynObject:
                 full_name = "/".join([p.name, full_name])
             p = p.parent
 
+        self.__full_name = (name_generation, full_name)
         return full_name
 
+    def get_child_full_name(self, child, full_name = None):
+        """Get the full name of child given full_name, the full name of self.
+
+        This is the same as child.get_full_name() without walking up to the
+        root object. None is returned if the child has no name."""
+        if not child.name:
+            return None
+
+        if full_name is None:
+            full_name = self.get_full_name()
+
+        if full_name is None:
+            return child.name
+
+        if child.name[0] == '/' or full_name == '/':
+            return "".join([full_name, child.name])
+
+        return "/".join([full_name, child.name])
+
     def append_objects(self, object_list):
         """Append self and all child objects to object_list."""
-        object_list.append(self)
+        for o, full_name, depth in self.walk():
+            object_list.append(o)
+
+        return
+
+    def walk(self):
+        """Walk this object and all of the objects below it without recursion.
+
+        Yields a tuple (object, full_name, depth) for each object in depth
+        first order with the children of each object in sorted order. The
+        depth of this object is 0. The full name of each object is made from
+        that of its parent so the walk takes time linear in the number of
+        objects however deep the tree."""
+        stack = [(self, self.get_full_name(), 0)]
 
-        for key in sorted(self.alljoyn_objects):
-            o = self.alljoyn_objects[key]
-            o.append_objects(object_list)
+        while stack:
+            o, full_name, depth = stack.pop()
+
+            if full_name is not None:
+                o.__full_name = (name_generation, full_name)
+
+            yield o, full_name, depth
+
+            # Pushed in reverse so the children are popped in sorted order.
+            for key in sorted(o.alljoyn_objects, reverse = True):
+                child = o.alljoyn_objects[key]
+                child_name = o.get_child_full_name(child, full_name)
+                stack.append((child, child_name, depth + 1))
 
         return
 
     def get_interface_index(self, interface):
         """Get the index of this interface in this objects collection.
 
+        The interface is found by identity, not equality. Each interface is
+        added to the service once and every object uses that instance.
         Returns None if not found."""
-        return_value = None
-        index = 0
+        index = self.__interface_index.get(id(interface))
+        count = len(self.interfaces)
 
-        for i in self.interfaces:
-            if i == interface:
-                return_value = index
-                break
-            index += 1
+        if (len(self.__interface_index) != count or
+            (index is not None and
+             (index >= count or self.interfaces[index] is not interface))):
+            # The interfaces were changed without using add_interface().
+            self.__reindex_interfaces()
+            index = self.__interface_index.get(id(interface))
 
-        return return_value
+        return index
 
     def has_properties(self):
         """Return true if any of the interfaces contain a property."""
@@ -156,14 +368,53 @@ class AllJoynObject:
 Example: "/com/example/Demo" is returned as "_com_example_Demo" if make_camel_cased is False.
 Example: "/com/example/Demo" is returned as "comExampleDemo" if make_camel_cased is True."""
 
-        if make_camel_cased:
-            return_value = common.make_camel_case(self.get_full_name())
-        else:
-            return_value = str.replace(self.get_full_name(), "/", "_")
+        names = self.__coded_names
+
+        if names is None or names[0] != name_generation:
+            names = [name_generation, None, None]
+            self.__coded_names = names
+
+        index = 2 if make_camel_cased else 1
+        return_value = names[index]
+
+        if return_value is None:
+            if make_camel_cased:
+                return_value = naming.camel_case(self.get_full_name())
+            else:
+                return_value = naming.coded_name(self.get_full_name(), "/")
+
+            names[index] = return_value
 
         return return_value
 
-    def __validate_name(self, xml):
+    def __append_interface(self, i):
+        self.__interface_index[id(i)] = len(self.interfaces)
+        self.interfaces.append(i)
+        return
+
+    def __reindex_interfaces(self):
+        self.__interface_index = {}
+
+        for index, i in enumerate(self.interfaces):
+            self.__interface_index.setdefault(id(i), index)
+
+        return
+
+    def __getstate__(self):
+        # The interface index is keyed by id() so it is rebuilt when unpickled.
+        state = self.__dict__.copy()
+        del state["_AllJoynObject__interface_index"]
+        # The cached names belong to the name_generation of this process.
+        state["_AllJoynObject__full_name"] = None
+        state["_AllJoynObject__coded_names"] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.__reindex_interfaces()
+        return
+
+    def __validate_name(self, xml, full_name):
         """Check for a valid name and throw an exception if not valid."""
 
         if self.name is None or len(self.name) <= 0:
@@ -177,30 +428,54 @@ Example: "/com/example/Demo" is returned as "comExampleDemo" if make_camel_cased
             error = validate.get_xml_error(xml, error)
             raise validate.ValidateException(error)
 
-        full_name = self.get_full_name()
+        if self.parent is not None:
+            # The parent has already been checked so only the elements added
+            # by this object are. Checking the whole path at every level
+            # would take time quadratic in the depth of the tree.
+            try:
+                validate.bus_object_path("/" + self.name)
+                return
+            except validate.ValidateException:
+                # Check the full name again for the complete error message.
+                pass
+
+        if full_name is None:
+            full_name = self.get_full_name()
+
         # print("obj:: {0}\nfull: {1}".format(self.name, full_name))
         validate.bus_object_path(full_name, xml)
         return
 
+    def __check_not_frozen(self):
+        validate.check_not_frozen(self, "Object '{0}'".format(self.name))
+        return
+
     def __str__(self):
         """Create and return a string representation of this object."""
-        indent_str = " " * self.indent
+        return self.to_string(self.indent)
 
-        f = "{0}Obj name: '{1}'\n{0}Full name: '{2}'\n{0}Interfaces:\n"
-        return_value = f.format(indent_str, self.name, self.get_full_name())
+    def to_string(self, indent):
+        """Return a string representation of this object indented by indent."""
+        parts = []
+        last_depth = 0
 
-        for i in self.interfaces:
-            return_value = "{0}{1}  {2}\n".format(return_value,
-                                                  indent_str,
-                                                  i.interface_full_name)
+        for o, full_name, depth in self.walk():
+            # Each child object ends with a newline once all of its own
+            # children have been written.
+            if depth > 0:
+                parts.append("\n" * (last_depth - depth + 1))
 
-        if self.alljoyn_objects:
-            return_value = "{0}\n{1}Child objects:\n".format(return_value, indent_str)
+            last_depth = depth
+            indent_str = " " * (indent + 2 * depth)
 
-            for key in sorted(self.alljoyn_objects):
-                o = self.alljoyn_objects[key]
-                o.indent = self.indent + 2
-                return_value = "{0}{1}\n".format(return_value, o)
-                o.indent = 0
+            f = "{0}Obj name: '{1}'\n{0}Full name: '{2}'\n{0}Interfaces:\n"
+            parts.append(f.format(indent_str, o.name, full_name))
 
-        return return_value
+            for i in o.interfaces:
+                parts.append("{0}  {1}\n".format(indent_str, i.interface_full_name))
+
+            if o.alljoyn_objects:
+                parts.append("\n{0}Child objects:\n".format(indent_str))
+
+        parts.append("\n" * last_depth)
+        return "".join(parts)
@@ -0,0 +1,169 @@
+# Copyright AllSeen Alliance. All rights reserved.
+#
+# Permission to use, copy, modify, and/or distribute this software for any
+# purpose with or without fee is hereby granted, provided that the above
+# copyright notice and this permission notice appear in all copies.
+#
+# THE SOFTWARE IS PROVIDED "AS IS" AND THE AUTHOR DISCLAIMS ALL WARRANTIES
+# WITH REGARD TO THIS SOFTWARE INCLUDING ALL IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR
+# ANY SPECIAL, DIRECT, INDIRECT, OR CONSEQUENTIAL DAMAGES OR ANY DAMAGES
+# WHATSOEVER RESULTING FROM LOSS OF USE, DATA OR PROFITS, WHETHER IN AN
+# ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION, ARISING OUT OF
+# OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
+
+def analyze(service):
+    """Return the ServiceSummary of a completely parsed and validated service.
+
+    Every interface and object is visited once. The summary must be made
+    again if the service is changed."""
+    return ServiceSummary(service)
+
+class Summary:
+    """The base class of the summaries. A summary can't be changed once made."""
+
+    def __setattr__(self, name, value):
+        raise AttributeError("A {0} can't be changed.".format(self.__class__.__name__))
+
+class InterfaceSummary(Summary):
+    """The aggregates of one interface. The members are:
+
+    has_properties = bool                # True if there is any property.
+    has_read_properties = bool           # True if any property is readable.
+    has_write_properties = bool          # True if any property is writeable.
+    has_dictionaries = bool              # True if any dictionary is used.
+    number_of_signals = int              # The number of signals.
+    client_needs_persistent_data = bool  # True if runnable client code keeps arguments.
+    service_needs_persistent_data = bool # True if runnable service code keeps arguments."""
+
+    def __init__(self, interface):
+        """Initialize an instance of the InterfaceSummary class."""
+        interface.elaborate()
+        has_read = False
+        has_write = False
+        client_data = False
+        service_data = False
+
+        for p in interface.properties:
+            if p.is_readable():
+                has_read = True
+                service_data = True
+
+            if p.is_writeable():
+                has_write = True
+                client_data = True
+
+        for s in interface.signals:
+            if s.args:
+                # The service must keep the arguments of the signals it emits.
+                service_data = True
+
+        for m in interface.methods:
+            for a in m.args:
+                if a.direction == "in":
+                    client_data = True
+                elif a.direction == "out":
+                    service_data = True
+
+        members = {"has_properties" : len(interface.properties) > 0,
+                   "has_read_properties" : has_read,
+                   "has_write_properties" : has_write,
+                   "has_dictionaries" : len(interface.dictionaries) > 0,
+                   "number_of_signals" : len(interface.signals),
+                   "client_needs_persistent_data" : client_data,
+                   "service_needs_persistent_data" : service_data}
+
+        self.__dict__.update(members)
+        return
+
+    def needs_persistent_data(self, is_client):
+        """Return True if the client or service side keeps argument data."""
+        if is_client:
+            return self.client_needs_persistent_data
+
+        return self.service_needs_persistent_data
+
+class ObjectSummary(Summary):
+    """The aggregates of the interfaces of one object. The members are:
+
+    has_properties = bool      # True if any interface has a property.
+    has_read_properties = bool # True if any interface has a readable property.
+    number_of_signals = int    # The number of signals in all of the interfaces."""
+
+    def __init__(self, aj_object, interface_summaries):
+        """Initialize an instance of the ObjectSummary class.
+
+        interface_summaries are the InterfaceSummary of each interface of the
+        service indexed by the full interface name."""
+        summaries = [interface_summaries[i.interface_full_name]
+                     for i in aj_object.interfaces]
+
+        members = {"has_properties" : any(s.has_properties for s in summaries),
+                   "has_read_properties" : any(s.has_read_properties for s in summaries),
+                   "number_of_signals" : sum(s.number_of_signals for s in summaries)}
+
+        self.__dict__.update(members)
+        return
+
+class ServiceSummary(Summary):
+    """The aggregates of a whole service. The members are:
+
+    interfaces = {}                      # The InterfaceSummary of each full interface name.
+    objects = {}                         # The ObjectSummary of each AllJoynObject.
+    has_properties = bool                # The same as those of InterfaceSummary
+    has_read_properties = bool           # but true if true for any interface.
+    has_write_properties = bool
+    has_dictionaries = bool
+    has_signals = bool                   # True if number_of_signals > 0.
+    number_of_signals = int              # The signals in all instances of all interfaces.
+    client_needs_persistent_data = bool
+    service_needs_persistent_data = bool"""
+
+    def __init__(self, service):
+        """Initialize an instance of the ServiceSummary class."""
+        interfaces = {}
+
+        for key in sorted(service.interfaces):
+            interfaces[key] = InterfaceSummary(service.interfaces[key])
+
+        objects = {}
+        number_of_signals = 0
+
+        for o in service.get_objects():
+            s = ObjectSummary(o, interfaces)
+            objects[o] = s
+            number_of_signals += s.number_of_signals
+
+        summaries = interfaces.values()
+
+        def any_of(name):
+            return any(getattr(s, name) for s in summaries)
+
+        members = {"interfaces" : interfaces,
+                   "objects" : objects,
+                   "has_properties" : any_of("has_properties"),
+                   "has_read_properties" : any_of("has_read_properties"),
+                   "has_write_properties" : any_of("has_write_properties"),
+                   "has_dictionaries" : any_of("has_dictionaries"),
+                   "has_signals" : number_of_signals > 0,
+                   "number_of_signals" : number_of_signals,
+                   "client_needs_persistent_data" : any_of("client_needs_persistent_data"),
+                   "service_needs_persistent_data" : any_of("service_needs_persistent_data")}
+
+        self.__dict__.update(members)
+        return
+
+    def get_interface(self, interface):
+        """Get the InterfaceSummary of this interface of the service."""
+        return self.interfaces[interface.interface_full_name]
+
+    def get_object(self, aj_object):
+        """Get the ObjectSummary of this object of the service."""
+        return self.objects[aj_object]
+
+    def needs_persistent_data(self, is_client):
+        """Return True if the client or service side of any interface keeps argument data."""
+        if is_client:
+            return self.client_needs_persistent_data
+
+        return self.service_needs_persistent_data
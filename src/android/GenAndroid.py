@@ -49,7 +49,19 @@ from .. import interface as iface
 from .. import structdef
 from .. import dictdef
 from .. import memberdef
+from .. import naming
+from .. import typemap
 from .. import common
+from .. import analysis
+
+# The ArgInfo of the inputs and of the outputs of each method, signal and
+# property indexed by the member. They are kept here rather than on the
+# members and are made by __make_interface_arg_info() for each service.
+input_arg_infos = {}
+output_arg_infos = {}
+
+# The Java types made from the signatures of each interface.
+java_types = typemap.get_type_map("android")
 
 def hooks():
     """Return the hooks for the AllJoyn Android language binding."""
@@ -63,6 +75,13 @@ def __generate_code(command_line, codegen_service):
 
     assert(command_line.target_language == "android")
 
+    # The Java member names are made from the object paths.
+    naming.NameIndex(codegen_service, "camel", None)
+
+    input_arg_infos.clear()
+    output_arg_infos.clear()
+    java_types.clear()
+
     __make_directories_copy_resource_files(command_line, codegen_service)
 
     # Make the interface files before the others because __make_interface_arg_info()
@@ -199,9 +218,17 @@ class ArgInfo:
 
         return return_value
 
+def get_input_arg_info(member):
+    """Get the ArgInfo of the inputs of this method, signal or property."""
+    return input_arg_infos[member]
+
+def get_output_arg_info(member):
+    """Get the ArgInfo of the outputs of this method, signal or property."""
+    return output_arg_infos[member]
+
 def get_return_arg(member):
     """Get the return argument/structure for this member."""
-    outputs = member.output_arg_info.args
+    outputs = output_arg_infos[member].args
     # This should be true even if there are multiple outputs.
     # The outputs are all combined into a single struture.
     assert(len(outputs) <= 1)
@@ -284,11 +311,20 @@ def get_base_java_type(interface, signature, member = None):
 def get_java_type(interface, signature, member = None):
     """Get the Java type corresponding to this AllJoyn signature. Or if not found from the signature
     see if it is a return structure which has a signature based upon the member name."""
+    member_name = None
+
+    if member:
+        member_name = member.name
+
+    return java_types.get("java", interface, signature, __make_java_type,
+                          member_name)
+
+def __make_java_type(interface, signature, member_name):
     t = None
     return_struct_key = None
 
-    if member:
-        return_struct_key = member.name + iface.return_suffix
+    if member_name is not None:
+        return_struct_key = member_name + iface.return_suffix
 
     base_signature = memberdef.get_base_signature(signature)
 
@@ -352,45 +388,21 @@ def get_complete_name(object_name, interface_name, component):
 
 def has_persistent_args(service, is_client):
     """Return True if any components have arguments that need to be persistent."""
-    for key in sorted(service.interfaces):
-        i = service.interfaces[key]
+    return service.get_summary().needs_persistent_data(is_client)
 
-        if interface_needs_persistent_data(i, is_client):
-            return True
-
-    return False
-
-def interface_needs_persistent_data(interface, is_client):
+def interface_needs_persistent_data(interface, is_client, service = None):
     """Returns True if this Interface needs persisent data for Runnable code.
 
     The test returns true if any method has arguments which match the direction
     or it has a writable property. Or if direction is "out" then if there are
-    any signals with arguments."""
-
-    # The server must have persistent data for signal arguments.
-    if not is_client:
-        for s in interface.signals:
-            if s.args:
-                return True
-
-    # In the more general case the client needs persistent data for inputs.
-    # The server needs persistent data for outputs.
-    if is_client:
-        direction = "in"
+    any signals with arguments. If service is given the answer is read from its
+    summary."""
+    if service is not None:
+        summary = service.get_summary().get_interface(interface)
     else:
-        direction = "out"
-
-    for m in interface.methods:
-        for a in m.args:
-            if a.direction == direction:
-                return True
-
-    for p in interface.properties:
-        if (p.is_writeable() and direction == "in") or (
-            p.is_readable() and direction == "out"):
-            return True
+        summary = analysis.InterfaceSummary(interface)
 
-    return False
+    return summary.needs_persistent_data(is_client)
 
 def get_well_known_name_path(configuration):
     return __get_well_known_name_path(configuration.command_line)
@@ -411,12 +423,17 @@ def make_members_from_structure(interface, struct):
 def make_dictionary_types(interface, dict):
     """Make the text which is the type of the key and value types of a dictionary.
     Return them as [k, v]."""
-    java_key_type = get_java_type(interface, dict.key.arg_type)
+    types = java_types.get("dict", interface, dict.key.arg_type,
+                           __make_dictionary_types, dict.value.arg_type)
+    return list(types)
+
+def __make_dictionary_types(interface, key_signature, value_signature):
+    java_key_type = get_java_type(interface, key_signature)
 
     if java_key_type in type_primative_to_object_dictionary.keys():
         java_key_type = type_primative_to_object_dictionary[java_key_type]
 
-    java_value_type = get_java_type(interface, dict.value.arg_type)
+    java_value_type = get_java_type(interface, value_signature)
 
     if java_value_type in type_primative_to_object_dictionary.keys():
         java_value_type = type_primative_to_object_dictionary[java_value_type]
@@ -740,19 +757,16 @@ def __make_target_file(template, filename, command_line, codegen_service):
 
 def __make_interface_arg_info(interface):
     """Make the arg info for all methods, signals, and properties."""
-    if interface.has_arg_info == False:
-        for m in interface.methods:
-            m.input_arg_info = ArgInfo(m.args, "in")
-            m.output_arg_info = ArgInfo(m.args, "out", interface, m.name)
-
-        for s in interface.signals:
-            s.input_arg_info = None
-            s.output_arg_info = ArgInfo(s.args, "out")
+    for m in interface.methods:
+        input_arg_infos[m] = ArgInfo(m.args, "in")
+        output_arg_infos[m] = ArgInfo(m.args, "out", interface, m.name)
 
-        for p in interface.properties:
-            p.input_arg_info = ArgInfo(p.args, "in")
-            p.output_arg_info = ArgInfo(p.args, "out", interface, p.name)
+    for s in interface.signals:
+        input_arg_infos[s] = None
+        output_arg_infos[s] = ArgInfo(s.args, "out")
 
-        interface.has_arg_info = True
+    for p in interface.properties:
+        input_arg_infos[p] = ArgInfo(p.args, "in")
+        output_arg_infos[p] = ArgInfo(p.args, "out", interface, p.name)
 
     return
@@ -19,6 +19,9 @@ import memberdef
 
 class ArgDef(memberdef.MemberDef):
     """Contains the description of a argument."""
+
+    # is_secure and no_reply are only set by annotations of the <arg>.
+    __slots__ = ("direction", "variant_type", "is_secure", "no_reply")
     def __init__(self, xml = None, name = None, arg_type = None,
                  direction = None, variant_type = None):
         """Initialize an instance of the ArgDef class."""
@@ -37,12 +40,23 @@ class ArgDef(memberdef.MemberDef):
         assert(xml is not None)
         assert(xml.tag == "arg")
 
-        self.arg_type = xml.get("type")
+        self.start_parse(xml)
         common.get_annotations(xml, self)
+        self.finish_parse(xml, lax_naming, parent_type, parent, arg_num)
+
+        return
 
+    def start_parse(self, xml):
+        """Prepare to parse the <arg> xml of this argument.
+
+        Only the attributes of the xml are used."""
+        self.arg_type = xml.get("type")
         self.direction = xml.get("direction")
         self.name = xml.get("name")
+        return
 
+    def finish_parse(self, xml, lax_naming, parent_type, parent, arg_num):
+        """Complete the parse of this argument once its annotations are known."""
         if (self.name is None or len(self.name) == 0) and lax_naming:
             name_type = memberdef.make_clean_name(self.arg_type)
             self.name = "{0}{1}Arg{2}_{3}".format(parent.name,
@@ -70,6 +84,10 @@ class ArgDef(memberdef.MemberDef):
 
         return return_value
 
+    def get_fingerprint(self):
+        """Get a string of everything compared by __eq__."""
+        return repr((self.name, self.arg_type, self.direction))
+
     def __eq__(self, other):
         """Compares this method to another and returns true if equal."""
         if (self is None and other is not None or
@@ -0,0 +1,185 @@
+# Copyright AllSeen Alliance. All rights reserved.
+#
+# Permission to use, copy, modify, and/or distribute this software for any
+# purpose with or without fee is hereby granted, provided that the above
+# copyright notice and this permission notice appear in all copies.
+#
+# THE SOFTWARE IS PROVIDED "AS IS" AND THE AUTHOR DISCLAIMS ALL WARRANTIES
+# WITH REGARD TO THIS SOFTWARE INCLUDING ALL IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR
+# ANY SPECIAL, DIRECT, INDIRECT, OR CONSEQUENTIAL DAMAGES OR ANY DAMAGES
+# WHATSOEVER RESULTING FROM LOSS OF USE, DATA OR PROFITS, WHETHER IN AN
+# ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION, ARISING OUT OF
+# OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
+
+import os
+import sys
+import mmap
+import struct
+
+import config
+import modelcodec
+
+class CatalogueException(Exception):
+    """Catalogue exceptions."""
+
+# The first bytes of every catalogue file.
+magic = "AJCATLG\x06"
+
+# After the magic: the entry count, the offsets of the index and the names
+# and the length of the version and target which follow the header.
+header_format = "<IIII"
+
+# Each index entry is the offset and length of the name, relative to the
+# start of the names, and the offset and length of the interface encoded by
+# modelcodec.encode_interfaces().
+# The entries are sorted by name.
+index_format = "<IIII"
+
+def write(filename, interfaces, target):
+    """Write a catalogue of the interfaces for the target language.
+
+    The interfaces must be completely parsed and validated. Each is encoded
+    by itself with modelcodec so it refers to nothing outside of its entry.
+    Their parents are not stored."""
+    names = ""
+    index = []
+    data = []
+    data_offset = len(magic) + struct.calcsize(header_format)
+
+    meta = "\0".join([config.get_version(), target])
+    data_offset += len(meta)
+
+    for i in sorted(interfaces, key = lambda i: i.interface_full_name):
+        entry = modelcodec.encode_interfaces([i])
+
+        name = i.interface_full_name
+        index.append(struct.pack(index_format, len(names), len(name),
+                                 data_offset, len(entry)))
+        names += name
+        data.append(entry)
+        data_offset += len(entry)
+
+    index_offset = data_offset
+    names_offset = index_offset + len(index) * struct.calcsize(index_format)
+
+    with open(filename, "wb") as f:
+        f.write(magic)
+        f.write(struct.pack(header_format, len(index), index_offset,
+                            names_offset, len(meta)))
+        f.write(meta)
+        f.write("".join(data))
+        f.write("".join(index))
+        f.write(names)
+
+    return
+
+class Catalogue:
+    """A catalogue of parsed and validated interfaces written by write().
+
+    The file is memory mapped when the first interface is looked up. The
+    index is searched in place and only the interfaces looked up are
+    decoded. When pickled only the filename is kept so the catalogue may be
+    given to worker processes and stored with a cached service."""
+
+    def __init__(self, filename, target):
+        """Initialize an instance of the Catalogue class.
+
+        target is the target language the interfaces are needed for. It must
+        be the one the catalogue was written for."""
+        self.filename = filename
+        self.target = target
+        self.map = None
+        self.count = 0
+        self.index_offset = 0
+        self.names_offset = 0
+        return
+
+    def get_interface(self, name):
+        """Get a new copy of the interface with this name or None."""
+        if self.map is None:
+            self.__open()
+
+        index_size = struct.calcsize(index_format)
+        low = 0
+        high = self.count
+
+        while low < high:
+            middle = (low + high) // 2
+            offset = self.index_offset + middle * index_size
+            entry = struct.unpack_from(index_format, self.map, offset)
+            start = self.names_offset + entry[0]
+            entry_name = self.map[start:start + entry[1]]
+
+            if entry_name < name:
+                low = middle + 1
+            elif entry_name > name:
+                high = middle
+            else:
+                data = self.map[entry[2]:entry[2] + entry[3]]
+                return self.__decode_interface(data, name)
+
+        return None
+
+    def close(self):
+        """Release the memory map. It is remapped if it is needed again."""
+        if self.map is not None:
+            self.map.close()
+            self.map = None
+
+        return
+
+    def __open(self):
+        header_end = len(magic) + struct.calcsize(header_format)
+
+        try:
+            with open(self.filename, "rb") as f:
+                size = os.fstat(f.fileno()).st_size
+
+                if size < header_end:
+                    self.__raise_exception("It is not a catalogue.")
+
+                self.map = mmap.mmap(f.fileno(), 0, access = mmap.ACCESS_READ)
+        except (IOError, OSError, mmap.error):
+            self.__raise_exception(str(sys.exc_info()[1]))
+
+        if self.map[:len(magic)] != magic:
+            self.close()
+            self.__raise_exception("It is not a catalogue.")
+
+        header = struct.unpack_from(header_format, self.map, len(magic))
+        self.count, self.index_offset, self.names_offset, meta_length = header
+        meta = self.map[header_end:header_end + meta_length]
+        expected = "\0".join([config.get_version(), self.target])
+
+        if meta != expected:
+            self.close()
+            f = "It was not written by version {0} for the target '{1}'."
+            self.__raise_exception(f.format(config.get_version(), self.target))
+
+        return
+
+    def __decode_interface(self, data, name):
+        try:
+            return_value = modelcodec.ModelReader(data).get_interface(name)
+        except modelcodec.CodecException:
+            self.__raise_exception(str(sys.exc_info()[1]))
+
+        if return_value is None:
+            self.__raise_exception("The entry of '{0}' is damaged.".format(name))
+
+        # The copy may be added to, and frozen with, another service.
+        return_value.from_catalogue = True
+        return_value.frozen = False
+        return return_value
+
+    def __raise_exception(self, reason):
+        f = "Unable to use the catalogue '{0}'. {1}"
+        raise CatalogueException(f.format(self.filename, reason))
+
+    def __getstate__(self):
+        return {"filename" : self.filename, "target" : self.target}
+
+    def __setstate__(self, state):
+        self.__init__(state["filename"], state["target"])
+        return
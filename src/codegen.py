@@ -18,6 +18,12 @@ import config
 import validate
 import service
 import common
+import modelcache
+import parsefilter
+import catalogue
+import memberdef
+import naming
+import typemap
 import CheetahCompileExcept as cce
 
 try:
@@ -41,17 +47,47 @@ def main():
         register_targets(configuration)
         configuration.parse()
         report_config(configuration)
-        parser = parseajxml.ParseAjXml(configuration.command_line.xml_input_file)
-        service = parser.parse(configuration.command_line)
-
-        target = configuration.command_line.target_language
-
-        validate.alljoyn_data(service, target)
+        command_line = configuration.command_line
+        target = command_line.target_language
+
+        cache = None
+        cache_key = None
+        service = None
+
+        if not command_line.no_model_cache:
+            cache = modelcache.ModelCache(command_line.model_cache_dir)
+            filenames = parseajxml.get_input_files(command_line.xml_input_files)
+            filenames.extend(command_line.catalogues or [])
+            cache_key = cache.get_key(command_line, filenames)
+            service = cache.load(cache_key)
+
+        if service is not None:
+            print("Using the cached model of the input XML.")
+        else:
+            parser = parseajxml.ParseAjXml(command_line.xml_input_files,
+                                           command_line.parser,
+                                           command_line.jobs)
+            service = parser.parse(command_line)
+
+            validate.alljoyn_data(service, target)
+            service.analyze()
+            service.freeze()
+
+            if cache is not None:
+                cache.store(cache_key, service)
 
         if configuration.command_line.xml:
             print(service)
 
-        configuration.target_hook('generate_code')(configuration.command_line, service)
+        if command_line.write_catalogue is not None:
+            filename = command_line.write_catalogue
+            catalogue.write(filename, service.interfaces.values(), target)
+            print("Catalogue written to '{0}'.".format(filename))
+        else:
+            configuration.target_hook('generate_code')(configuration.command_line, service)
+
+        if configuration.command_line.xml:
+            report_caches()
 
     except config.ConfigException as e:
         print(error_format.format(e.message))
@@ -65,6 +101,10 @@ def main():
         print(error_format.format(e.message))
         sys.exit(1)
 
+    except catalogue.CatalogueException as e:
+        print(error_format.format(e.message))
+        sys.exit(1)
+
     print("Done.")
     return
 
@@ -80,6 +120,12 @@ def report_config(c):
     if c.command_line.lax_naming:
         print("Lax naming enabled.")
 
+    if parsefilter.make_filter(c.command_line) is not None:
+        print("Objects and interfaces are filtered.")
+
+    if c.command_line.parser != "tree":
+        print("Xml parser is '{0}'.".format(c.command_line.parser))
+
     if c.command_line.output_path is not None:
         path = c.command_line.output_path
         print("Output path is '{0}'.".format(path))
@@ -96,6 +142,28 @@ def report_config(c):
 
     return
 
+def report_caches():
+    """Print how often the cached results were used."""
+    f = "Flattened signatures: {0} cached, {1} made ({2:.1%} cached)."
+    print(f.format(memberdef.flattened_hits,
+                   memberdef.flattened_misses,
+                   memberdef.get_flattened_hit_rate()))
+    f = "Identifiers: {0} cached, {1} made ({2:.1%} cached)."
+    print(f.format(naming.identifier_hits,
+                   naming.identifier_misses,
+                   naming.get_hit_rate()))
+
+    for target in sorted(typemap.type_maps):
+        m = typemap.type_maps[target]
+
+        if m.hits == 0 and m.misses == 0:
+            continue
+
+        f = "Types for '{0}': {1} cached, {2} made ({3:.1%} cached)."
+        print(f.format(target, m.hits, m.misses, m.get_hit_rate()))
+
+    return
+
 def register_targets(c):
     """Register the target languages supported with the configuration 'c'."""
     c.register_target('tl', tl.GenTL.hooks())
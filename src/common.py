@@ -12,62 +12,90 @@
 # ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION, ARISING OUT OF
 # OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
 
-import string
 from xml.etree import ElementTree
 
 import validate
+import naming
 
 target_language = None
 
+# The unknown annotations found while parsing. The key is the annotation name
+# and the value is [count, location of the first one found]. The location is
+# (filename, line, column) or None if the parser doesn't record it.
+ignored_annotations = {}
+
 def get_annotations(xml, aj_object):
     """Get the annotation value for the AllJoyn object from this xml."""
     annotations = xml.iterfind("annotation")
 
     for a in annotations:
-        name = a.get("name")
-
-        if name == "org.alljoyn.Bus.Item.IsSecure":
-            value = __get_true_false_value(xml, a, name)
-            aj_object.is_secure = value
-        elif name == "org.freedesktop.DBus.Method.NoReply":
-            value = __get_true_false_value(xml, a, name)
-            aj_object.no_reply = value
-        elif name == "org.alljoyn.Bus.Arg.VariantTypes":
-            value = a.get("value")
-            if value is None:
-                __report_missing_value(xml, name)
-            validate.data_signature(value)
-            aj_object.variant_type = value
-        elif name == "org.freedesktop.DBus.Property.EmitsChangedSignal":
-            value = a.get("value")
-            if value is None:
-                __report_missing_value(xml, name)
-            aj_object.set_emits_changed_signal(value)
-        else:
-            f = "\nIgnoring interface annotation '{0}'."
-            mess = f.format(name)
-            mess = validate.get_xml_error(xml, mess)
-            print(mess)
+        apply_annotation(xml, a, aj_object)
 
     return
 
-def make_camel_case(object_name, separator = "/"):
-    """Make an object name into a camel case string and delete the separator.
+def apply_annotation(xml, a, aj_object):
+    """Apply the annotation xml a, a child of xml, to the AllJoyn object.
 
-    If the separator is None this method just makes the first character lower
-    case."""
+    The annotation is applied by its handler in annotation_handlers. Unknown
+    annotations are counted in ignored_annotations and reported by
+    report_ignored_annotations()."""
+    name = a.get("name")
+    handler = annotation_handlers.get(name)
 
-    if separator:
-        caps_value = string.capwords(object_name, separator)
-        temp = caps_value.replace(separator, "")
+    if handler is not None:
+        handler(xml, a, aj_object, name)
+    elif name in ignored_annotations:
+        ignored_annotations[name][0] += 1
     else:
-        temp = object_name
+        ignored_annotations[name] = [1, getattr(a, "location", None)]
+
+    return
 
-    first_char_string = temp[0:1]
-    return_value = first_char_string.lower() + temp[1:]
+def take_ignored_annotations():
+    """Return the ignored annotations found so far and forget them.
 
+    This is used by the worker processes which parse several files so that
+    the annotations of all the files are reported together."""
+    return_value = dict(ignored_annotations)
+    ignored_annotations.clear()
     return return_value
 
+def add_ignored_annotations(ignored):
+    """Add the ignored annotations returned by take_ignored_annotations()."""
+    for name, (count, location) in ignored.items():
+        if name in ignored_annotations:
+            ignored_annotations[name][0] += count
+        else:
+            ignored_annotations[name] = [count, location]
+
+    return
+
+def report_ignored_annotations():
+    """Print a single warning for all the ignored annotations and forget them."""
+    if ignored_annotations and validate.report_warnings:
+        lines = ["\nWarning! Ignoring unknown annotations:"]
+
+        for name in sorted(ignored_annotations):
+            count, location = ignored_annotations[name]
+
+            if location is not None:
+                f = "  '{0}' {1} time(s), first at {2}:{3}:{4}."
+                lines.append(f.format(name, count, *location))
+            else:
+                lines.append("  '{0}' {1} time(s).".format(name, count))
+
+        print("\n".join(lines))
+
+    ignored_annotations.clear()
+    return
+
+def make_camel_case(object_name, separator = "/"):
+    """Make an object name into a camel case string and delete the separator.
+
+    If the separator is None this method just makes the first character lower
+    case. Each name is only made into camel case once. See naming."""
+    return naming.camel_case(object_name, separator)
+
 def get_arg_signature(component, direction):
     """Get the signature used to marshal the arguments when making a call."""
     return_value = ""
@@ -78,6 +106,38 @@ def get_arg_signature(component, direction):
 
     return return_value
 
+def __set_is_secure(xml, a, aj_object, name):
+    aj_object.is_secure = __get_true_false_value(xml, a, name)
+    return
+
+def __set_no_reply(xml, a, aj_object, name):
+    aj_object.no_reply = __get_true_false_value(xml, a, name)
+    return
+
+def __set_variant_type(xml, a, aj_object, name):
+    value = a.get("value")
+    if value is None:
+        __report_missing_value(xml, name)
+    validate.data_signature(value)
+    aj_object.variant_type = value
+    return
+
+def __set_emits_changed_signal(xml, a, aj_object, name):
+    value = a.get("value")
+    if value is None:
+        __report_missing_value(xml, name)
+    aj_object.set_emits_changed_signal(value)
+    return
+
+# The function which applies each known annotation to an AllJoyn object.
+# Each is called with (xml, annotation xml, AllJoyn object, annotation name).
+annotation_handlers = {
+    "org.alljoyn.Bus.Item.IsSecure" : __set_is_secure,
+    "org.freedesktop.DBus.Method.NoReply" : __set_no_reply,
+    "org.alljoyn.Bus.Arg.VariantTypes" : __set_variant_type,
+    "org.freedesktop.DBus.Property.EmitsChangedSignal" : __set_emits_changed_signal,
+    }
+
 def __get_true_false_value(xml, annotation, name):
     """Get a true or false value from the annotation xml.
 
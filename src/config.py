@@ -16,6 +16,8 @@ import argparse
 import os
 import validate
 import common
+import parseajxml
+import xmlinput
 
 class ConfigException(Exception):
     """Configuration exceptions"""
@@ -30,15 +32,27 @@ class Config:
     The configuration values are accessable via the member 'command_line'.
     command_line has the following members and types:
 
+        xml_input_files (list of strings)
         xml_input_file (string)
         absolute_path_xml_input_file (string)
+        jobs (None or int)
         object_path (None or string)
+        catalogues (None or list of strings)
         client_only (None or True)
+        exclude_interfaces (None or list of strings)
+        exclude_objects (None or list of strings)
+        include_interfaces (None or list of strings)
+        include_objects (None or list of strings)
         lax_naming (None or True)
+        model_cache_dir (None or string)
+        no_model_cache (None or True)
+        no_warnings (None or True)
         output_path (string)
+        parser (string)
         runnable (None or True)
         target_language (string)
         well_known_name (None or string)
+        write_catalogue (None or string)
     """
     def __init__(self):
         """Initialize an instance of the Config class."""
@@ -61,8 +75,13 @@ class Config:
         parser = argparse.ArgumentParser(description=descrip)
 
         help_text = """The file containing the xml definition of an object's
-            interface(s)."""
-        parser.add_argument("xml_input_file", help=help_text)
+            interface(s). Several files, directories (searched for '*.xml'
+            files) or glob patterns may be given. Their contents are merged
+            into a single set of objects and interfaces. Files compressed with
+            gzip, bzip2 or xz are accepted. Use '-' to read the standard
+            input."""
+        parser.add_argument("xml_input_files", metavar="xml_input_file",
+                            nargs="+", help=help_text)
 
         help_text = """The object path (including name) of the object being
             defined in the xml input file. If the xml file contains the object
@@ -71,17 +90,73 @@ class Config:
             this flag, this tool will also exit with an error."""
         parser.add_argument("-b", "--object-path", help=help_text)
 
+        help_text = """The xml parser used to read the input. 'tree' reads the
+            complete xml file before it is processed. 'stream' processes each
+            interface and node as soon as it is read which uses much less memory
+            on very large files. 'sax' builds the AllJoyn data directly from the
+            parser events without any xml tree which is the fastest. The
+            default is 'tree'."""
+        parser.add_argument("--parser", choices=parseajxml.parsers,
+                            default="tree", help=help_text)
+
+        help_text = """A catalogue of interfaces written with
+            --write-catalogue. An <interface> in the xml with a name and no
+            children is read from the catalogue instead. May be given several
+            times. The catalogues are searched in order."""
+        parser.add_argument("--catalogue", dest="catalogues", metavar="FILE",
+                            action="append", help=help_text)
+
         help_text = """Only generate the client side code; if not specified,
             both the client and service code are generated."""
         parser.add_argument("-c", "--client-only", help=help_text,
                             action="store_true")
 
+        help_text = """Only keep the objects whose object path matches this
+            glob pattern. A '*' also matches '/'. May be given several times.
+            Objects which can't contain a match are not parsed."""
+        parser.add_argument("--include-object", dest="include_objects",
+                            metavar="PATTERN", action="append", help=help_text)
+
+        help_text = """Skip the objects whose object path matches this glob
+            pattern and all of their child objects. May be given several
+            times."""
+        parser.add_argument("--exclude-object", dest="exclude_objects",
+                            metavar="PATTERN", action="append", help=help_text)
+
+        help_text = """Only keep the interfaces whose name matches this glob
+            pattern. May be given several times."""
+        parser.add_argument("--include-interface", dest="include_interfaces",
+                            metavar="PATTERN", action="append", help=help_text)
+
+        help_text = """Skip the interfaces whose name matches this glob
+            pattern. May be given several times."""
+        parser.add_argument("--exclude-interface", dest="exclude_interfaces",
+                            metavar="PATTERN", action="append", help=help_text)
+
+        help_text = """The maximum number of worker processes used to parse
+            several xml input files. The default is the number of CPUs."""
+        parser.add_argument("-j", "--jobs", type=int, help=help_text)
+
         help_text = """Relaxes the requirement that all method and signal
             arguments be named. If specified, default names will be generated
             for arguments."""
         parser.add_argument("-l", "--lax-naming", help=help_text,
                             action="store_true")
 
+        help_text = """The directory of the cache of parsed and validated
+            xml input. If not specified, '~/.ajcodegen/model_cache' is used."""
+        parser.add_argument("--model-cache-dir", help=help_text)
+
+        help_text = """Always parse and validate the xml input; do not use or
+            update the cache of previously parsed input."""
+        parser.add_argument("--no-model-cache", help=help_text,
+                            action="store_true")
+
+        help_text = """Don't print warnings about the xml input. Errors are
+            still reported."""
+        parser.add_argument("-q", "--no-warnings", help=help_text,
+                            action="store_true")
+
         help_text = """The path where the generated C++ files will be placed.
             If not specified, they will be output in the current working
             directory."""
@@ -107,6 +182,12 @@ class Config:
             requesting a bus name or advertising a name."""
         parser.add_argument("-w", "--well-known-name", help=help_text)
 
+        help_text = """Write all the interfaces in the xml to this catalogue
+            file for use with --catalogue instead of generating code. The
+            catalogue can only be used with the same target language."""
+        parser.add_argument("--write-catalogue", metavar="FILE",
+                            help=help_text)
+
         help_text = """Output verbose information about the XML during
              parsing."""
         parser.add_argument("-x", "--xml", help=help_text, action="store_true")
@@ -119,12 +200,22 @@ class Config:
     def __get_addtions(self):
         """The target language is sometimes needed in modules that don't have easy
         access to the command line. So this is added to the common module.
+        The input xml files are added to the command line as "xml_input_file"
+        separated by ", " for use in the generated comments.
         The absolute path of the input xml file is added to the command line as
         "absolute_path_xml_input_file". The path separators are forced to be '/'
         so that Eclipse doesn't claim (even in a COMMENT!) the string has invalid
-        unicode escape sequences."""
+        unicode escape sequences.
+        Warnings are turned off in the validate module if --no-warnings is
+        given."""
         common.target_language = self.command_line.target_language
-        temp = os.path.abspath(self.command_line.xml_input_file)
+        validate.report_warnings = not self.command_line.no_warnings
+        files = self.command_line.xml_input_files
+        names = [xmlinput.get_display_name(f) for f in files]
+        self.command_line.xml_input_file = ", ".join(names)
+        paths = [os.path.abspath(f) if f != xmlinput.stdin_name else n
+                 for f, n in zip(files, names)]
+        temp = ", ".join(paths)
         self.command_line.absolute_path_xml_input_file = temp.replace("\\", "/")
 
     def target_hook(self, name):
@@ -141,6 +232,9 @@ class Config:
         if self.command_line.well_known_name is not None:
             validate.well_known_name(self.command_line.well_known_name)
 
+        if self.command_line.jobs is not None and self.command_line.jobs < 1:
+            raise ConfigException("The number of jobs must be at least 1.")
+
         if self.command_line.output_path is None:
             self.command_line.output_path = "."
 
@@ -13,10 +13,13 @@
 # OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
 
 import memberdef
+import signatures
 
-class Container:
+class Container(object):
     """Describes AllJoyn structure and dictionary containers not arrays."""
 
+    __slots__ = ("signature", "name")
+
     def __init__(self, signature, name = None):
         """Initialize an instance of the Container class.
 
@@ -36,6 +39,20 @@ called, and passed, for this signature."""
         # Equal length signatures may be declared in any order.
         return len(self.signature)
 
+    def extract_containers(self, structures, dictionaries):
+        """If not found in structures or dictionaries put each subcontainer in it.
+
+It is assumed that the signature has been validated such that the brackets
+match and each '{' is preceeded by 'a'.
+
+Both are dictionaries. The key is the signature and the value is a Container
+with no name. The subcontainers of each signature are found once by the
+signatures module and shared by every interface which uses it."""
+        s = signatures.get(self.signature)
+        self.__add_containers(s.structures, structures)
+        self.__add_containers(s.dictionaries, dictionaries)
+        return
+
     def extract_dictionaries(self, destination_list):
         """If not found in the destination_list put each dictionary in it.
 
@@ -44,7 +61,8 @@ match and each '{' is preceeded by 'a'.
 
 The destination_list is a dictionary. The key is the signature and the value
 is a Container with no name."""
-        self.__extract_containers(destination_list, '{', '}')
+        s = signatures.get(self.signature)
+        self.__add_containers(s.dictionaries, destination_list)
         return
 
     def extract_structures(self, destination_list):
@@ -52,7 +70,8 @@ is a Container with no name."""
 
 The destination_list is a dictionary. The key is the signature and the value
 is a Container with no name."""
-        self.__extract_containers(destination_list, '(', ')')
+        s = signatures.get(self.signature)
+        self.__add_containers(s.structures, destination_list)
         return
 
     def set_name(self, name):
@@ -65,34 +84,9 @@ is a Container with no name."""
 
         return
 
-    def __extract_containers(self, destination_list, start, end):
-        """If not found in the destination_list put each subcontainer in it.
-
-The destination_list is a dictionary. The key is the signature and the value
-is a Container with no name.
-'start' is the character that represents the start of a container.
-'end' is the character that represents the end of a container."""
-        stack = []
-
-        index = 0
-        max_index = len(self.signature)
-
-        while index < max_index:
-            c = self.signature[index]
-
-            if c == start:
-                stack.append(index)
-            elif c == end:
-                start_index = stack[-1]
-                result = self.signature[start_index : index + 1]
-
-                if result not in destination_list:
-                    c = Container(result)
-                    destination_list[result] = c
-
-                stack.pop()
-
-            index += 1
+    def __add_containers(self, containers, destination_list):
+        for c in containers:
+            if c not in destination_list:
+                destination_list[c] = Container(c)
 
         return
-
@@ -12,38 +12,66 @@
 # ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION, ARISING OUT OF
 # OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
 
+import hashlib
 import common
 import validate
 import memberdef
 
-class DictDef:
+class DictDef(object):
     """Contains the description of a declared dictionary"""
 
+    __slots__ = ("name", "key", "value", "__fingerprint", "__flattened")
+
     def __init__(self):
         """Initialize an instance of the DictDef class"""
         self.name = ""
         self.key = None
         self.value = None
+        self.__fingerprint = None
+        # (memberdef.type_generation, flattened signature)
+        self.__flattened = None
 
         return
 
     def parse(self, xml, lax_naming):
         """Parse the given dict xml element"""
         #print("Parsing Dict '{0}'".format(xml.get('name')))
-        self.name = xml.get('name')
-        validate.type_name(self.name)
+        self.start_parse(xml)
+
         for keynode in xml.findall('key'):
-            if self.key is not None:
-                validate.raise_exception(keynode, "Duplicate key definition not allowed.")
-            validate.data_signature(keynode.get('type'), keynode)
-            self.set_key_signature(keynode.get('type'), keynode)
+            self.parse_key(keynode)
 
         for valuenode in xml.findall('value'):
-            if self.value is not None:
-                validate.raise_exception(valuenode, "Duplicate value definition not allowed.")
-            validate.data_signature(valuenode.get('type'), valuenode)
-            self.set_value_signature(valuenode.get('type'), valuenode)
+            self.parse_value(valuenode)
+
+        self.finish_parse(xml)
+        return
+
+    def start_parse(self, xml):
+        """Prepare to parse the dict xml. Only its attributes are used."""
+        self.__fingerprint = None
+        self.name = xml.get('name')
+        validate.type_name(self.name)
+        return
+
+    def parse_key(self, xml):
+        """Parse the key xml element of this dict."""
+        if self.key is not None:
+            validate.raise_exception(xml, "Duplicate key definition not allowed.")
+        validate.data_signature(xml.get('type'), xml)
+        self.set_key_signature(xml.get('type'), xml)
+        return
 
+    def parse_value(self, xml):
+        """Parse the value xml element of this dict."""
+        if self.value is not None:
+            validate.raise_exception(xml, "Duplicate value definition not allowed.")
+        validate.data_signature(xml.get('type'), xml)
+        self.set_value_signature(xml.get('type'), xml)
+        return
+
+    def finish_parse(self, xml):
+        """Check that both the key and the value have been parsed."""
         if self.key is None:
             validate.raise_exception(xml,
                     "Dict {0} does not have a key definition.".format(self.name))
@@ -58,16 +86,33 @@ class DictDef:
             validate.raise_exception(xml,
                 "Dict {0} must have a basic type as key, not '{1}'.".format(self.name, sig))
         self.key = memberdef.MemberDef("key", sig)
+        self.__fingerprint = None
+        memberdef.types_changed()
         return
 
     def set_value_signature(self, sig, xml = None):
         self.value = memberdef.MemberDef("value", sig)
+        self.__fingerprint = None
+        memberdef.types_changed()
 
     def get_flattened_signature(self):
+        """Return the signature with all [NamedTypes] expanded.
+
+        The result is cached until a named type changes."""
+        cached = self.__flattened
+
+        if cached is not None and cached[0] == memberdef.type_generation:
+            memberdef.flattened_hits += 1
+            return cached[1]
+
+        memberdef.flattened_misses += 1
+
         sig = "a{"
         sig += self.key.get_flattened_signature()
         sig += self.value.get_flattened_signature()
         sig += "}"
+
+        self.__flattened = (memberdef.type_generation, sig)
         return sig
 
     def get_order(self):
@@ -80,6 +125,22 @@ class DictDef:
         f = "      Name: {0}\n        Key: '{1}'\n        Value: '{2}'\n"
         return f.format(self.name, self.key.arg_type, self.value.arg_type)
 
+    def get_fingerprint(self):
+        """Get a hash of everything compared by __eq__.
+
+        Equal dicts have equal fingerprints. It is computed when first needed
+        and is reset when the dict is changed by its parse methods."""
+        if self.__fingerprint is None:
+            h = hashlib.sha1(repr(self.name))
+
+            for m in (self.key, self.value):
+                if m is not None:
+                    h.update(m.get_fingerprint())
+
+            self.__fingerprint = h.digest()
+
+        return self.__fingerprint
+
     def __eq__(self, other):
         """Compares this dictionary definition to another and returns true if equal."""
         if not isinstance(other, DictDef):
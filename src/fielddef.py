@@ -19,6 +19,8 @@ import memberdef
 class FieldDef(memberdef.MemberDef):
     """Contains the description of a structure field"""
 
+    __slots__ = ()
+
     def __init__(self, name = None, arg_type = None):
         """Initialize an instance of the FieldDef class"""
         memberdef.MemberDef.__init__(self, name, arg_type)
@@ -12,17 +12,20 @@
 # ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION, ARISING OUT OF
 # OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
 
+import hashlib
 import signaldef
 import methoddef
 import argdef
 import memberdef
 import propertydef
+import namedlist
 import structdef
 import fielddef
 import dictdef
 import common
 import validate
 import container
+import naming
 
 return_suffix = "_return_value"
 
@@ -35,53 +38,52 @@ class Interface:
         self.interface_full_name = ""
         self.is_secure = False
         self.is_derived = False
-        self.methods = []
-        self.signals = []
-        self.properties = []
+        # These keep the order of declaration and may be searched by name.
+        self.methods = namedlist.NamedList()
+        self.signals = namedlist.NamedList()
+        self.properties = namedlist.NamedList()
         self.parents = []
         self.structures = {}
         self.dictionaries = {}
-        self.has_arg_info = False
-        self.declared_names = []
+        self.declared_names = set()
         self.declared_structs = {}
         self.declared_dicts = {}
+        # True if this was read from a catalogue and so is already validated.
+        self.from_catalogue = False
+        # True once the service is frozen. See Service.freeze().
+        self.frozen = False
+        # True once the containers and named types are made. See elaborate().
+        self.elaborated = False
+        self.__elaborating = False
+        self.__fingerprint = None
 
         return
 
     def parse(self, xml, lax_naming):
         """Parse the given interface xml element."""
         #print("Parsing Interface '{0}'".format(xml.get('name')))
-        name = xml.get("name")
-        self.set_name(name, xml)
+        self.start_parse(xml)
 
         # Make a list of all the objects at this level.
         xml_root_objects = list(xml)
 
-        child_count = 0
-
         for o in xml_root_objects:
             if o.tag == "signal":
-                child_count += 1
-
                 s = signaldef.SignalDef()
                 s.parse(o, lax_naming)
                 self.add_signal(o, s)
             elif o.tag == "method":
-                child_count += 1
-
                 new_method = methoddef.MethodDef()
                 new_method.parse(o, lax_naming)
                 self.add_method(o, new_method)
             elif o.tag == "property":
-                child_count += 1
-
                 new_property = propertydef.PropertyDef()
                 new_property.parse(o)
                 self.add_property(o, new_property)
             elif o.tag == "annotation":
                 # Don't count this as a child for purposes of defining the
                 # interface.
-                common.get_annotations(xml, self)
+                common.apply_annotation(xml, o, self)
             elif o.tag == "struct":
                 # Don't count this as a valid child.
                 new_struct = structdef.StructDef()
@@ -94,22 +96,64 @@ class Interface:
                 self.add_declared_dict(o, new_dict)
             else:
                 # Don't count this as a valid child.
-                warn_format = "\nWarning! Ignoring interface xml object '{0}'."
-                mess = warn_format.format(o.tag)
-                mess = validate.get_xml_error(xml, mess)
-                print(mess)
+                self.ignore_xml(o)
+
+        self.finish_parse(xml)
+        return
 
-        if child_count <= 0:
-            mess = "Incompletely specified interface '{0}'.".format(name)
+    def start_parse(self, xml):
+        """Prepare to parse the <interface> xml of this interface.
+
+        Only the attributes of the xml are used so this may be called as soon
+        as the start tag has been read."""
+        name = xml.get("name")
+        self.set_name(name, xml)
+        return
+
+    def ignore_xml(self, xml):
+        """Report an unexpected child of <interface> which is being ignored."""
+        warn_format = "\nWarning! Ignoring interface xml object '{0}'."
+        validate.warning(xml, warn_format, xml.tag)
+        return
+
+    def finish_parse(self, xml):
+        """Complete the parse of this interface once all its children are added.
+
+        Signals, methods and properties are the only children which define an
+        interface. At least one of them is required."""
+        if not self.signals and not self.methods and not self.properties:
+            mess = "Incompletely specified interface '{0}'.".format(xml.get("name"))
             mess = validate.get_xml_error(xml, mess)
             raise validate.ValidateException(mess)
 
-        self.__add_structs_dictionaries_arrays()
-        self.__declare_undeclared_types()
-        self.__add_interface_to_all_members()
+        return
+
+    def elaborate(self):
+        """Make the containers and named types of this parsed interface.
+
+        The structures and dictionaries used by the arguments are found and
+        named, a named type is declared for each of them, every argument is
+        linked to this interface and the named types are checked. This is done
+        once, when first needed, rather than when the interface is parsed so
+        an interface which is only listed or counted is never elaborated.
+        validate.alljoyn_data() elaborates every interface of the service."""
+        # Resolving the named types while elaborating comes back here.
+        if self.elaborated or self.__elaborating:
+            return
 
-        validate.interface_completeness(self)
+        self.__elaborating = True
 
+        try:
+            self.__add_structs_dictionaries_arrays()
+            self.__declare_undeclared_types()
+            self.__add_interface_to_all_members()
+
+            validate.interface_completeness(self)
+        finally:
+            self.__elaborating = False
+
+        # Only set once all of the work has succeeded.
+        self.elaborated = True
         return
 
     def set_name(self, name, xml = None):
@@ -123,7 +167,9 @@ class Interface:
 
         name: The full name of the interface the interfaceName is derived from
         this."""
+        self.__check_not_frozen()
         validate.interface_name(name, xml)
+        self.__fingerprint = None
         self.interface_full_name = name
         s = name.split(".")
         self.interface_name = s[-1]
@@ -136,9 +182,9 @@ Example: "/com/example/Demo" is returned as "_com_example_Demo" if make_camel_ca
 Example: "/com/example/Demo" is returned as "comExampleDemo" if make_camel_cased is True."""
 
         if make_camel_cased:
-            return common.make_camel_case(self.interface_full_name, '.')
+            return naming.camel_case(self.interface_full_name, '.')
 
-        return str.replace(self.interface_full_name, ".", "_")
+        return naming.coded_name(self.interface_full_name, ".")
 
     def get_name_components(self):
         """Return the interface full name as a list of components.
@@ -166,6 +212,7 @@ Example: "/com/example/Demo" is returned as "comExampleDemo" if make_camel_cased
 
         An interface can have many instances. The name of each instance
         is derived from the parent AllJoynObject."""
+        self.__check_not_frozen()
         self.parents.append(aj_parent)
         return
 
@@ -193,41 +240,49 @@ Example: "/com/example/Demo" is returned as "comExampleDemo" if make_camel_cased
 
     def add_method(self, xml, method):
         """Add a new method to this interface."""
-        for m in self.methods:
-            if m.name == method.name:
-                mess = "Duplicate method name '{0}' not allowed.".format(m.name)
-                mess = validate.get_xml_error(xml, mess)
-                raise validate.ValidateException(mess)
+        self.__check_not_frozen()
+
+        if self.methods.get(method.name) is not None:
+            mess = "Duplicate method name '{0}' not allowed.".format(method.name)
+            mess = validate.get_xml_error(xml, mess)
+            raise validate.ValidateException(mess)
 
         self.methods.append(method)
+        self.__fingerprint = None
         return
 
     def get_method(self, name):
         """Get the existing method with this name."""
-        for m in self.methods:
-            if m.name == name:
-                return m
-
-        return None
+        return self.methods.get(name)
 
     def add_declared_struct(self, xml, struct):
         """Add a new declared struct to this interface."""
+        self.__check_not_frozen()
+
         if struct.name in self.declared_names:
             validate.raise_exception(xml, "Duplicate struct name '{0}' not allowed.".format(struct.name))
         self.declared_structs[struct.name] = struct
-        self.declared_names.append(struct.name)
+        self.declared_names.add(struct.name)
+        self.__fingerprint = None
+        memberdef.types_changed()
         return
 
     def add_declared_dict(self, xml, dict):
         """Add a new declared dict to this interface."""
+        self.__check_not_frozen()
+
         if dict.name in self.declared_names:
             validate.raise_exception(xml, "Duplicate dict name '{0}' not allowed.".format(dict.name))
         self.declared_dicts[dict.name] = dict
-        self.declared_names.append(dict.name)
+        self.declared_names.add(dict.name)
+        self.__fingerprint = None
+        memberdef.types_changed()
         return
 
     def get_named_type(self, typename):
         """Retrieve a named type (struct or dict)."""
+        self.elaborate()
+
         if typename in self.declared_structs:
             return self.declared_structs[typename]
         if typename in self.declared_dicts:
@@ -236,41 +291,42 @@ Example: "/com/example/Demo" is returned as "comExampleDemo" if make_camel_cased
 
     def add_signal(self, xml, signal):
         """Add a new signal to this interface."""
-        for s in self.signals:
-            if s.name == signal.name:
-                mess = "Duplicate signal name '{0}' not allowed.".format(s.name)
-                mess = validate.get_xml_error(xml, mess)
-                raise validate.ValidateException(mess)
+        self.__check_not_frozen()
+
+        if self.signals.get(signal.name) is not None:
+            mess = "Duplicate signal name '{0}' not allowed.".format(signal.name)
+            mess = validate.get_xml_error(xml, mess)
+            raise validate.ValidateException(mess)
 
         self.signals.append(signal)
+        self.__fingerprint = None
         return
 
     def get_signal(self, name):
         """Get the existing signal with this name."""
-        for s in self.signals:
-            if s.name == name:
-                return s
-
-        return None
+        return self.signals.get(name)
 
     def add_property(self, xml, prop):
         """Add a new property to this interface."""
-        for p in self.properties:
-            if p.name == prop.name:
-                mess = "Duplicate property name '{0}' not allowed.".format(p.name)
-                mess = validate.get_xml_error(xml, mess)
-                raise validate.ValidateException(mess)
+        self.__check_not_frozen()
+
+        if self.properties.get(prop.name) is not None:
+            mess = "Duplicate property name '{0}' not allowed.".format(prop.name)
+            mess = validate.get_xml_error(xml, mess)
+            raise validate.ValidateException(mess)
 
         self.properties.append(prop)
+        self.__fingerprint = None
         return
 
     def get_property(self, name):
         """Get the existing property with this name."""
-        for p in self.properties:
-            if p.name == name:
-                return p
+        return self.properties.get(name)
 
-        return None
+    def __check_not_frozen(self):
+        f = "Interface '{0}'"
+        validate.check_not_frozen(self, f.format(self.interface_full_name))
+        return
 
     def __name_unnamed_containers(self):
         unnamed = 0
@@ -292,10 +348,17 @@ Example: "/com/example/Demo" is returned as "comExampleDemo" if make_camel_cased
         return
 
     def get_containers_in_declaration_order(self):
-        """Returns the declared containers in definition order for a header file"""
+        """Returns the declared containers in definition order for a header file
+
+        Containers with the same order are structs then dictionaries, each
+        sorted by name, so that the order doesn't depend on how the
+        dictionaries were filled, such as by decoding a cached model."""
+        self.elaborate()
         return_value = []
-        return_value += self.declared_structs.values()
-        return_value += self.declared_dicts.values()
+
+        for d in (self.declared_structs, self.declared_dicts):
+            return_value += [d[k] for k in sorted(d)]
+
         return_value.sort(key = lambda x: x.get_order())
         return return_value
 
@@ -327,8 +390,7 @@ Example: "/com/example/Demo" is returned as "comExampleDemo" if make_camel_cased
             # Add this container and extract all the subcontainers.
             c = container.Container(basesig, arg.name)
             list[basesig] = c
-            c.extract_structures(self.structures)
-            c.extract_dictionaries(self.dictionaries)
+            c.extract_containers(self.structures, self.dictionaries)
 
         return
 
@@ -411,21 +473,16 @@ Example: "/com/example/Demo" is returned as "comExampleDemo" if make_camel_cased
             self.add_declared_struct(None, struct)
 
         # resolve unnamed types in the property/method/signal arguments as well
-        for m in self.methods:
-            if m.args is None: continue
-            for arg in m.args:
-                arg.arg_type = self.__resolve_contained_containers(arg.arg_type)
+        for members in (self.methods, self.signals, self.properties):
+            for m in members:
+                if m.args is None: continue
+                for arg in m.args:
+                    arg.arg_type = self.__resolve_contained_containers(arg.arg_type)
 
-        for m in self.signals:
-            if m.args is None: continue
-            for arg in m.args:
-                arg.arg_type = self.__resolve_contained_containers(arg.arg_type)
-
-        for m in self.properties:
-            if m.args is None: continue
-            for arg in m.args:
-                arg.arg_type = self.__resolve_contained_containers(arg.arg_type)
+                # The fingerprint includes the argument types just changed.
+                m.reset_fingerprint()
 
+        self.__fingerprint = None
         return
 
     def __add_interface_to_all_members(self):
@@ -449,6 +506,52 @@ Example: "/com/example/Demo" is returned as "comExampleDemo" if make_camel_cased
             d.key.interface = self
             d.value.interface = self
 
+        # The named types now resolve through this interface.
+        memberdef.types_changed()
+        return
+
+    def get_fingerprint(self):
+        """Get a hash of everything compared by __eq__.
+
+        Equal interfaces have equal fingerprints. As with __eq__ the order of
+        the methods, signals, properties and declared types does not matter.
+        It is computed when first needed and is reset when a member is added
+        to the interface or the interface is elaborated."""
+        self.elaborate()
+        return self.__get_fingerprint()
+
+    def has_same_fingerprint(self, other):
+        """Return True if other has the same fingerprint as this interface.
+
+        If neither has been elaborated they are compared as parsed, since
+        elaborate() makes the same changes to equal interfaces, so a duplicate
+        which is discarded is never elaborated. Otherwise, or if they differ
+        as parsed, both are elaborated and compared."""
+        if (not self.elaborated and not other.elaborated and
+            self.__get_fingerprint() == other.__get_fingerprint()):
+            return True
+
+        return self.get_fingerprint() == other.get_fingerprint()
+
+    def __get_fingerprint(self):
+        if self.__fingerprint is None:
+            h = hashlib.sha1(repr(self.interface_full_name))
+
+            members = (("methods", self.methods),
+                       ("signals", self.signals),
+                       ("properties", self.properties),
+                       ("structs", self.declared_structs.values()),
+                       ("dicts", self.declared_dicts.values()))
+
+            for kind, l in members:
+                h.update(repr((kind, len(l))))
+
+                for m in sorted(l, key = lambda m: m.name):
+                    h.update(m.get_fingerprint())
+
+            self.__fingerprint = h.digest()
+
+        return self.__fingerprint
 
     def __eq__(self, other):
         """Compares this interface to another and returns true if equal.
@@ -461,6 +564,10 @@ Example: "/com/example/Demo" is returned as "comExampleDemo" if make_camel_cased
            self.interface_full_name != other.interface_full_name):
             return False
 
+        # The types of the arguments are changed by elaborate().
+        self.elaborate()
+        other.elaborate()
+
         if (len(self.properties) != len(other.properties) or
            len(self.signals) != len(other.signals) or
            len(self.methods) != len(other.methods) or
@@ -468,30 +575,25 @@ Example: "/com/example/Demo" is returned as "comExampleDemo" if make_camel_cased
            len(self.declared_dicts) != len(other.declared_dicts)):
             return False
 
-        for m in self.methods:
-            m_other = other.get_method(m.name)
-            if m_other is None or m_other != m:
-                return False
-
-        for s in self.signals:
-            s_other = other.get_signal(s.name)
-            if s_other is None or s_other != s:
-                return False
+        # Each member is compared with the member of other with the same
+        # name. The keys are taken from the current names since a member
+        # may have been renamed after it was added.
+        members = ((self.methods, other.methods),
+                   (self.signals, other.signals),
+                   (self.properties, other.properties),
+                   (self.declared_structs.values(), other.declared_structs.values()),
+                   (self.declared_dicts.values(), other.declared_dicts.values()))
 
-        for p in self.properties:
-            p_other = other.get_property(p.name)
-            if p_other is None or p_other != p:
-                return False
+        for mine, theirs in members:
+            by_name = {}
 
-        for ds in self.declared_structs.values():
-            ds_other = other.get_named_type(ds.name)
-            if ds_other is None or ds_other != ds:
-                return False
+            for m in theirs:
+                by_name.setdefault(m.name, m)
 
-        for dd in self.declared_dicts.values():
-            dd_other = other.get_named_type(dd.name)
-            if dd_other is None or dd_other != dd:
-                return False
+            for m in mine:
+                m_other = by_name.get(m.name)
+                if m_other is None or m_other != m:
+                    return False
 
         return True
 
@@ -503,6 +605,8 @@ Example: "/com/example/Demo" is returned as "comExampleDemo" if make_camel_cased
 
     def __str__(self):
         """Create and return a string representation of this object."""
+        # The types of the arguments are changed by elaborate().
+        self.elaborate()
         f = "Name: {0}\nFull: {1}"
         return_value = f.format(self.interface_name, self.interface_full_name)
 
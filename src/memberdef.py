@@ -14,27 +14,75 @@
 
 import validate
 import common
+import signatures
+import naming
 
-class MemberDef:
+# The number of named type changes. Cached flattened signatures made before
+# the latest change are out of date.
+type_generation = 0
+
+# The number of flattened signatures found in and missing from the caches.
+flattened_hits = 0
+flattened_misses = 0
+
+def types_changed():
+    """Record a change to a named type so all flattened signatures are remade."""
+    global type_generation
+    type_generation += 1
+    return
+
+def get_flattened_hit_rate():
+    """Return the fraction of flattened signatures found in the caches."""
+    total = flattened_hits + flattened_misses
+
+    if total == 0:
+        return 0.0
+
+    return float(flattened_hits) / total
+
+class MemberDef(object):
     """Common base class for field and argument definitions."""
 
+    # There are many of these so they are kept small with __slots__.
+    __slots__ = ("name", "arg_type", "interface", "__flattened")
+
     def __init__(self, name = None, arg_type = None):
         """Initialize an instance of the MemberDef class."""
         self.name = name
         self.arg_type = arg_type
         # This is initialized in Interface.parse()
         self.interface = None
+        # (arg_type, interface, type_generation, flattened signature)
+        self.__flattened = None
 
         return
 
     def get_flattened_signature(self):
-        """Flatten the signature by replacing all [NamedTypes] with their expanded signature."""
+        """Flatten the signature by replacing all [NamedTypes] with their expanded signature.
+
+        The result is cached until arg_type, interface or a named type changes."""
+        global flattened_hits, flattened_misses
+
+        cached = self.__flattened
+
+        if (cached is not None and cached[0] == self.arg_type and
+            cached[1] is self.interface and cached[2] == type_generation):
+            flattened_hits += 1
+            return cached[3]
+
+        flattened_misses += 1
+
         basesig = self.get_base_signature()
         if basesig[0] != '[':
-            return self.arg_type
-        prefix = 'a'*(len(self.arg_type)-len(basesig))
-        basetype = self.get_named_type().get_flattened_signature()
-        return prefix+basetype
+            return_value = self.arg_type
+        else:
+            prefix = 'a'*(len(self.arg_type)-len(basesig))
+            basetype = self.get_named_type().get_flattened_signature()
+            return_value = prefix+basetype
+
+        self.__flattened = (self.arg_type, self.interface, type_generation,
+                            return_value)
+        return return_value
 
     def get_flattened_base_signature(self):
         """Return the flattened base signature."""
@@ -113,6 +161,10 @@ Examples:
     def __str__(self):
         return "{0} : {1}".format(self.name, self.arg_type)
 
+    def get_fingerprint(self):
+        """Get a string of everything compared by __eq__."""
+        return repr((self.name, self.arg_type))
+
     def __eq__(self, other):
         """Compares this member definition to another and returns true if equal."""
         return self.name == other.name and self.arg_type == other.arg_type
@@ -125,151 +177,60 @@ Examples:
 
 def get_indirection_level(signature):
     """Get the number of dimensions in the array or 0 if not an array."""
-    return len(signature) - len(signature.lstrip('a'))
+    return signatures.get(signature).indirection_level
 
 def get_base_signature(signature, index = 0):
     """Return the base signature i.e. 'i', 'ai', and 'aai' all return 'i'."""
-    return signature[index:len(signature)].lstrip('a')
+    if index > 0:
+        signature = signature[index:]
+
+    return signatures.get(signature).base
 
 def is_array(signature):
     """Return True if this argument is an array. A dictionary is considered an array."""
-    return signature[0] == "a"
+    return signatures.get(signature).is_array
 
 def is_structure(signature):
     """Return True if the base argument type is a structure."""
-    sig = get_base_signature(signature)
-    return sig[0] == '('
+    return signatures.get(signature).is_structure
 
 def is_dictionary(signature):
     """Return True if the base argument type is a dictionary."""
-    sig = get_base_signature(signature)
-    return signature[0] == 'a' and sig[0] == '{'
+    return signatures.get(signature).is_dictionary
 
 def is_dictionary_array(signature):
     """Return True if the base argument type is an array of dictionaries."""
-    return is_dictionary(signature) and get_indirection_level(signature) > 1
-
-def __find_end_of_type(signature, index = 0):
-    """Returns the index of the start of the next type starting at 'index'.
-
-If there are no more types then return the end of the type signature.
-
-For example:
-    ("ab", 0)  returns 1
-    ("ab", 1)  returns 2
-    ("aab", 0)  returns 1
-    ("aab", 1)  returns 1
-    ("aab", 2)  returns 3
-    ("abb", 1)  returns 2
-    ("abb", 2)  returns 3
-    ("bqd", 0)  returns 1
-    ("bqd", 1)  returns 2
-    ("bqd", 2)  returns 3
-    ("(bqd)", 0) returns 4
-    ("(bqd)", 1) returns 2
-    ("(bqd)", 2) returns 3
-    ("(bqd)", 3) returns 4
-    ("(bqd)", 4) returns 5
-    ("(bqd(bad))", 0) returns 9
-    ("(bqd(bad))", 1) returns 2
-    ("(bqd(bad))", 2) returns 3
-    ("(bqd(bad))", 3) returns 4
-    ("(bqd(bad))", 4) returns 8
-    ("(bqd(bad))", 5) returns 6"""
-    assert(index < len(signature))
-    c = signature[index]
-
-    if c == '(':
-        end_index = __find_container_end(signature, index, ')')
-    elif c == '{':
-        end_index = __find_container_end(signature, index, '}')
-    elif c == 'a':
-        base = get_base_signature(signature, index)
-        end_index = __find_end_of_type(base)
-        end_index += index + get_indirection_level(signature, index)
-    else:
-        end_index = index + 1
-
-    return end_index
+    return signatures.get(signature).is_dictionary_array
 
 def is_basic_type(signature):
     """Returns True if the signature is a basic type
 
 'a', '(', '{', and 'v' are not considered basic types because they usually
 cannot be handled the same as other types."""
-
-    basic_types = ('b','d', 'g', 'i','n','o','q','s','t','u','x','y')
-    return signature in basic_types
+    return signatures.get(signature).is_basic_type
 
 def get_max_array_dimension(signature):
     """Gets the number of array dimensions in this signature."""
-    return_value = 0
-    while signature.find((return_value + 1) * 'a') != -1:
-        return_value += 1
-
-    return return_value
+    return signatures.get(signature).max_array_dimension
 
 def get_max_structure_depth(signature):
-    return get_max_container_depth(signature, '(', ')')
+    return signatures.get(signature).max_structure_depth
 
 def get_max_dictionary_depth(signature):
-    return get_max_container_depth(signature, '{', '}')
+    return signatures.get(signature).max_dictionary_depth
 
 def get_max_container_depth(signature, start, stop):
-    return_value = 0
-    count = 0
-
-    for c in signature:
-        if c == start:
-            count += 1
-        elif c == stop:
-            count -= 1
+    if start == '(' and stop == ')':
+        return get_max_structure_depth(signature)
 
-        if count > return_value:
-            return_value += 1
+    if start == '{' and stop == '}':
+        return get_max_dictionary_depth(signature)
 
-    return return_value
+    return signatures.get_max_container_depth(signature, start, stop)
 
 def split_signature(sig):
     """splits a container signature into individual fields."""
-    components = []
-    index = 1
-    while index < len(sig)-1:
-        part = sig[index:]
-
-        startindex = get_indirection_level(part)
-        endindex = __find_end_of_type(part, startindex)
-
-        components.append(part[:endindex])
-        index = index + endindex
-    return components
+    return [f.text for f in signatures.get(sig).fields]
 
 def make_clean_name(signature):
-    clean_name = signature.replace("(", "_")
-    clean_name = clean_name.replace(")", "")
-    clean_name = clean_name.replace("{", "_")
-    clean_name = clean_name.replace("}", "")
-    clean_name = clean_name.replace("[", "_")
-    clean_name = clean_name.replace("]", "")
-
-    return clean_name
-
-def __find_container_end(signature, index, end):
-    start = signature[index]
-    count = 0
-
-    while index < len(signature):
-        c = signature[index]
-
-        if c == start:
-            count += 1
-        elif c == end:
-            count -= 1
-
-            if count == 0:
-                index += 1
-                break
-
-        index += 1
-
-    return index
+    return naming.clean_name(signature)
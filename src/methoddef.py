@@ -13,18 +13,25 @@
 # OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
 
 from xml.etree import ElementTree
+import hashlib
 import validate
 import argdef
+import namedlist
 import common
 
-class MethodDef:
+class MethodDef(object):
     """Contains the description of a AllJoyn Method."""
+
+    # variant_type is only set by an annotation of the <method>.
+    __slots__ = ("name", "args", "no_reply", "is_secure", "variant_type",
+                 "__fingerprint")
     def __init__(self):
         """Initialize an instance of the Interface class."""
         self.name = ""
-        self.args = []
+        self.args = namedlist.NamedList()
         self.no_reply = False
         self.is_secure = False
+        self.__fingerprint = None
 
     def parse(self, xml, lax_naming):
         """Parse the given signal xml element."""
@@ -32,47 +39,51 @@ class MethodDef:
         assert(xml.tag == "method")
 
         #print("Parsing method '{0}'".format(xml.get('name')))
-        self.name = xml.get("name")
-        validate.member_name(self.name, xml)
+        self.start_parse(xml)
 
         # Make a list of all the objects at this level.
         xml_root_objects = list(xml)
 
-        arg_num = 0
-
-        common.get_annotations(xml, self)
-
         for o in xml_root_objects:
             if o.tag == "arg":
                 a = argdef.ArgDef()
+                a.parse(o, lax_naming, "Method", self, len(self.args))
+                self.add_arg(o, a)
+            elif o.tag == "annotation":
+                common.apply_annotation(xml, o, self)
+            else:
+                self.ignore_xml(o)
 
-                a.parse(o, lax_naming, "Method", self, arg_num)
-                arg_num += 1
+        return
 
-                # The default direction is "in".
-                if a.direction is None:
-                    a.direction = "in"
+    def start_parse(self, xml):
+        """Prepare to parse the <method> xml of this method.
 
-                self.__add_arg(xml, a)
-            elif o.tag != "annotation":
-                # Just ignore annotations. We got them earlier.
-                warn_format = "\nWarning! Ignoring method xml object '{0}'."
-                mess = warn_format.format(o.tag)
-                mess = validate.get_xml_error(xml, mess)
-                print(mess)
+        Only the attributes of the xml are used."""
+        self.__fingerprint = None
+        self.name = xml.get("name")
+        validate.member_name(self.name, xml)
+        return
+
+    def add_arg(self, xml, arg):
+        """Add a completely parsed argument from the <arg> xml."""
+        # The default direction is "in".
+        if arg.direction is None:
+            arg.direction = "in"
 
+        self.__add_arg(xml, arg)
+        self.__fingerprint = None
+        return
+
+    def ignore_xml(self, xml):
+        """Report an unexpected child of <method> which is being ignored."""
+        warn_format = "\nWarning! Ignoring method xml object '{0}'."
+        validate.warning(xml, warn_format, xml.tag)
         return
 
     def get_arg(self, name):
         """Get the argument with the name 'name' or None if not found."""
-        return_value = None
-
-        for a in self.args:
-            if a.name == name:
-                return_value = a
-                break
-
-        return return_value
+        return self.args.get(name)
 
     def get_args_for_direction(self, direction = None):
         """Get an array of method arguments.
@@ -88,15 +99,34 @@ class MethodDef:
         return return_value
 
     def __add_arg(self, xml, new_arg):
-        for a in self.args:
-            if a.name == new_arg.name:
-                mess = "Duplicate argument name '{0}'.".format(a.name)
-                mess = validate.get_xml_error(xml, mess)
-                raise validate.ValidateException(mess)
+        if self.args.get(new_arg.name) is not None:
+            mess = "Duplicate argument name '{0}'.".format(new_arg.name)
+            mess = validate.get_xml_error(xml, mess)
+            raise validate.ValidateException(mess)
 
         self.args.append(new_arg)
         return
 
+    def reset_fingerprint(self):
+        """Forget the fingerprint after the type of an argument is changed."""
+        self.__fingerprint = None
+        return
+
+    def get_fingerprint(self):
+        """Get a hash of everything compared by __eq__.
+
+        Equal methods have equal fingerprints. It is computed when first needed
+        and is reset when the method is changed by its parse methods."""
+        if self.__fingerprint is None:
+            h = hashlib.sha1(repr((self.name, self.no_reply, self.is_secure)))
+
+            for a in self.args:
+                h.update(a.get_fingerprint())
+
+            self.__fingerprint = h.digest()
+
+        return self.__fingerprint
+
     def __eq__(self, other):
         """Compares this method to another and returns true if equal."""
         if (self is None and other is not None or
@@ -0,0 +1,192 @@
+# Copyright AllSeen Alliance. All rights reserved.
+#
+# Permission to use, copy, modify, and/or distribute this software for any
+# purpose with or without fee is hereby granted, provided that the above
+# copyright notice and this permission notice appear in all copies.
+#
+# THE SOFTWARE IS PROVIDED "AS IS" AND THE AUTHOR DISCLAIMS ALL WARRANTIES
+# WITH REGARD TO THIS SOFTWARE INCLUDING ALL IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR
+# ANY SPECIAL, DIRECT, INDIRECT, OR CONSEQUENTIAL DAMAGES OR ANY DAMAGES
+# WHATSOEVER RESULTING FROM LOSS OF USE, DATA OR PROFITS, WHETHER IN AN
+# ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION, ARISING OUT OF
+# OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
+
+import os
+import sys
+import hashlib
+import tempfile
+
+import config
+import xmlinput
+import parsefilter
+import modelcodec
+
+# The default directory of the cache.
+default_path = os.path.join(os.path.expanduser("~"), ".ajcodegen", "model_cache")
+
+# The default maximum size of all the cache files in bytes.
+default_max_size = 256 * 1024 * 1024
+
+# The suffix of each cache file.
+cache_suffix = ".model"
+
+# Changed whenever the classes of the model change so that files stored by
+# an earlier version of the classes are not loaded.
+model_format = 10
+
+class ModelCache:
+    """An on-disk cache of parsed and validated services.
+
+    Each service is encoded by modelcodec and stored in a file named by a
+    key which is a hash of the xml input, the command line options which
+    change the service and the version of the code generator. If the total
+    size of the files exceeds max_size the least recently used files are
+    removed."""
+
+    def __init__(self, path = None, max_size = default_max_size):
+        """Initialize an instance of the ModelCache class."""
+        if path is None:
+            path = default_path
+
+        self.path = path
+        self.max_size = max_size
+        return
+
+    def get_key(self, command_line, filenames):
+        """Get the key of the service built from filenames with command_line.
+
+        Returns None if any of the files can't be read or is the standard
+        input. In that case the service can't be cached."""
+        if xmlinput.stdin_name in filenames:
+            return None
+
+        h = hashlib.sha1()
+        options = (config.get_version(),
+                   model_format,
+                   command_line.target_language,
+                   command_line.lax_naming,
+                   command_line.object_path,
+                   parsefilter.make_filter(command_line))
+        h.update(repr(options))
+
+        try:
+            for f in filenames:
+                h.update(self.__get_file_hash(f))
+        except IOError:
+            return None
+
+        return h.hexdigest()
+
+    def load(self, key):
+        """Return the service stored with this key or None if not found."""
+        if key is None:
+            return None
+
+        filename = self.__get_filename(key)
+
+        try:
+            with open(filename, "rb") as f:
+                return_value = modelcodec.decode(f.read())
+        except IOError:
+            return None
+        except Exception:
+            # A damaged cache file is the same as no cache file.
+            self.__remove(filename)
+            return None
+
+        # Mark this as the most recently used file.
+        try:
+            os.utime(filename, None)
+        except OSError:
+            pass
+
+        return return_value
+
+    def store(self, key, service):
+        """Store the service with this key. Errors are reported and ignored."""
+        if key is None:
+            return
+
+        filename = self.__get_filename(key)
+        temp = None
+
+        try:
+            if not os.path.exists(self.path):
+                os.makedirs(self.path)
+
+            # Write a temporary file and rename it so that a partially
+            # written file is never loaded.
+            fd, temp = tempfile.mkstemp(cache_suffix + ".tmp", "", self.path)
+
+            with os.fdopen(fd, "wb") as f:
+                f.write(modelcodec.encode(service))
+
+            self.__remove(filename)
+            os.rename(temp, filename)
+        except (IOError, OSError, modelcodec.CodecException):
+            f = "WARNING! Unable to store the model in the cache '{0}': {1}"
+            print(f.format(self.path, sys.exc_info()[1]))
+
+            if temp is not None:
+                self.__remove(temp)
+
+            return
+
+        self.__evict()
+        return
+
+    def __evict(self):
+        """Remove the least recently used files until the cache fits."""
+        entries = []
+        total = 0
+
+        for name in os.listdir(self.path):
+            if not name.endswith(cache_suffix):
+                continue
+
+            filename = os.path.join(self.path, name)
+
+            try:
+                stat = os.stat(filename)
+            except OSError:
+                continue
+
+            entries.append((stat.st_mtime, stat.st_size, filename))
+            total += stat.st_size
+
+        entries.sort()
+
+        for mtime, size, filename in entries:
+            if total <= self.max_size:
+                break
+
+            self.__remove(filename)
+            total -= size
+
+        return
+
+    def __get_filename(self, key):
+        return os.path.join(self.path, key + cache_suffix)
+
+    def __get_file_hash(self, filename):
+        h = hashlib.sha1()
+
+        with open(filename, "rb") as f:
+            while True:
+                data = f.read(1024 * 1024)
+
+                if not data:
+                    break
+
+                h.update(data)
+
+        return h.digest()
+
+    def __remove(self, filename):
+        try:
+            os.remove(filename)
+        except OSError:
+            pass
+
+        return
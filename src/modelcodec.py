@@ -0,0 +1,469 @@
+# Copyright AllSeen Alliance. All rights reserved.
+#
+# Permission to use, copy, modify, and/or distribute this software for any
+# purpose with or without fee is hereby granted, provided that the above
+# copyright notice and this permission notice appear in all copies.
+#
+# THE SOFTWARE IS PROVIDED "AS IS" AND THE AUTHOR DISCLAIMS ALL WARRANTIES
+# WITH REGARD TO THIS SOFTWARE INCLUDING ALL IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR
+# ANY SPECIAL, DIRECT, INDIRECT, OR CONSEQUENTIAL DAMAGES OR ANY DAMAGES
+# WHATSOEVER RESULTING FROM LOSS OF USE, DATA OR PROFITS, WHETHER IN AN
+# ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION, ARISING OUT OF
+# OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
+
+import struct
+import marshal
+
+import service
+import ajobject
+import interface
+import container
+import memberdef
+import argdef
+import fielddef
+import methoddef
+import signaldef
+import propertydef
+import structdef
+import dictdef
+import namedlist
+import parsefilter
+import catalogue
+
+class CodecException(Exception):
+    """Model encoding and decoding exceptions."""
+
+# The first bytes of every encoded model. The last byte is the version of
+# the format and is changed whenever the records below change.
+magic = "AJMODEL\x01"
+
+# After the magic: the marshal version, the interface count and the offset
+# and length of the string table, the service record and the interface index.
+header_format = "<IIIIIIII"
+
+# Each entry of the interface index: the string number of the interface
+# name and the offset and length of its record.
+index_format = "<III"
+
+# A slot which was never set is written as this. None is a valid value.
+absent = Ellipsis
+
+# The attributes of each kind of member in the order they are written. The
+# arguments and the interface of a member are written separately. Each
+# attribute is either a string, written as its number in the string table,
+# or a bool or int written as it is.
+string_fields = {"name", "arg_type", "direction", "variant_type", "access"}
+
+member_fields = {
+    memberdef.MemberDef : ("name", "arg_type"),
+    fielddef.FieldDef : ("name", "arg_type"),
+    argdef.ArgDef : ("name", "arg_type", "direction", "variant_type",
+                     "is_secure", "no_reply"),
+    methoddef.MethodDef : ("name", "no_reply", "is_secure", "variant_type"),
+    signaldef.SignalDef : ("name", "is_secure", "no_reply", "variant_type"),
+    propertydef.PropertyDef : ("name", "access", "is_secure", "no_reply",
+                               "emits_changed_signal", "variant_type"),
+    }
+
+# The classes of the members in the order of their numbers in the records.
+member_classes = [memberdef.MemberDef, fielddef.FieldDef, argdef.ArgDef,
+                  methoddef.MethodDef, signaldef.SignalDef,
+                  propertydef.PropertyDef]
+
+def encode(aj_service):
+    """Encode a completely parsed and validated service.
+
+    Returns a string which decode() or a ModelReader turns back into the
+    service. Each distinct string, such as a name or a signature, is
+    written once. Objects and interfaces refer to each other by number.
+    The files the interfaces were read from are only used when services are
+    merged and are not encoded."""
+    return Encoder(aj_service).get_data()
+
+def encode_interfaces(interfaces):
+    """Encode completely parsed and validated interfaces without a service.
+
+    Only ModelReader.get_interface() can decode them. As with the interfaces
+    of a catalogue their parents are not encoded."""
+    return Encoder(None, interfaces).get_data()
+
+def decode(data):
+    """Decode all of a service encoded by encode()."""
+    return ModelReader(data).get_service()
+
+class Encoder:
+    """Encodes a service into the format read by ModelReader."""
+
+    def __init__(self, aj_service, interfaces = None):
+        """Initialize an instance of the Encoder class and encode aj_service.
+
+        If aj_service is None the interfaces are encoded without a service."""
+        self.__strings = []
+        self.__string_numbers = {}
+        self.__object_numbers = {}
+        self.__interface_numbers = {}
+        self.__has_objects = aj_service is not None
+
+        if aj_service is not None:
+            interfaces = aj_service.interfaces.values()
+
+        interfaces = sorted(interfaces, key = lambda i: i.interface_full_name)
+        names = [i.interface_full_name for i in interfaces]
+
+        for number, i in enumerate(interfaces):
+            self.__interface_numbers[id(i)] = number
+
+        objects = []
+
+        if aj_service is not None:
+            for o, full_name, depth in aj_service.alljoyn_object.walk():
+                self.__object_numbers[id(o)] = len(objects)
+                objects.append(self.__encode_object(o))
+
+        records = [marshal.dumps(self.__encode_interface(i)) for i in interfaces]
+        name_numbers = [self.__string(n) for n in names]
+
+        if aj_service is not None:
+            f = aj_service.parse_filter
+
+            if f is not None:
+                f = (f.include_objects, f.exclude_objects,
+                     f.include_interfaces, f.exclude_interfaces)
+
+            service_record = (tuple(objects), aj_service.frozen, f,
+                              tuple((c.filename, c.target)
+                                    for c in aj_service.catalogues))
+        else:
+            service_record = None
+
+        service_record = marshal.dumps(service_record)
+
+        # The strings are only known once everything else is encoded.
+        strings = marshal.dumps(tuple(self.__strings))
+
+        offset = len(magic) + struct.calcsize(header_format)
+        strings_offset = offset
+        offset += len(strings)
+        service_offset = offset
+        offset += len(service_record)
+        index = []
+
+        for n, r in zip(name_numbers, records):
+            index.append(struct.pack(index_format, n, offset, len(r)))
+            offset += len(r)
+
+        header = struct.pack(header_format, marshal.version, len(records),
+                             strings_offset, len(strings),
+                             service_offset, len(service_record),
+                             offset, len(index) * struct.calcsize(index_format))
+
+        self.__data = "".join([magic, header, strings, service_record] +
+                              records + index)
+        return
+
+    def get_data(self):
+        """Return the encoded service."""
+        return self.__data
+
+    def __string(self, s):
+        if s is None:
+            return None
+
+        number = self.__string_numbers.get(s)
+
+        if number is None:
+            number = len(self.__strings)
+            self.__strings.append(s)
+            self.__string_numbers[s] = number
+
+        return number
+
+    def __encode_object(self, o):
+        if o.parent is None:
+            parent = -1
+        else:
+            parent = self.__object_numbers[id(o.parent)]
+
+        numbers = []
+
+        for i in o.interfaces:
+            number = self.__interface_numbers.get(id(i))
+
+            if number is None:
+                f = "Interface '{0}' of object '{1}' is not in the service."
+                raise CodecException(f.format(i.interface_full_name, o.name))
+
+            numbers.append(number)
+
+        return (self.__string(o.name), parent, tuple(numbers), o.indent, o.frozen)
+
+    def __encode_interface(self, i):
+        # Only elaborated interfaces are encoded so none is decoded.
+        i.elaborate()
+        containers = []
+
+        for d in (i.structures, i.dictionaries):
+            containers.append(tuple((self.__string(k), self.__string(d[k].signature),
+                                     self.__string(d[k].name))
+                                    for k in sorted(d)))
+
+        structs = tuple((self.__string(s.name),
+                         tuple(self.__encode_member(f, i) for f in s.fields))
+                        for s in self.__sorted_values(i.declared_structs))
+
+        dicts = tuple((self.__string(d.name),
+                       self.__encode_member(d.key, i),
+                       self.__encode_member(d.value, i))
+                      for d in self.__sorted_values(i.declared_dicts))
+
+        return (self.__string(i.interface_full_name),
+                self.__string(i.interface_name),
+                i.is_secure, i.is_derived, i.from_catalogue, i.frozen,
+                tuple(self.__encode_member(m, i) for m in i.methods),
+                tuple(self.__encode_member(s, i) for s in i.signals),
+                tuple(self.__encode_member(p, i) for p in i.properties),
+                self.__encode_parents(i),
+                containers[0], containers[1],
+                tuple(self.__string(n) for n in sorted(i.declared_names)),
+                structs, dicts)
+
+    def __encode_parents(self, i):
+        if not self.__has_objects:
+            return ()
+
+        return tuple(self.__object_numbers[id(o)] for o in i.parents)
+
+    def __encode_member(self, m, i):
+        """Encode a member as its class, its fields, its args and its interface."""
+        if m is None:
+            return None
+
+        cls = type(m)
+        values = []
+
+        for name in member_fields[cls]:
+            value = getattr(m, name, absent)
+
+            if name in string_fields and value is not absent:
+                value = self.__string(value)
+
+            values.append(value)
+
+        args = getattr(m, "args", None)
+
+        if args is not None:
+            args = tuple(self.__encode_member(a, i) for a in args)
+
+        # Only the interface being encoded can be referred to.
+        has_interface = getattr(m, "interface", None) is i
+        return (member_classes.index(cls), tuple(values), args, has_interface)
+
+    def __sorted_values(self, d):
+        return [d[k] for k in sorted(d)]
+
+class ModelReader:
+    """Reads a service encoded by encode().
+
+    Only the header is read when the reader is made. get_interface() decodes
+    a single interface, so a process which only needs some of the interfaces
+    doesn't decode the others. get_service() decodes everything."""
+
+    def __init__(self, data):
+        """Initialize an instance of the ModelReader class.
+
+        data is the string returned by encode() or an mmap of it."""
+        self.data = data
+        header_end = len(magic) + struct.calcsize(header_format)
+
+        if len(data) < header_end or data[:len(magic)] != magic:
+            raise CodecException("Not an encoded model of this version.")
+
+        header = struct.unpack_from(header_format, data, len(magic))
+        (version, count, strings_offset, strings_length, service_offset,
+         service_length, index_offset, index_length) = header
+
+        if version != marshal.version:
+            raise CodecException("The model was encoded by another version of Python.")
+
+        if (index_offset + index_length != len(data) or
+            index_length != count * struct.calcsize(index_format)):
+            raise CodecException("The encoded model is damaged.")
+
+        self.__strings_range = (strings_offset, strings_length)
+        self.__service_range = (service_offset, service_length)
+        self.__strings = None
+        self.__names = None
+        self.__index = {}
+
+        for n in range(count):
+            entry = struct.unpack_from(index_format, data,
+                                       index_offset + n * struct.calcsize(index_format))
+            self.__index[entry[0]] = (n, entry[1], entry[2])
+
+        return
+
+    def get_interface_names(self):
+        """Return the sorted names of the interfaces of the service."""
+        return sorted(self.__get_names())
+
+    def get_interface(self, name):
+        """Decode the interface with this name or return None if not found.
+
+        As with the interfaces of a catalogue the parents of the interface
+        are not decoded so they are empty."""
+        entry = self.__get_names().get(name)
+
+        if entry is None:
+            return None
+
+        return self.__decode_interface(entry, None)
+
+    def get_service(self):
+        """Decode the complete service."""
+        strings = self.__get_strings()
+        service_record = self.__load(self.__service_range)
+
+        if service_record is None:
+            raise CodecException("Only interfaces were encoded, not a service.")
+
+        objects, frozen, f, catalogues = service_record
+
+        decoded = []
+
+        for name, parent, numbers, indent, object_frozen in objects:
+            if parent < 0:
+                o = ajobject.AllJoynObject(strings[name])
+                s = service.Service(o.name)
+                s.alljoyn_object = o
+            else:
+                o = ajobject.AllJoynObject(strings[name], decoded[parent])
+                decoded[parent].add_child(o)
+
+            o.indent = indent
+            decoded.append(o)
+
+        entries = sorted(self.__index.values())
+        interfaces = [self.__decode_interface(e, decoded) for e in entries]
+
+        for i in interfaces:
+            s.interfaces[i.interface_full_name] = i
+
+        for o, record in zip(decoded, objects):
+            o.interfaces = [interfaces[n] for n in record[2]]
+
+        if f is not None:
+            s.parse_filter = parsefilter.ParseFilter(*f)
+
+        s.catalogues = [catalogue.Catalogue(fn, t) for fn, t in catalogues]
+
+        # Everything is built before anything is frozen. The summary and
+        # the other data derived by Service.freeze() are made when needed.
+        for o, record in zip(decoded, objects):
+            o.frozen = record[4]
+
+        s.frozen = frozen
+        return s
+
+    def __get_names(self):
+        if self.__names is None:
+            strings = self.__get_strings()
+            self.__names = dict((strings[n], entry)
+                                for n, entry in self.__index.items())
+
+        return self.__names
+
+    def __get_strings(self):
+        if self.__strings is None:
+            strings = self.__load(self.__strings_range)
+            self.__strings = [intern(s) if type(s) is str else s for s in strings]
+
+        return self.__strings
+
+    def __load(self, data_range):
+        offset, length = data_range
+
+        try:
+            return marshal.loads(self.data[offset : offset + length])
+        except (EOFError, ValueError, TypeError):
+            raise CodecException("The encoded model is damaged.")
+
+    def __decode_interface(self, entry, objects):
+        """Decode the interface at entry linking it to objects if given."""
+        strings = self.__get_strings()
+        (full_name, name, is_secure, is_derived, from_catalogue, frozen,
+         methods, signals, properties, parents, structures, dictionaries,
+         declared_names, structs, dicts) = self.__load(entry[1:])
+
+        i = interface.Interface()
+        i.interface_full_name = strings[full_name]
+        i.interface_name = strings[name]
+        i.is_secure = is_secure
+        i.is_derived = is_derived
+        i.from_catalogue = from_catalogue
+        i.elaborated = True
+
+        i.methods = namedlist.NamedList(self.__decode_member(m, i) for m in methods)
+        i.signals = namedlist.NamedList(self.__decode_member(m, i) for m in signals)
+        i.properties = namedlist.NamedList(self.__decode_member(m, i) for m in properties)
+
+        if objects is not None:
+            i.parents = [objects[n] for n in parents]
+
+        for records, d in ((structures, i.structures), (dictionaries, i.dictionaries)):
+            for key, signature, container_name in records:
+                c = container.Container(strings[signature])
+                c.name = self.__get_string(container_name)
+                d[strings[key]] = c
+
+        i.declared_names = set(strings[n] for n in declared_names)
+
+        for struct_name, fields in structs:
+            s = structdef.StructDef()
+            s.name = strings[struct_name]
+            s.fields = namedlist.NamedList(self.__decode_member(f, i) for f in fields)
+            i.declared_structs[s.name] = s
+
+        for dict_name, key, value in dicts:
+            d = dictdef.DictDef()
+            d.name = strings[dict_name]
+            d.key = self.__decode_member(key, i)
+            d.value = self.__decode_member(value, i)
+            i.declared_dicts[d.name] = d
+
+        i.frozen = frozen
+
+        # The named types now resolve through this interface.
+        memberdef.types_changed()
+        return i
+
+    def __decode_member(self, record, i):
+        if record is None:
+            return None
+
+        class_number, values, args, has_interface = record
+        cls = member_classes[class_number]
+        m = cls()
+
+        for name, value in zip(member_fields[cls], values):
+            if value is absent:
+                continue
+
+            if name in string_fields:
+                value = self.__get_string(value)
+
+            setattr(m, name, value)
+
+        if args is not None:
+            m.args = namedlist.NamedList(self.__decode_member(a, i) for a in args)
+
+        if has_interface:
+            m.interface = i
+
+        return m
+
+    def __get_string(self, number):
+        if number is None:
+            return None
+
+        return self.__strings[number]
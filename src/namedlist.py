@@ -0,0 +1,117 @@
+# Copyright AllSeen Alliance. All rights reserved.
+#
+# Permission to use, copy, modify, and/or distribute this software for any
+# purpose with or without fee is hereby granted, provided that the above
+# copyright notice and this permission notice appear in all copies.
+#
+# THE SOFTWARE IS PROVIDED "AS IS" AND THE AUTHOR DISCLAIMS ALL WARRANTIES
+# WITH REGARD TO THIS SOFTWARE INCLUDING ALL IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR
+# ANY SPECIAL, DIRECT, INDIRECT, OR CONSEQUENTIAL DAMAGES OR ANY DAMAGES
+# WHATSOEVER RESULTING FROM LOSS OF USE, DATA OR PROFITS, WHETHER IN AN
+# ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION, ARISING OUT OF
+# OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
+
+# Lists shorter than this are searched rather than indexed. Most argument
+# lists are this short and a dictionary for each would use more memory than
+# it saves time.
+index_threshold = 8
+
+class NamedList(list):
+    """A list of items with a 'name' which can also be found by name.
+
+    The items stay in the order they were added, which is the order used
+    for code generation. get() finds an item by name in constant time once
+    the list is long enough to be indexed. An item must not be renamed once
+    it is in the list."""
+
+    __slots__ = ("__index",)
+
+    def __init__(self, items = ()):
+        """Initialize an instance of the NamedList class."""
+        list.__init__(self, items)
+        self.__index = None
+        self.__reindex()
+        return
+
+    def get(self, name, default = None):
+        """Get the first item with this name or default if there isn't one."""
+        if self.__index is not None:
+            return self.__index.get(name, default)
+
+        for item in self:
+            if item.name == name:
+                return item
+
+        return default
+
+    def append(self, item):
+        """Add item to the end of the list."""
+        list.append(self, item)
+
+        if self.__index is not None:
+            self.__index.setdefault(item.name, item)
+        elif len(self) >= index_threshold:
+            self.__reindex()
+
+        return
+
+    def extend(self, items):
+        list.extend(self, items)
+        self.__reindex()
+        return
+
+    def insert(self, position, item):
+        list.insert(self, position, item)
+        self.__reindex()
+        return
+
+    def remove(self, item):
+        list.remove(self, item)
+        self.__reindex()
+        return
+
+    def pop(self, *args):
+        return_value = list.pop(self, *args)
+        self.__reindex()
+        return return_value
+
+    def __iadd__(self, items):
+        self.extend(items)
+        return self
+
+    def __setitem__(self, key, value):
+        list.__setitem__(self, key, value)
+        self.__reindex()
+        return
+
+    def __delitem__(self, key):
+        list.__delitem__(self, key)
+        self.__reindex()
+        return
+
+    def __setslice__(self, i, j, items):
+        list.__setslice__(self, i, j, items)
+        self.__reindex()
+        return
+
+    def __delslice__(self, i, j):
+        list.__delslice__(self, i, j)
+        self.__reindex()
+        return
+
+    def __reduce__(self):
+        # Pickle as the items alone. The index is rebuilt when unpickled.
+        return (NamedList, (list(self),))
+
+    def __reindex(self):
+        if len(self) < index_threshold:
+            self.__index = None
+            return
+
+        self.__index = {}
+
+        for item in self:
+            self.__index.setdefault(item.name, item)
+
+        return
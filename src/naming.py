@@ -0,0 +1,155 @@
+# Copyright AllSeen Alliance. All rights reserved.
+#
+# Permission to use, copy, modify, and/or distribute this software for any
+# purpose with or without fee is hereby granted, provided that the above
+# copyright notice and this permission notice appear in all copies.
+#
+# THE SOFTWARE IS PROVIDED "AS IS" AND THE AUTHOR DISCLAIMS ALL WARRANTIES
+# WITH REGARD TO THIS SOFTWARE INCLUDING ALL IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR
+# ANY SPECIAL, DIRECT, INDIRECT, OR CONSEQUENTIAL DAMAGES OR ANY DAMAGES
+# WHATSOEVER RESULTING FROM LOSS OF USE, DATA OR PROFITS, WHETHER IN AN
+# ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION, ARISING OUT OF
+# OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
+
+import string
+
+import validate
+
+# The identifiers made from names. The key is (style, name, argument) and the
+# value is the identifier. The same name always makes the same identifier so
+# they are kept for the life of the process. See clear().
+identifiers = {}
+
+# The number of identifiers found in and missing from identifiers.
+identifier_hits = 0
+identifier_misses = 0
+
+def camel_case(name, separator = "/"):
+    """Make a name into a camel case identifier and delete the separator.
+
+    If the separator is None only the first character is made lower case."""
+    return __get(("camel", name, separator), __make_camel_case, name, separator)
+
+def coded_name(name, separator):
+    """Make a name into an identifier by replacing each separator with '_'."""
+    return __get(("coded", name, separator), str.replace, name, separator, "_")
+
+def clean_name(signature):
+    """Make a signature into a part of an identifier.
+
+    The brackets and braces are removed or replaced with '_'."""
+    return __get(("clean", signature, None), __make_clean_name, signature)
+
+def format_identifier(identifier_format, *args):
+    """Return identifier_format.format(*args) made once for each args."""
+    return __get(("format", identifier_format, args),
+                 identifier_format.format, *args)
+
+def get_hit_rate():
+    """Return the fraction of identifiers which were already made."""
+    total = identifier_hits + identifier_misses
+
+    if total == 0:
+        return 0.0
+
+    return float(identifier_hits) / total
+
+def clear():
+    """Forget all the identifiers made."""
+    identifiers.clear()
+    return
+
+def __get(key, make, *args):
+    global identifier_hits, identifier_misses
+
+    return_value = identifiers.get(key)
+
+    if return_value is None:
+        identifier_misses += 1
+        return_value = make(*args)
+        identifiers[key] = return_value
+    else:
+        identifier_hits += 1
+
+    return return_value
+
+def __make_camel_case(name, separator):
+    if separator:
+        caps_value = string.capwords(name, separator)
+        temp = caps_value.replace(separator, "")
+    else:
+        temp = name
+
+    first_char_string = temp[0:1]
+    return first_char_string.lower() + temp[1:]
+
+def __make_clean_name(signature):
+    clean_name = signature.replace("(", "_")
+    clean_name = clean_name.replace(")", "")
+    clean_name = clean_name.replace("{", "_")
+    clean_name = clean_name.replace("}", "")
+    clean_name = clean_name.replace("[", "_")
+    clean_name = clean_name.replace("]", "")
+
+    return clean_name
+
+class NameIndex:
+    """The identifiers a target makes from the object paths and interface names.
+
+    Two objects or two interfaces with different names but the same
+    identifier would declare the same symbol twice in the generated code. The
+    index is built once for the whole service and a ValidateException is
+    raised for the first clash found.
+
+    object_style and interface_style are "coded", "camel" or None if the
+    target doesn't make identifiers from those names. The members are:
+
+    objects = {}    # The AllJoynObject of each object identifier.
+    interfaces = {} # The Interface of each interface identifier."""
+
+    def __init__(self, service, object_style, interface_style):
+        """Initialize an instance of the NameIndex class."""
+        self.objects = {}
+        self.interfaces = {}
+
+        if object_style is not None:
+            camel = object_style == "camel"
+
+            for o in service.get_objects():
+                self.__add(self.objects, o.get_full_coded_name(camel), o,
+                           o.get_full_name(), "Object paths")
+
+        if interface_style is not None:
+            camel = interface_style == "camel"
+
+            for key in sorted(service.interfaces):
+                i = service.interfaces[key]
+                self.__add(self.interfaces, i.get_full_coded_name(camel), i,
+                           key, "Interfaces")
+
+        return
+
+    def get_object(self, identifier):
+        """Get the AllJoynObject with this identifier or None if not found."""
+        return self.objects.get(identifier)
+
+    def get_interface(self, identifier):
+        """Get the Interface with this identifier or None if not found."""
+        return self.interfaces.get(identifier)
+
+    def __add(self, index, identifier, item, name, kind):
+        other = index.get(identifier)
+
+        if other is not None and other is not item:
+            if kind == "Interfaces":
+                other_name = other.interface_full_name
+            else:
+                other_name = other.get_full_name()
+
+            f = "{0} '{1}' and '{2}' both make the identifier '{3}'."
+            validate.raise_exception(None, f.format(kind, other_name, name,
+                                                    identifier))
+
+        index[identifier] = item
+        return
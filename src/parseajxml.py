@@ -13,27 +13,165 @@
 # OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
 
 from xml.etree import ElementTree
+from xml.parsers import expat
 import sys
+import os
+import glob
 import argparse
+import multiprocessing
 
 import config
 import interface
 import service
 import validate
 import common
+import saxparse
+import parsefilter
+import catalogue
+import xmlinput
 
 class ParseException(Exception):
     """Parse exceptions"""
 
+# The xml parsers that may be selected with the '--parser' option.
+parsers = ("tree", "stream", "sax")
+
+class LocatingTreeBuilder(ElementTree.TreeBuilder):
+    """Builds an xml tree recording where each element starts.
+
+    Each element is given a 'location' attribute of (filename, line, column)
+    which validate.get_xml_error() uses to report errors. The parser must be
+    set before any xml is fed to it."""
+
+    def __init__(self, filename):
+        """Initialize an instance of the LocatingTreeBuilder class."""
+        ElementTree.TreeBuilder.__init__(self)
+        self.filename = filename
+        self.parser = None
+        return
+
+    def start(self, tag, attrs):
+        """Start an element and record its location."""
+        return_value = ElementTree.TreeBuilder.start(self, tag, attrs)
+        expat = self.parser._parser
+        return_value.location = (self.filename,
+                                 expat.CurrentLineNumber,
+                                 expat.CurrentColumnNumber + 1)
+        return return_value
+
+def make_xml_parser(filename):
+    """Make an xml parser which records the location of each element."""
+    target = LocatingTreeBuilder(filename)
+    return_value = ElementTree.XMLParser(target = target)
+    target.parser = return_value
+    return return_value
+
+def get_input_files(names):
+    """Expand the xml input names into a list of xml files.
+
+    names is a single name or a list of names. Each name may be a file, a
+    directory, a glob pattern or "-" for the standard input. A directory is
+    searched recursively for files with one of the xmlinput.xml_suffixes.
+    Files are returned in the order given with directories and patterns
+    expanded in sorted order. Duplicates are removed."""
+    if isinstance(names, basestring):
+        names = [names]
+
+    return_value = []
+
+    for name in names:
+        if os.path.isdir(name):
+            found = []
+
+            for dirpath, dirs, files in os.walk(name):
+                for f in files:
+                    if f.endswith(xmlinput.xml_suffixes):
+                        found.append(os.path.join(dirpath, f))
+
+            if not found:
+                f = "No xml files found in '{0}'."
+                raise ParseException(f.format(name))
+        elif glob.has_magic(name):
+            found = glob.glob(name)
+
+            if not found:
+                raise ParseException("No files match '{0}'.".format(name))
+        else:
+            found = [name]
+
+        for f in sorted(found):
+            if f not in return_value:
+                return_value.append(f)
+
+    return return_value
+
+def parse_file(work):
+    """Parse one xml file and return the service and the ignored annotations.
+
+    This is the work done by each worker process when several files are
+    parsed. work is a tuple of (filename, parser, command_line, target,
+    warnings) where target is the target language needed by the interface
+    parsing and warnings is validate.report_warnings. The ignored annotations
+    are returned rather than reported so that the annotations of all the
+    files are reported once. See common.take_ignored_annotations()."""
+    filename, parser, command_line, target, warnings = work
+    common.target_language = target
+    validate.report_warnings = warnings
+
+    try:
+        p = ParseAjXml(filename, parser)
+        return_value = p.parse(command_line, False)
+    except validate.ValidateException as e:
+        message = "{0}\nIn file '{1}'.".format(e.message, filename)
+        raise validate.ValidateException(message)
+    finally:
+        ignored = common.take_ignored_annotations()
+
+    return (return_value, ignored)
+
 class ParseAjXml:
     """Parses the XML and initializes the AllJoyn data structures."""
 
-    def __init__(self, xml_filename):
-        """Initialize an instance of the ParseAjXml class."""
-        self.filename = xml_filename
+    def __init__(self, xml_filename, parser = "tree", jobs = None):
+        """Initialize an instance of the ParseAjXml class.
+
+        xml_filename is a file, directory or glob pattern or a list of them.
+        "-" is the standard input. Files may be compressed with gzip, bzip2
+        or xz and are decompressed as they are parsed. If this is more than
+        one file each file is parsed in a separate worker process when
+        parse() is called and the results are merged into a single service.
+        jobs is the maximum number of worker processes. If None the number of
+        CPUs is used.
+
+        parser is one of the values in 'parsers'. With "tree" the complete xml
+        tree is read here and is available as 'tree'. With "stream" the file
+        is parsed incrementally when parse() is called and each interface and
+        node is discarded from the xml tree as soon as it has been turned into
+        an AllJoyn data structure. With "sax" no xml tree is built at all. The
+        AllJoyn data structures are built directly from the parser events when
+        parse() is called."""
+        assert(parser in parsers)
+        self.filenames = get_input_files(xml_filename)
+        self.filename = ", ".join(self.filenames)
+        self.parser = parser
+        self.jobs = jobs
+        self.tree = None
+        self.source = None
+
+        if len(self.filenames) > 1:
+            # Each file is read by a worker process in parse().
+            return
 
         try:
-            self.tree = ElementTree.parse(self.filename)
+            self.source = xmlinput.open_input(self.filename)
+
+            if parser == "tree":
+                try:
+                    xml_parser = make_xml_parser(self.filename)
+                    self.tree = ElementTree.parse(self.source, xml_parser)
+                finally:
+                    self.source.close()
+                    self.source = None
         except:
             f = "Exception parsing '{0}': {1}"
             message = f.format(self.filename, sys.exc_info()[1])
@@ -41,13 +179,75 @@ class ParseAjXml:
 
         return
 
-    def parse(self, command_line):
-        """Fill in the AllJoyn data structures from the XML file."""
-        node = self.tree.getroot()
+    def parse(self, command_line, report_annotations = True):
+        """Fill in the AllJoyn data structures from the XML file.
+
+        A single warning for all the unknown annotations in all the files is
+        printed at the end unless report_annotations is False."""
+        try:
+            if len(self.filenames) > 1:
+                return_value = self.__parse_files(command_line)
+            elif self.parser == "stream":
+                return_value = self.__parse_streaming(command_line)
+            elif self.parser == "sax":
+                return_value = self.__parse_sax(command_line)
+            else:
+                node = self.tree.getroot()
+                return_value = self.__make_service(node, command_line)
+                return_value.parse(node, command_line.lax_naming)
+        finally:
+            if report_annotations:
+                common.report_ignored_annotations()
+
+        return return_value
+
+    def __parse_files(self, command_line):
+        """Parse each of the files in parallel and merge the results.
+
+        If all the files have the same root object path it is the root of the
+        merged service. Otherwise the root is '/' and the files are merged
+        below it. Interfaces in more than one file must be identical."""
+        work = [(f, self.parser, command_line, common.target_language,
+                 validate.report_warnings) for f in self.filenames]
+
+        # The standard input can't be read by a worker process.
+        if self.jobs == 1 or xmlinput.stdin_name in self.filenames:
+            results = [parse_file(w) for w in work]
+        else:
+            pool = multiprocessing.Pool(self.jobs)
+
+            try:
+                results = pool.map(parse_file, work)
+            finally:
+                pool.close()
+                pool.join()
+
+        services = []
+
+        for s, ignored in results:
+            services.append(s)
+            common.add_ignored_annotations(ignored)
+
+        root_names = set([s.alljoyn_object.name for s in services])
+
+        if len(root_names) == 1:
+            return_value = service.Service(root_names.pop())
+        else:
+            return_value = service.Service("/")
+
+        self.__add_parse_options(return_value, command_line)
+
+        for f, s in zip(self.filenames, services):
+            return_value.merge(s, f)
+
+        return return_value
+
+    def __make_service(self, node, command_line):
+        """Check the root node and create the service it describes."""
         if node.tag != "node":
             error = "Root xml object must be a 'node'."
-            error = AllJoynCodeGenCommon.get_xml_error(node, error)
-            raise ValidateException(error)
+            error = validate.get_xml_error(node, error)
+            raise validate.ValidateException(error)
 
         xml_bus_object_path = node.get("name")
         cmd_bus_object_path = command_line.object_path
@@ -56,7 +256,115 @@ class ParseAjXml:
                                                   cmd_bus_object_path,
                                                   node)
         return_value = service.Service(service_name)
-        return_value.parse(node, command_line.lax_naming)
+        self.__add_parse_options(return_value, command_line)
+        return return_value
+
+    def __add_parse_options(self, s, command_line):
+        """Add the filter and the catalogues used while parsing to service s."""
+        s.parse_filter = parsefilter.make_filter(command_line)
+        target = common.target_language
+
+        for f in command_line.catalogues or []:
+            s.catalogues.append(catalogue.Catalogue(f, target))
+
+        return
+
+    def __parse_streaming(self, command_line):
+        """Fill in the AllJoyn data structures while reading the XML file.
+
+        Each <interface> is parsed as soon as its end tag is read and each
+        <node> is completed at its end tag. Both are then removed from the
+        xml tree so the memory used is bounded by the largest interface
+        rather than the complete file. The result is identical to parse()
+        on the complete tree."""
+        lax_naming = command_line.lax_naming
+        return_value = None
+
+        # Each entry is [xml, AllJoynObject, child_count, full_name] for an
+        # open <node>.
+        nodes = []
+        # All the xml elements which are currently open.
+        open_xml = []
+        # The xml of a <node> skipped by the parse filter and all its children.
+        skipped = None
+
+        try:
+            xml_parser = make_xml_parser(self.filename)
+            events = ElementTree.iterparse(self.source, ("start", "end"),
+                                           xml_parser)
+
+            for event, xml in events:
+                if event == "start":
+                    if return_value is None:
+                        return_value = self.__make_service(xml, command_line)
+                        o = return_value.alljoyn_object
+                        full_name = o.get_full_name()
+                        o.start_parse(xml, return_value, full_name)
+                        nodes.append([xml, o, 0, full_name])
+                    elif xml.tag == "node" and open_xml[-1] is nodes[-1][0]:
+                        parent = nodes[-1][1]
+                        o = parent.make_child(xml)
+                        full_name = parent.get_child_full_name(o, nodes[-1][3])
+
+                        if o.is_skipped(return_value, full_name):
+                            skipped = xml
+                        else:
+                            o.start_parse(xml, return_value, full_name)
+                            nodes.append([xml, o, 0, full_name])
+
+                    open_xml.append(xml)
+                    continue
+
+                open_xml.pop()
+
+                if xml is skipped:
+                    skipped = None
+                    nodes[-1][2] += 1
+                    open_xml[-1].remove(xml)
+                elif xml is nodes[-1][0]:
+                    node_xml, o, child_count, full_name = nodes.pop()
+                    o.finish_parse(node_xml, child_count)
+
+                    if nodes:
+                        nodes[-1][1].finish_child(o, return_value)
+                        nodes[-1][2] += 1
+                        open_xml[-1].remove(xml)
+                elif open_xml[-1] is nodes[-1][0]:
+                    if xml.tag == "interface":
+                        nodes[-1][1].parse_interface(xml, return_value,
+                                                     lax_naming, nodes[-1][3])
+                        nodes[-1][2] += 1
+                    else:
+                        nodes[-1][1].ignore_xml(xml)
+
+                    open_xml[-1].remove(xml)
+        except (ElementTree.ParseError, IOError):
+            f = "Exception parsing '{0}': {1}"
+            message = f.format(self.filename, sys.exc_info()[1])
+            raise ParseException(message)
+        finally:
+            self.source.close()
+
+        return return_value
+
+    def __parse_sax(self, command_line):
+        """Fill in the AllJoyn data structures directly from the expat events.
+
+        The result is identical to parse() on the complete tree."""
+        def make_service(node):
+            return self.__make_service(node, command_line)
+
+        builder = saxparse.ModelBuilder(self.filename, make_service,
+                                        command_line.lax_naming)
+
+        try:
+            return_value = builder.parse(self.source)
+        except (expat.ExpatError, IOError):
+            f = "Exception parsing '{0}': {1}"
+            message = f.format(self.filename, sys.exc_info()[1])
+            raise ParseException(message)
+        finally:
+            self.source.close()
 
         return return_value
 
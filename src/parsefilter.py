@@ -0,0 +1,125 @@
+# Copyright AllSeen Alliance. All rights reserved.
+#
+# Permission to use, copy, modify, and/or distribute this software for any
+# purpose with or without fee is hereby granted, provided that the above
+# copyright notice and this permission notice appear in all copies.
+#
+# THE SOFTWARE IS PROVIDED "AS IS" AND THE AUTHOR DISCLAIMS ALL WARRANTIES
+# WITH REGARD TO THIS SOFTWARE INCLUDING ALL IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR
+# ANY SPECIAL, DIRECT, INDIRECT, OR CONSEQUENTIAL DAMAGES OR ANY DAMAGES
+# WHATSOEVER RESULTING FROM LOSS OF USE, DATA OR PROFITS, WHETHER IN AN
+# ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION, ARISING OUT OF
+# OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
+
+import fnmatch
+
+# The characters which start a wildcard in a glob pattern.
+glob_characters = "*?["
+
+def make_filter(command_line):
+    """Make the ParseFilter given by the command line or None if there isn't one."""
+    patterns = (command_line.include_objects,
+                command_line.exclude_objects,
+                command_line.include_interfaces,
+                command_line.exclude_interfaces)
+
+    if not any(patterns):
+        return None
+
+    return ParseFilter(*patterns)
+
+class ParseFilter:
+    """Selects the objects and interfaces which are kept while parsing.
+
+    Each filter is a list of glob patterns (as used by fnmatch) or None. As
+    with fnmatch a '*' also matches '/' so "/org/example/*" matches all the
+    objects below "/org/example".
+
+    The interfaces of an object are kept if its path matches one of the
+    include_objects (or there aren't any) and the interface name matches one
+    of the include_interfaces (or there aren't any) and the interface name
+    does not match any of the exclude_interfaces. An object which matches
+    one of the exclude_objects is skipped along with all of its children as
+    is any object which can't contain a match of the include_objects."""
+
+    def __init__(self, include_objects = None, exclude_objects = None,
+                 include_interfaces = None, exclude_interfaces = None):
+        """Initialize an instance of the ParseFilter class."""
+        self.include_objects = include_objects or []
+        self.exclude_objects = exclude_objects or []
+        self.include_interfaces = include_interfaces or []
+        self.exclude_interfaces = exclude_interfaces or []
+
+        # The part of each include_objects pattern before the first wildcard.
+        self.include_prefixes = [self.__get_literal_prefix(p)
+                                 for p in self.include_objects]
+        return
+
+    def accepts_object(self, path):
+        """Return True if the interfaces of the object at path are kept."""
+        if self.__matches_any(path, self.exclude_objects):
+            return False
+
+        if self.include_objects:
+            return self.__matches_any(path, self.include_objects)
+
+        return True
+
+    def accepts_interface(self, name):
+        """Return True if the interface with this name is kept."""
+        if name is None:
+            # Let the interface parsing report the missing name.
+            return True
+
+        if self.include_interfaces:
+            if not self.__matches_any(name, self.include_interfaces):
+                return False
+
+        return not self.__matches_any(name, self.exclude_interfaces)
+
+    def skips_object(self, path):
+        """Return True if nothing at or below the object at path is kept.
+
+        This only compares path with the literal start of each pattern so
+        the objects below path need not be known."""
+        if self.__matches_any(path, self.exclude_objects):
+            return True
+
+        if not self.include_objects:
+            return False
+
+        if path.endswith("/"):
+            child_prefix = path
+        else:
+            child_prefix = path + "/"
+
+        for pattern, prefix in zip(self.include_objects, self.include_prefixes):
+            if prefix == pattern:
+                # No wildcards. Only this path or its parents can match.
+                if pattern == path or pattern.startswith(child_prefix):
+                    return False
+            elif prefix.startswith(child_prefix) or path.startswith(prefix):
+                return False
+
+        return True
+
+    def __matches_any(self, name, patterns):
+        for p in patterns:
+            if fnmatch.fnmatchcase(name, p):
+                return True
+
+        return False
+
+    def __get_literal_prefix(self, pattern):
+        for i, c in enumerate(pattern):
+            if c in glob_characters:
+                return pattern[:i]
+
+        return pattern
+
+    def __repr__(self):
+        """Used for the key of the model cache."""
+        f = "ParseFilter({0!r}, {1!r}, {2!r}, {3!r})"
+        return f.format(self.include_objects, self.exclude_objects,
+                        self.include_interfaces, self.exclude_interfaces)
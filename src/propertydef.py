@@ -13,17 +13,22 @@
 # OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
 
 from xml.etree import ElementTree
+import hashlib
 import common
 import validate
 import argdef
+import namedlist
 
 class EmitsChangedSignal:
     NEVER = 0
     ALWAYS = 1
     INVALIDATES = 2
 
-class PropertyDef:
+class PropertyDef(object):
     """Contains the description of an AllJoyn property."""
+
+    __slots__ = ("name", "access", "is_secure", "no_reply",
+                 "emits_changed_signal", "variant_type", "args", "__fingerprint")
     def __init__(self):
         """Initialize an instance of the PropertyDef class."""
         self.name = ""
@@ -32,7 +37,8 @@ class PropertyDef:
         self.no_reply = False
         self.emits_changed_signal = EmitsChangedSignal.NEVER
         self.variant_type = None
-        self.args = []
+        self.args = namedlist.NamedList()
+        self.__fingerprint = None
         return
 
     def parse(self, xml):
@@ -40,6 +46,15 @@ class PropertyDef:
         assert(xml is not None)
         assert(xml.tag == "property")
 
+        self.start_parse(xml)
+        common.get_annotations(xml, self)
+        return
+
+    def start_parse(self, xml):
+        """Prepare to parse the <property> xml of this property.
+
+        Only the attributes of the xml are used."""
+        self.__fingerprint = None
         self.name = xml.get("name")
         validate.member_name(self.name, xml)
 
@@ -59,7 +74,6 @@ class PropertyDef:
             a = argdef.ArgDef(xml, "out_value", data_type, "out")
             self.args.append(a)
 
-        common.get_annotations(xml, self)
         return
 
     def is_readable(self):
@@ -77,6 +91,26 @@ class PropertyDef:
         elif "invalidates" == value:
             self.emits_changed_signal = EmitsChangedSignal.INVALIDATES
 
+    def reset_fingerprint(self):
+        """Forget the fingerprint after the type of an argument is changed."""
+        self.__fingerprint = None
+        return
+
+    def get_fingerprint(self):
+        """Get a hash of everything compared by __eq__.
+
+        Equal propertys have equal fingerprints. It is computed when first needed
+        and is reset when the property is changed by its parse methods."""
+        if self.__fingerprint is None:
+            h = hashlib.sha1(repr((self.name, self.access)))
+
+            for a in self.args:
+                h.update(a.get_fingerprint())
+
+            self.__fingerprint = h.digest()
+
+        return self.__fingerprint
+
     def __eq__(self, other):
         """Compares this property to another and returns true if equal."""
         if (self is None and other is not None or
@@ -0,0 +1,295 @@
+# Copyright AllSeen Alliance. All rights reserved.
+#
+# Permission to use, copy, modify, and/or distribute this software for any
+# purpose with or without fee is hereby granted, provided that the above
+# copyright notice and this permission notice appear in all copies.
+#
+# THE SOFTWARE IS PROVIDED "AS IS" AND THE AUTHOR DISCLAIMS ALL WARRANTIES
+# WITH REGARD TO THIS SOFTWARE INCLUDING ALL IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR
+# ANY SPECIAL, DIRECT, INDIRECT, OR CONSEQUENTIAL DAMAGES OR ANY DAMAGES
+# WHATSOEVER RESULTING FROM LOSS OF USE, DATA OR PROFITS, WHETHER IN AN
+# ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION, ARISING OUT OF
+# OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
+
+from xml.parsers import expat
+
+import interface
+import signaldef
+import methoddef
+import propertydef
+import argdef
+import structdef
+import fielddef
+import dictdef
+import common
+
+class XmlElement:
+    """The tag, attributes and location of an xml element.
+
+    This has just enough of the ElementTree.Element interface for the AllJoyn
+    data structures to parse their attributes and report errors. It has no
+    children."""
+
+    def __init__(self, tag, attrib, location):
+        """Initialize an instance of the XmlElement class."""
+        self.tag = tag
+        self.attrib = attrib
+        self.location = location
+        return
+
+    def get(self, key, default = None):
+        """Get the value of the attribute key or default if not present."""
+        return self.attrib.get(key, default)
+
+    def items(self):
+        """Get the attributes as a list of (name, value) pairs."""
+        return self.attrib.items()
+
+class ModelBuilder:
+    """Builds the AllJoyn data structures directly from expat events.
+
+    No xml tree is built. Each AllJoyn data structure is created when its
+    start tag is read, its children are added to it as they are completed and
+    it is completed and added to its parent when its end tag is read.
+
+    make_service is called with the XmlElement of the root node and returns
+    the Service to fill in."""
+
+    def __init__(self, filename, make_service, lax_naming):
+        """Initialize an instance of the ModelBuilder class."""
+        self.filename = filename
+        self.make_service = make_service
+        self.lax_naming = lax_naming
+        self.service = None
+        self.parser = None
+
+        # Each entry is [kind, xml, AllJoyn object, child_count] for an open
+        # element. kind is None for elements which are ignored. The entry of
+        # a <node> also has the full name of its object at the end.
+        self.open_elements = []
+
+        self.start_handlers = {"node" : self.__start_node_child,
+                               "interface" : self.__start_interface_child,
+                               "method" : self.__start_member_child,
+                               "signal" : self.__start_member_child,
+                               "property" : self.__start_annotated_child,
+                               "arg" : self.__start_annotated_child,
+                               "struct" : self.__start_struct_child,
+                               "dict" : self.__start_dict_child}
+
+        self.end_handlers = {"node" : self.__end_node,
+                             "interface" : self.__end_interface,
+                             "method" : self.__end_method,
+                             "signal" : self.__end_signal,
+                             "property" : self.__end_property,
+                             "arg" : self.__end_arg,
+                             "struct" : self.__end_struct,
+                             "dict" : self.__end_dict}
+        return
+
+    def parse(self, source):
+        """Parse the xml read from the file object source.
+
+        Returns the completed service. Throws an expat.ExpatError if the xml
+        is not well formed."""
+        self.parser = expat.ParserCreate()
+        self.parser.returns_unicode = False
+        self.parser.StartElementHandler = self.__start
+        self.parser.EndElementHandler = self.__end
+        self.parser.ParseFile(source)
+
+        return self.service
+
+    def __start(self, tag, attrib):
+        location = (self.filename,
+                    self.parser.CurrentLineNumber,
+                    self.parser.CurrentColumnNumber + 1)
+        xml = XmlElement(tag, attrib, location)
+
+        if not self.open_elements:
+            self.service = self.make_service(xml)
+            o = self.service.alljoyn_object
+            full_name = o.get_full_name()
+            o.start_parse(xml, self.service, full_name)
+            self.open_elements.append(["node", xml, o, 0, full_name])
+            return
+
+        parent = self.open_elements[-1]
+        handler = self.start_handlers.get(parent[0])
+
+        if handler is None:
+            self.open_elements.append([None, xml, None, 0])
+        else:
+            self.open_elements.append(handler(xml, parent))
+
+        return
+
+    def __end(self, tag):
+        entry = self.open_elements.pop()
+        handler = self.end_handlers.get(entry[0])
+
+        if handler is not None:
+            if self.open_elements:
+                parent = self.open_elements[-1]
+            else:
+                parent = None
+
+            handler(entry[1], entry[2], entry[3], parent)
+
+        return
+
+    def __start_node_child(self, xml, parent):
+        o = parent[2]
+
+        if xml.tag == "node":
+            parent[3] += 1
+            child = o.make_child(xml)
+            full_name = o.get_child_full_name(child, parent[4])
+
+            if child.is_skipped(self.service, full_name):
+                return [None, xml, None, 0]
+
+            child.start_parse(xml, self.service, full_name)
+            return ["node", xml, child, 0, full_name]
+
+        if xml.tag == "interface":
+            parent[3] += 1
+
+            if not o.accepts_interface(xml, self.service, parent[4]):
+                return [None, xml, None, 0]
+
+            i = interface.Interface()
+            i.start_parse(xml)
+            return ["interface", xml, i, 0]
+
+        o.ignore_xml(xml)
+        return [None, xml, None, 0]
+
+    def __start_interface_child(self, xml, parent):
+        i = parent[2]
+        parent[3] += 1
+
+        if xml.tag == "signal":
+            s = signaldef.SignalDef()
+            s.start_parse(xml)
+            return ["signal", xml, s, 0]
+
+        if xml.tag == "method":
+            m = methoddef.MethodDef()
+            m.start_parse(xml)
+            return ["method", xml, m, 0]
+
+        if xml.tag == "property":
+            p = propertydef.PropertyDef()
+            p.start_parse(xml)
+            return ["property", xml, p, 0]
+
+        if xml.tag == "struct":
+            s = structdef.StructDef()
+            s.start_parse(xml)
+            return ["struct", xml, s, 0]
+
+        if xml.tag == "dict":
+            d = dictdef.DictDef()
+            d.start_parse(xml)
+            return ["dict", xml, d, 0]
+
+        if xml.tag == "annotation":
+            common.apply_annotation(parent[1], xml, i)
+        else:
+            i.ignore_xml(xml)
+
+        return [None, xml, None, 0]
+
+    def __start_member_child(self, xml, parent):
+        """Start a child of a <method> or a <signal>."""
+        if xml.tag == "arg":
+            a = argdef.ArgDef()
+            a.start_parse(xml)
+            return ["arg", xml, a, 0]
+
+        if xml.tag == "annotation":
+            common.apply_annotation(parent[1], xml, parent[2])
+        else:
+            parent[2].ignore_xml(xml)
+
+        return [None, xml, None, 0]
+
+    def __start_annotated_child(self, xml, parent):
+        """Start a child of an element which only has annotations."""
+        if xml.tag == "annotation":
+            common.apply_annotation(parent[1], xml, parent[2])
+
+        return [None, xml, None, 0]
+
+    def __start_struct_child(self, xml, parent):
+        if xml.tag == "field":
+            f = fielddef.FieldDef()
+            f.parse(xml, self.lax_naming)
+            parent[2].add_field(xml, f)
+
+        return [None, xml, None, 0]
+
+    def __start_dict_child(self, xml, parent):
+        if xml.tag == "key":
+            parent[2].parse_key(xml)
+        elif xml.tag == "value":
+            parent[2].parse_value(xml)
+
+        return [None, xml, None, 0]
+
+    def __end_node(self, xml, o, child_count, parent):
+        o.finish_parse(xml, child_count)
+
+        if parent is not None:
+            parent[2].finish_child(o, self.service)
+
+        return
+
+    def __end_interface(self, xml, i, child_count, parent):
+        # An <interface> without children may name a catalogue interface.
+        if child_count == 0:
+            catalogue_interface = self.service.get_catalogue_interface(xml)
+
+            if catalogue_interface is not None:
+                parent[2].add_interface(xml, catalogue_interface, self.service)
+                return
+
+        i.finish_parse(xml)
+        parent[2].add_interface(xml, i, self.service)
+        return
+
+    def __end_method(self, xml, m, child_count, parent):
+        parent[2].add_method(xml, m)
+        return
+
+    def __end_signal(self, xml, s, child_count, parent):
+        parent[2].add_signal(xml, s)
+        return
+
+    def __end_property(self, xml, p, child_count, parent):
+        parent[2].add_property(xml, p)
+        return
+
+    def __end_arg(self, xml, a, child_count, parent):
+        member = parent[2]
+
+        if parent[0] == "method":
+            parent_type = "Method"
+        else:
+            parent_type = "Signal"
+
+        a.finish_parse(xml, self.lax_naming, parent_type, member,
+                       len(member.args))
+        member.add_arg(xml, a)
+        return
+
+    def __end_struct(self, xml, s, child_count, parent):
+        parent[2].add_declared_struct(xml, s)
+        return
+
+    def __end_dict(self, xml, d, child_count, parent):
+        d.finish_parse(xml)
+        parent[2].add_declared_dict(xml, d)
+        return
@@ -14,6 +14,7 @@
 
 import ajobject
 import validate
+import analysis
 
 class Service:
     """Contains the description of a complete AllJoyn service.
@@ -27,6 +28,9 @@ class Service:
     def __init__(self, service_name):
         """Initializes an instance of the Service class."""
 
+        # True once freeze() has made the service read-only.
+        self.frozen = False
+
         # There is a single collection of interfaces which are shared with all
         # AllJoyObjects.
         self.interfaces = {}
@@ -35,23 +39,39 @@ class Service:
         # other AllJoynObjects and/or reference one of the Interfaces.
         self.alljoyn_object = ajobject.AllJoynObject(service_name)
         self.delete_object_cache()
-        self.__has_read_properties = None
-        self.__has_write_properties = None
-        self.__number_of_signals = None
-        self.__has_dictionaries = None
+
+        # The ServiceSummary made by analyze(). None until then.
+        self.summary = None
+
+        # The ParseFilter applied while parsing. None if everything is kept.
+        self.parse_filter = None
+
+        # The Catalogues searched for interfaces which are only named.
+        self.catalogues = []
+
+        # The file each interface was read from when services are merged.
+        self.__interface_files = {}
+
         return
 
     def parse(self, xml, lax_naming):
         """Parse the input xml into a better representation of the service."""
+        self.__check_not_frozen()
         self.alljoyn_object.parse(xml, self, lax_naming)
         return
 
-    def add_interface(self, interface, xml):
+    def add_interface(self, interface, xml, filename = None):
         """Add this interface to the list of interfaces. Returns the interface.
 
         If the interface already exists then the existing interface is returned
         and the new interface is not added. If an interface with the same name
-        but different signature exist then an exception is raised."""
+        but different signature exist then an exception is raised. The
+        interfaces are compared only by their fingerprints, which are SHA-1
+        digests of everything compared by Interface.__eq__, without
+        elaborating them if possible. filename,
+        if given, is the file the interface was read from and is reported if
+        the signatures differ."""
+        self.__check_not_frozen()
 
         # First check to see if the interface already exists.
         i = self.get_interface(interface.interface_full_name)
@@ -60,24 +80,94 @@ class Service:
             self.interfaces[interface.interface_full_name] = interface
             i = interface
 
-            # Because one or more of the following properties may have been set
-            # to False and the addition of this interface may change that we now
-            # set them to None so the previously cached value can be reevaluated
-            # as needed in has_read_properties(), etc.
-            self.__has_read_properties = None
-            self.__has_write_properties = None
-            self.__number_of_signals = None
-            self.__has_dictionaries = None
-        elif i != interface:
+            if filename is not None:
+                self.__interface_files[interface.interface_full_name] = filename
+
+            # The summary must be made again to include this interface.
+            self.summary = None
+        elif not i.has_same_fingerprint(interface):
             error1_format = "Interface '{0}' has multiple definitions"
             error1 = error1_format.format(interface.interface_full_name)
             error2 = "with different signatures."
             error = " ".join([error1, error2])
+
+            first_file = self.__interface_files.get(interface.interface_full_name)
+
+            if first_file is not None and filename is not None:
+                f = "{0}\nDefined in '{1}' and '{2}'."
+                error = f.format(error, first_file, filename)
+            elif filename is not None:
+                error = "{0}\nDefined again in '{1}'.".format(error, filename)
+
             error = validate.get_xml_error(xml, error)
             raise validate.ValidateException(error)
 
         return i
 
+    def merge(self, other, filename = None):
+        """Merge the objects and interfaces of the service 'other' into this one.
+
+        Interfaces are added with the same rules as add_interface() so an
+        identical interface is only kept once. Objects with the same object
+        path are combined. If the root objects have different names the root
+        of 'other' is found, or made, below the root of this service, which
+        must be '/', one element of its path at a time.
+        filename, if given, is the file 'other' was read from and is used when
+        reporting errors."""
+        self.__check_not_frozen()
+        self.delete_object_cache()
+
+        for key in sorted(other.interfaces):
+            i = other.interfaces[key]
+
+            if self.add_interface(i, None, filename) is i:
+                # The parents are replaced by the objects of this service.
+                i.parents = []
+
+        root = other.alljoyn_object
+
+        if root.name == self.alljoyn_object.name:
+            self.alljoyn_object.merge(root, self)
+        elif self.alljoyn_object.name == "/":
+            # Child names are relative to the parent so each element of the
+            # path is found, or made, below the one before it.
+            parent = self.alljoyn_object
+
+            for name in root.name[1:].split("/"):
+                child = parent.alljoyn_objects.get(name)
+
+                if child is None:
+                    child = ajobject.AllJoynObject(name, parent)
+                    parent.add_child(child)
+
+                parent = child
+
+            parent.merge(root, self)
+        else:
+            f = "Object '{0}' cannot be merged with object '{1}'."
+            mess = f.format(root.name, self.alljoyn_object.name)
+
+            if filename is not None:
+                mess = "{0}\nIn file '{1}'.".format(mess, filename)
+
+            raise validate.ValidateException(mess)
+
+        return
+
+    def get_catalogue_interface(self, xml):
+        """Get the interface named by the <interface> xml from the catalogues.
+
+        Returns None if it is in none of them."""
+        name = xml.get("name")
+
+        for c in self.catalogues:
+            i = c.get_interface(name)
+
+            if i is not None:
+                return i
+
+        return None
+
     def get_interface(self, name):
         """Get the interface with this name (use full interface name)."""
         if name in self.interfaces:
@@ -89,9 +179,11 @@ class Service:
         """Return a complete list of all objects."""
 
         if not self.objects and self.alljoyn_object is not None:
-            self.alljoyn_object.append_objects(self.objects)
             index = 0
-            for o in self.objects:
+            for o, full_name, depth in self.alljoyn_object.walk():
+                self.objects.append(o)
+                self.__object_paths.setdefault(full_name, o)
+
                 # Only give index numbers to objects that have interfaces.
                 if o.interfaces:
                     o.index = index
@@ -99,86 +191,92 @@ class Service:
 
         return self.objects
 
+    def get_object(self, path):
+        """Get the object with this full object path or None if not found."""
+        self.get_objects()
+        return self.__object_paths.get(path)
+
     def delete_object_cache(self):
-        """Delete the cache of the objects but not the object themselves."""
+        """Delete the cache of the objects but not the object themselves.
+
+        The names cached by the objects are also deleted."""
+        self.__check_not_frozen()
         self.objects = []
+        self.__object_paths = {}
+        ajobject.names_changed()
+        # The summary must be made again for the new objects.
+        self.summary = None
         return
 
-    def has_read_properties(self):
-        """Return true if any of the interfaces contain a readable property."""
-        return_value = False
+    def analyze(self):
+        """Make the summary of this completely parsed and validated service.
 
-        if self.__has_read_properties is None:
-            for key in sorted(self.interfaces):
-                i = self.interfaces[key]
-                if i.has_read_properties():
-                    return_value = True
-                    break
+        This is done once after validation. The generators read the
+        aggregates of the service, its objects and its interfaces from it."""
+        self.summary = analysis.analyze(self)
+        return self.summary
 
-            self.__has_read_properties = return_value
-        else:
-            return_value = self.__has_read_properties
+    def get_summary(self):
+        """Return the summary of this service, analyzing it if needed."""
+        if self.summary is None:
+            self.analyze()
 
-        return return_value
+        return self.summary
 
-    def has_write_properties(self):
-        """Return true if any of the interfaces contain a writeable property."""
-        return_value = False
+    def freeze(self):
+        """Make this completely parsed and validated service read-only.
 
-        if self.__has_write_properties is None:
-            for key in sorted(self.interfaces):
-                i = self.interfaces[key]
-                if i.has_write_properties():
-                    return_value = True
-                    break
+        The list of objects, their names and the summary are made first. Once
+        frozen, any attempt to parse into, merge into or add to the service,
+        its objects or its interfaces raises a ValidateException. Everything
+        the generators derive from the model is kept outside of it so a
+        frozen service can be shared by code generation runs."""
+        if self.frozen:
+            return
 
-            self.__has_write_properties = return_value
-        else:
-            return_value = self.__has_write_properties
+        objects = self.get_objects()
+        self.get_summary()
 
-        return return_value
+        for o in objects:
+            o.get_full_coded_name()
+            o.get_full_coded_name(True)
+            o.frozen = True
+
+        for key in sorted(self.interfaces):
+            i = self.interfaces[key]
+            i.get_fingerprint()
+            i.frozen = True
+
+        self.frozen = True
+        return
+
+    def has_read_properties(self):
+        """Return true if any of the interfaces contain a readable property."""
+        return self.get_summary().has_read_properties
+
+    def has_write_properties(self):
+        """Return true if any of the interfaces contain a writeable property."""
+        return self.get_summary().has_write_properties
 
     def has_properties(self):
         """Return true if any of the interfaces contain a property."""
-        return self.has_read_properties() or self.has_write_properties()
+        return self.get_summary().has_properties
 
     def has_signals(self):
         """Return true if any of the interfaces contain a signal."""
-        return self.number_of_signals() > 0
+        return self.get_summary().has_signals
 
     def number_of_signals(self):
         """Returns the number of signals in all instances of all interfaces."""
-        return_value = 0
-
-        if self.__number_of_signals is None:
-            objects = self.get_objects()
-
-            for o in objects:
-                for i in o.interfaces:
-                    return_value += len(i.signals)
-
-            self.__number_of_signals = return_value
-        else:
-            return_value = self.__number_of_signals
-
-        return return_value
+        return self.get_summary().number_of_signals
 
     def has_dictionaries(self):
         """Return true if any of the interfaces contains a dictionary."""
-        return_value = False
-
-        if self.__has_dictionaries is None:
-            for key in sorted(self.interfaces):
-                i = self.interfaces[key]
-                if i.dictionaries:
-                    return_value = True
-                    break
+        return self.get_summary().has_dictionaries
 
-            self.__has_dictionaries = return_value
-        else:
-            return_value = self.__has_dictionaries
-
-        return return_value
+    def __check_not_frozen(self):
+        validate.check_not_frozen(self, "The service")
+        return
 
     def __str__(self):
         """Create and return a string representation of this object."""
@@ -192,8 +290,8 @@ class Service:
             index += 1
 
         if self.alljoyn_object is not None:
-            self.alljoyn_object.indent = 0
             o_format = "{0}\n##### Objects #####\n{1}"
-            return_value = o_format.format(return_value, self.alljoyn_object)
+            objects = self.alljoyn_object.to_string(0)
+            return_value = o_format.format(return_value, objects)
 
         return return_value
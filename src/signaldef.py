@@ -13,20 +13,27 @@
 # OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
 
 from xml.etree import ElementTree
+import hashlib
 import validate
 import argdef
+import namedlist
 import common
 
-class SignalDef:
+class SignalDef(object):
     """Contains the description of a AllJoyn signal."""
+
+    # variant_type is only set by an annotation of the <signal>.
+    __slots__ = ("name", "args", "is_secure", "no_reply", "variant_type",
+                 "__fingerprint")
     def __init__(self):
         """Initialize an instance of the SignalDef class."""
         self.name = None
-        self.args = []
+        self.args = namedlist.NamedList()
         self.is_secure = False
         # Signal always have a "reply". This variable is for consistency with
         # methods and properties.
         self.no_reply = False
+        self.__fingerprint = None
         return
 
     def parse(self, xml, lax_naming):
@@ -34,59 +41,85 @@ class SignalDef:
         assert(xml is not None)
         assert(xml.tag == "signal")
 
-        self.name = xml.get("name")
-        validate.member_name(self.name, xml)
+        self.start_parse(xml)
 
         # Make a list of all the objects at this level.
         xml_root_objects = list(xml)
 
-        arg_num = 0
-        common.get_annotations(xml, self)
-
         for o in xml_root_objects:
             if o.tag == "arg":
                 a = argdef.ArgDef()
+                a.parse(o, lax_naming, "Signal", self, len(self.args))
+                self.add_arg(o, a)
+            elif o.tag == "annotation":
+                common.apply_annotation(xml, o, self)
+            else:
+                self.ignore_xml(o)
 
-                a.parse(o, lax_naming, "Signal", self, arg_num)
-                arg_num += 1
+        return
 
-                # The default direction is "out".
-                if a.direction is None:
-                    a.direction = "out"
-                elif a.direction != "out":
-                    error = "Signal arguments must have a direction of 'out'."
-                    error = validate.get_xml_error(xml, error)
-                    raise validate.ValidateException(error)
+    def start_parse(self, xml):
+        """Prepare to parse the <signal> xml of this signal.
 
-                self.__add_arg(o, a)
-            elif o.tag != "annotation":
-                # Just ignore annotations. We got them earlier.
-                warn_format = "\nWarning! Ignoring xml object '{0}'."
-                print(warn_format.format(o.tag))
+        Only the attributes of the xml are used."""
+        self.__fingerprint = None
+        self.name = xml.get("name")
+        validate.member_name(self.name, xml)
+        return
 
+    def add_arg(self, xml, arg):
+        """Add a completely parsed argument from the <arg> xml."""
+        # The default direction is "out".
+        if arg.direction is None:
+            arg.direction = "out"
+        elif arg.direction != "out":
+            error = "Signal arguments must have a direction of 'out'."
+            error = validate.get_xml_error(xml, error)
+            raise validate.ValidateException(error)
+
+        self.__add_arg(xml, arg)
+        self.__fingerprint = None
+        return
+
+    def ignore_xml(self, xml):
+        """Report an unexpected child of <signal> which is being ignored."""
+        warn_format = "\nWarning! Ignoring xml object '{0}'."
+        validate.warning(xml, warn_format, xml.tag)
         return
 
     def get_arg(self, name):
         """Get the argument with the name 'name' or None if not found."""
-        return_value = None
-
-        for a in self.args:
-            if a.name == name:
-                return_value = a
-                break
-
-        return return_value
+        return self.args.get(name)
 
     def __add_arg(self, xml, new_arg):
-        for a in self.args:
-            if a.name == new_arg.name:
-                mess = "Duplicate argument name '{0}'.".format(a.name)
-                mess = validate.get_xml_error(xml, mess)
-                raise validate.ValidateException(mess)
+        if self.args.get(new_arg.name) is not None:
+            mess = "Duplicate argument name '{0}'.".format(new_arg.name)
+            mess = validate.get_xml_error(xml, mess)
+            raise validate.ValidateException(mess)
 
         self.args.append(new_arg)
         return
 
+    def reset_fingerprint(self):
+        """Forget the fingerprint after the type of an argument is changed."""
+        self.__fingerprint = None
+        return
+
+    def get_fingerprint(self):
+        """Get a hash of everything compared by __eq__.
+
+        Equal signals have equal fingerprints. It is computed when first needed
+        and is reset when the signal is changed by its parse methods."""
+        if self.__fingerprint is None:
+            h = hashlib.sha1(repr(self.name))
+
+            for a in self.args:
+                h.update(a.get_fingerprint())
+
+            self.__fingerprint = h.digest()
+
+        return self.__fingerprint
+
     def __eq__(self, other):
         """Compares this signal to another and returns true if equal."""
         if (self is None and other is not None or
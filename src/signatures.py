@@ -0,0 +1,170 @@
+# Copyright AllSeen Alliance. All rights reserved.
+#
+# Permission to use, copy, modify, and/or distribute this software for any
+# purpose with or without fee is hereby granted, provided that the above
+# copyright notice and this permission notice appear in all copies.
+#
+# THE SOFTWARE IS PROVIDED "AS IS" AND THE AUTHOR DISCLAIMS ALL WARRANTIES
+# WITH REGARD TO THIS SOFTWARE INCLUDING ALL IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR
+# ANY SPECIAL, DIRECT, INDIRECT, OR CONSEQUENTIAL DAMAGES OR ANY DAMAGES
+# WHATSOEVER RESULTING FROM LOSS OF USE, DATA OR PROFITS, WHETHER IN AN
+# ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION, ARISING OUT OF
+# OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
+
+# The signatures which are basic types. 'a', '(', '{', and 'v' are not
+# considered basic types because they usually cannot be handled the same as
+# other types.
+basic_types = ('b','d', 'g', 'i','n','o','q','s','t','u','x','y')
+
+# Every Signature made so far indexed by its text.
+signature_table = {}
+
+def get(text):
+    """Get the Signature of text.
+
+    Each distinct signature is parsed once. The same Signature instance is
+    returned for every later request for the same text."""
+    return_value = signature_table.get(text)
+
+    if return_value is None:
+        return_value = Signature(text)
+        signature_table[text] = return_value
+
+    return return_value
+
+def get_max_container_depth(text, start, stop):
+    """Return the maximum depth of the containers from start to stop in text."""
+    return_value = 0
+    count = 0
+
+    for c in text:
+        if c == start:
+            count += 1
+        elif c == stop:
+            count -= 1
+
+        if count > return_value:
+            return_value += 1
+
+    return return_value
+
+class Signature:
+    """An AllJoyn type signature parsed once into its properties and fields.
+
+    Signatures are shared so they can't be changed once made. Use get() to
+    make them. The members are:
+
+    text = string              # The signature, i.e. "aa(is)".
+    base = string              # The signature without leading 'a's, i.e. "(is)".
+    indirection_level = int    # The number of leading 'a's.
+    max_array_dimension = int  # The longest run of 'a's anywhere.
+    max_structure_depth = int  # The maximum nesting of '(...)'.
+    max_dictionary_depth = int # The maximum nesting of '{...}'.
+    is_array = bool            # True if the signature starts with 'a'.
+    is_structure = bool        # True if the base is a structure.
+    is_dictionary = bool       # True if this is an array of a dictionary.
+    is_dictionary_array = bool # True if this is an array of dictionary arrays.
+    is_basic_type = bool       # True if this is one of basic_types.
+    fields = (Signature, ...)  # The fields of a structure or dictionary.
+    structures = (string, ...) # Every '(...)' in the signature, innermost first.
+    dictionaries = (string, ...) # Every '{...}' in the signature, innermost first."""
+
+    def __init__(self, text):
+        """Initialize an instance of the Signature class."""
+        base = text.lstrip('a')
+        indirection_level = len(text) - len(base)
+        is_array = text[:1] == 'a'
+        is_dictionary = is_array and base[:1] == '{'
+        ends, structures, dictionaries = self.__find_containers(text)
+
+        members = {"text" : text,
+                   "base" : base,
+                   "indirection_level" : indirection_level,
+                   "max_array_dimension" : self.__get_max_run(text, 'a'),
+                   "max_structure_depth" : get_max_container_depth(text, '(', ')'),
+                   "max_dictionary_depth" : get_max_container_depth(text, '{', '}'),
+                   "is_array" : is_array,
+                   "is_structure" : base[:1] == '(',
+                   "is_dictionary" : is_dictionary,
+                   "is_dictionary_array" : is_dictionary and indirection_level > 1,
+                   "is_basic_type" : text in basic_types,
+                   "fields" : tuple(get(f) for f in self.__split(text, ends)),
+                   "structures" : structures,
+                   "dictionaries" : dictionaries}
+
+        self.__dict__.update(members)
+        return
+
+    def __setattr__(self, name, value):
+        raise AttributeError("A Signature can't be changed.")
+
+    def __str__(self):
+        return self.text
+
+    def __get_max_run(self, text, c):
+        """Return the length of the longest run of the character c in text."""
+        return_value = 0
+        run = 0
+
+        for t in text:
+            if t == c:
+                run += 1
+
+                if run > return_value:
+                    return_value = run
+            else:
+                run = 0
+
+        return return_value
+
+    def __find_containers(self, text):
+        """Find every structure and dictionary in text in a single scan.
+
+        Returns (ends, structures, dictionaries). ends is the index just after
+        the end of the container starting at each '(' and '{'. structures and
+        dictionaries are the signatures of the containers of each kind in the
+        order in which they end, each one listed once."""
+        ends = {}
+        starts = {'(' : [], '{' : []}
+        stops = {')' : starts['('], '}' : starts['{']}
+        found = {')' : [], '}' : []}
+
+        for index, c in enumerate(text):
+            if c in starts:
+                starts[c].append(index)
+            elif c in stops and stops[c]:
+                start_index = stops[c].pop()
+                ends[start_index] = index + 1
+                container = text[start_index : index + 1]
+
+                if container not in found[c]:
+                    found[c].append(container)
+
+        return ends, tuple(found[')']), tuple(found['}'])
+
+    def __split(self, text, ends):
+        """Split the container signature text into the signatures of its fields.
+
+        The fields are the types between the first and last characters. Each
+        field is one complete type with any leading 'a's. An unterminated
+        container ends at the end of text."""
+        starts = ('(', '{')
+        return_value = []
+        index = 1
+
+        while index < len(text) - 1:
+            type_index = index
+
+            while type_index < len(text) and text[type_index] == 'a':
+                type_index += 1
+
+            if type_index < len(text) and text[type_index] not in starts:
+                end_index = type_index + 1
+            else:
+                end_index = ends.get(type_index, len(text))
+
+            return_value.append(text[index:end_index])
+            index = end_index
+
+        return return_value
@@ -12,25 +12,32 @@
 # ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION, ARISING OUT OF
 # OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
 
+import hashlib
 import common
 import validate
 import fielddef
+import memberdef
+import namedlist
 
-class StructDef:
+class StructDef(object):
     """Contains the description of a declared structure"""
 
+    __slots__ = ("name", "fields", "__fingerprint", "__flattened")
+
     def __init__(self):
         """Initialize an instance of the StructDef class"""
         self.name = ""
-        self.fields = []
+        self.fields = namedlist.NamedList()
+        self.__fingerprint = None
+        # (memberdef.type_generation, flattened signature)
+        self.__flattened = None
 
         return
 
     def parse(self, xml, lax_naming):
         """Parse the given struct xml element"""
         #print("Parsing Struct '{0}'".format(xml.get('name')))
-        self.name = xml.get('name')
-        validate.type_name(self.name)
+        self.start_parse(xml)
 
         for fieldnode in xml.findall('field'):
             f = fielddef.FieldDef()
@@ -39,20 +46,41 @@ class StructDef:
 
         return
 
+    def start_parse(self, xml):
+        """Prepare to parse the struct xml. Only its attributes are used."""
+        self.__fingerprint = None
+        self.name = xml.get('name')
+        validate.type_name(self.name)
+        return
+
     def add_field(self, xml, field):
-        for f in self.fields:
-            if f.name == field.name:
-                validate.raise_exception(xml,
-                        "Duplicate field name '{0}' not allowed.".format(f.name))
+        if self.fields.get(field.name) is not None:
+            validate.raise_exception(xml,
+                    "Duplicate field name '{0}' not allowed.".format(field.name))
 
         self.fields.append(field)
+        self.__fingerprint = None
+        memberdef.types_changed()
         return
 
     def get_flattened_signature(self):
+        """Return the signature with all [NamedTypes] expanded.
+
+        The result is cached until a named type changes."""
+        cached = self.__flattened
+
+        if cached is not None and cached[0] == memberdef.type_generation:
+            memberdef.flattened_hits += 1
+            return cached[1]
+
+        memberdef.flattened_misses += 1
+
         sig = "("
         for field in self.fields:
             sig += field.get_flattened_signature()
         sig += ")"
+
+        self.__flattened = (memberdef.type_generation, sig)
         return sig
 
     def get_order(self):
@@ -67,6 +95,21 @@ class StructDef:
             description += "        {0}\n".format(str(field))
         return description
 
+    def get_fingerprint(self):
+        """Get a hash of everything compared by __eq__.
+
+        Equal structs have equal fingerprints. It is computed when first needed
+        and is reset when the struct is changed by its parse methods."""
+        if self.__fingerprint is None:
+            h = hashlib.sha1(repr(self.name))
+
+            for f in self.fields:
+                h.update(f.get_fingerprint())
+
+            self.__fingerprint = h.digest()
+
+        return self.__fingerprint
+
     def __eq__(self, other):
         """Compares this struct definition to another and returns true if equal."""
         if not isinstance(other, StructDef):
@@ -42,6 +42,8 @@ except ImportError:
 from .. import config
 from .. import service
 from .. import memberdef
+from .. import naming
+from .. import typemap
 from .. import structdef
 from .. import dictdef
 
@@ -61,6 +63,9 @@ class Executable:
 
         return
 
+# The C types made from the signatures of each interface.
+c_types = typemap.get_type_map("tl")
+
 def hooks():
     """Return the hooks for the AllJoyn Thin Library language binding."""
 
@@ -84,6 +89,11 @@ def __generate_code(command_line, service):
 
     assert(command_line.target_language == "tl")
 
+    c_types.clear()
+
+    # The C symbols are made from the object paths and interface names.
+    naming.NameIndex(service, "coded", "coded")
+
     temp = CommonClientService_H()
     make_target_file(temp, "CommonClientService.h", command_line, service)
 
@@ -547,7 +557,8 @@ def get_service_property_handlers_table(object_index, aj_object, interface):
     h_format = "{0:40} {1} NULL"
 
     for p in interface.properties:
-        name = app_name_format.format(object_index, iface_index, p.name)
+        name = naming.format_identifier(app_name_format, object_index,
+                                        iface_index, p.name)
         d = name_comma_format.format(name)
         h_name = __get_property_handler_name(object_index, interface, p)
         h = name_comma_format.format(h_name)
@@ -568,18 +579,21 @@ def get_service_property_get_set_entries(service):
     h_format = "{0} {1} {2}"
 
     object_paths = service.get_objects()
+    summary = service.get_summary()
 
     for o in object_paths:
-        if o.has_properties():
+        if summary.get_object(o).has_properties:
             iface_index = len(o.interfaces)
-            name = app_name_format.format(o.index, iface_index, "AJ_PROP_GET")
+            name = naming.format_identifier(app_name_format, o.index,
+                                            iface_index, "AJ_PROP_GET")
             d = name_comma_format.format(name)
             h = name_comma_format.format("PropGetHandler")
             context = prop_handler_format.format(o.get_full_coded_name())
             entry = h_format.format(d, h, context)
             return_value.append(entry)
 
-            name = app_name_format.format(o.index, iface_index, "AJ_PROP_SET")
+            name = naming.format_identifier(app_name_format, o.index,
+                                            iface_index, "AJ_PROP_SET")
             d = name_comma_format.format(name)
             h = name_comma_format.format("PropSetHandler")
             context = prop_handler_format.format(o.get_full_coded_name())
@@ -598,11 +612,13 @@ def get_client_property_get_entries(service):
     h_format = "{0} {1} {2}"
 
     object_paths = service.get_objects()
+    summary = service.get_summary()
 
     for o in object_paths:
-        if o.has_properties():
+        if summary.get_object(o).has_properties:
             iface_index = len(o.interfaces)
-            name = proxy_name_format.format(o.index, iface_index, "AJ_PROP_GET")
+            name = naming.format_identifier(proxy_name_format, o.index,
+                                            iface_index, "AJ_PROP_GET")
             d = name_comma_format.format(name)
             h = name_comma_format.format("PropGetHandler")
             context = prop_handler_format.format(o.get_full_coded_name())
@@ -628,7 +644,8 @@ def get_message_handlers_table(service):
 
         for i in o.interfaces:
             for m in i.methods:
-                name = app_name_format.format(path_index, iface_index, m.name)
+                name = naming.format_identifier(app_name_format, path_index,
+                                                iface_index, m.name)
                 d = name_comma_format.format(name)
                 h_name = __get_method_handler_name(path_index, i, m)
                 entry = h_format.format(d, h_name)
@@ -656,7 +673,8 @@ def get_interface_components(interface, aj_object, iface_index, client_side):
 
     for m in interface.methods:
         if make_defines:
-            define = d_format.format(path_index, iface_index, m.name)
+            define = naming.format_identifier(d_format, path_index,
+                                              iface_index, m.name)
             switch = r_format.format(define)
 
         name = __get_method_handler_name(path_index, interface, m)
@@ -672,7 +690,8 @@ def get_interface_components(interface, aj_object, iface_index, client_side):
 
     for s in interface.signals:
         if make_defines:
-            define = d_format.format(path_index, iface_index, s.name)
+            define = naming.format_identifier(d_format, path_index,
+                                              iface_index, s.name)
 
         name = __get_signal_handler_name(path_index, interface, s)
 
@@ -689,17 +708,20 @@ def get_interface_components(interface, aj_object, iface_index, client_side):
 
     for p in interface.properties:
         if make_defines:
-            define = d_format.format(path_index, iface_index, p.name)
+            define = naming.format_identifier(d_format, path_index,
+                                              iface_index, p.name)
             switch = r_format.format(define)
 
         name = __get_property_handler_name(path_index, interface, p)
         comp = InterfaceComponent(define, switch, name, "prop", p.no_reply)
         comp.prop = p
         comp.xml_name = p.name
-        comp.prop_get_define = proxy_name_format.format(path_index,
+        comp.prop_get_define = naming.format_identifier(proxy_name_format,
+                                                        path_index,
                                                         properties_iface_index,
                                                         "AJ_PROP_GET")
-        comp.prop_set_define = proxy_name_format.format(path_index,
+        comp.prop_set_define = naming.format_identifier(proxy_name_format,
+                                                        path_index,
                                                         properties_iface_index,
                                                         "AJ_PROP_SET")
         comp.input_arg_info = ArgInfo(p.args, "in")
@@ -713,20 +735,23 @@ def get_message_defines_names(service):
     """Get all the defines and names for the objects, interfaces, methods, etc."""
     return_value = []
     object_paths = service.get_objects()
+    summary = service.get_summary()
 
     for o in object_paths:
         iface_index = 0
         need_prop_define = True
 
         for i in o.interfaces:
+            has_read_properties = summary.get_interface(i).has_read_properties
+            include_prop = need_prop_define and has_read_properties
             return_value += __get_client_switch_entries(i, o, iface_index,
-                                                        need_prop_define)
+                                                        include_prop)
             iface_index += 1
 
             # There must only be one define for each object that has
             # readable properties in one or more of it's interfaces. So don't
             # request property defines if we already have one for this object.
-            if i.has_read_properties():
+            if has_read_properties:
                 need_prop_define = False
 
     return return_value
@@ -768,14 +793,16 @@ def get_defines(interface, client_side):
 
         member_index = 0
         for m in interface.methods:
-            name = name_format.format(path_index, iface_index, m.name)
+            name = naming.format_identifier(name_format, path_index,
+                                            iface_index, m.name)
             mess = d_format.format(name, id_type, path_index,
                                 iface_index, member_index)
             return_value.append(mess)
             member_index += 1
 
         for s in interface.signals:
-            name = name_format.format(path_index, iface_index, s.name)
+            name = naming.format_identifier(name_format, path_index,
+                                            iface_index, s.name)
             mess = d_format.format(name, id_type, path_index,
                                 iface_index, member_index)
             return_value.append(mess)
@@ -787,7 +814,8 @@ def get_defines(interface, client_side):
             id_type = "AJ_APP_PROPERTY_ID"
 
         for p in interface.properties:
-            name = name_format.format(path_index, iface_index, p.name)
+            name = naming.format_identifier(name_format, path_index,
+                                            iface_index, p.name)
             mess = d_format.format(name, id_type, path_index,
                                 iface_index, member_index)
             return_value.append(mess)
@@ -804,12 +832,14 @@ def get_defines(interface, client_side):
             prop_comment = "/* All objects that use properties need these. */"
             return_value.append(prop_comment)
             get_name = "AJ_PROP_GET"
-            name = name_format.format(path_index, iface_index, get_name)
+            name = naming.format_identifier(name_format, path_index,
+                                            iface_index, get_name)
             mess = d_format.format(name, id_type, path_index, iface_index, get_name)
             return_value.append(mess)
 
             set_name = "AJ_PROP_SET"
-            name = name_format.format(path_index, iface_index, set_name)
+            name = naming.format_identifier(name_format, path_index,
+                                            iface_index, set_name)
             mess = d_format.format(name, id_type, path_index, iface_index, set_name)
             return_value.append(mess)
             return_value.append("")
@@ -835,11 +865,12 @@ def get_all_interface_coded_names(aj_object):
     return return_value
 
 def get_interface_coded_name(interface):
-    return "Iface{0}".format(interface.get_full_coded_name())
+    name = interface.get_full_coded_name()
+    return naming.format_identifier("Iface{0}", name)
 
 def get_interface_set_name(aj_object):
-    name = "g_IfaceSet{0}".format(aj_object.get_full_name())
-    return str.replace(name, "/", "_")
+    name = aj_object.get_full_coded_name()
+    return naming.format_identifier("g_IfaceSet{0}", name)
 
 def get_complete_name(aj_object, interface, component):
     if component.input_arg_info is not None and\
@@ -860,6 +891,13 @@ def get_base_c_type(member):
 
 def __get_c_type(interface, signature):
     """Get the 'C' type corresponding to this signature or None if not found."""
+    if signature in type_dictionary:
+        return type_dictionary[signature]
+
+    # Named types are looked up in the interface so are made once.
+    return c_types.get("c", interface, signature, __make_c_type)
+
+def __make_c_type(interface, signature):
     t = None
     if signature in type_dictionary:
         t = type_dictionary[signature]
@@ -886,6 +924,13 @@ def get_scaler_member(argdef):
 
 def make_member_from_memberdef(interface, member):
     """transform a single member definition into it's C declaration equivalent"""
+    if member.interface is not interface:
+        return __make_member_declaration(interface, member)
+
+    make = lambda i, signature, name: __make_member_declaration(i, member)
+    return c_types.get("member", interface, member.arg_type, make, member.name)
+
+def __make_member_declaration(interface, member):
     indirection_level = member.get_indirection_level()
     c_type = get_base_c_type(member)
     # some arcane manipulations are needed to patch this up
@@ -998,17 +1043,20 @@ element of the array being initialized."""
 def __get_method_handler_name(path_index, interface, m):
     f = "{0}{1:_>2}_Meth{2}"
 
-    return f.format(get_interface_coded_name(interface), path_index, m.name)
+    return naming.format_identifier(f, get_interface_coded_name(interface),
+                                    path_index, m.name)
 
 def __get_signal_handler_name(path_index, interface, s):
     f = "{0}{1:_>2}_Sig{2}"
 
-    return f.format(get_interface_coded_name(interface), path_index, s.name)
+    return naming.format_identifier(f, get_interface_coded_name(interface),
+                                    path_index, s.name)
 
 def __get_property_handler_name(path_index, interface, p):
     f = "{0}{1:_>2}_Prop{2}"
 
-    return f.format(get_interface_coded_name(interface), path_index, p.name)
+    return naming.format_identifier(f, get_interface_coded_name(interface),
+                                    path_index, p.name)
 
 def __get_client_switch_entries(interface, aj_object, iface_index, include_prop):
     return_value = []
@@ -1021,7 +1069,8 @@ def __get_client_switch_entries(interface, aj_object, iface_index, include_prop)
     switch = None
 
     for m in interface.methods:
-        define = d_format.format(path_index, iface_index, m.name)
+        define = naming.format_identifier(d_format, path_index,
+                                          iface_index, m.name)
         switch = r_format.format(define)
 
         name = __get_method_handler_name(path_index, interface, m)
@@ -1036,7 +1085,8 @@ def __get_client_switch_entries(interface, aj_object, iface_index, include_prop)
         return_value.append(comp)
 
     for s in interface.signals:
-        define = d_format.format(path_index, iface_index, s.name)
+        define = naming.format_identifier(d_format, path_index,
+                                          iface_index, s.name)
 
         name = __get_signal_handler_name(path_index, interface, s)
 
@@ -1051,8 +1101,10 @@ def __get_client_switch_entries(interface, aj_object, iface_index, include_prop)
 
     properties_iface_index = len(aj_object.interfaces)
 
-    if include_prop and interface.has_read_properties():
-        define = d_format.format(path_index, properties_iface_index, "AJ_PROP_GET")
+    # include_prop is only True if the interface has readable properties.
+    if include_prop:
+        define = naming.format_identifier(d_format, path_index,
+                                          properties_iface_index, "AJ_PROP_GET")
         switch = r_format.format(define)
 
         name = "PropGetHandler"
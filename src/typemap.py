@@ -0,0 +1,89 @@
+# Copyright AllSeen Alliance. All rights reserved.
+#
+# Permission to use, copy, modify, and/or distribute this software for any
+# purpose with or without fee is hereby granted, provided that the above
+# copyright notice and this permission notice appear in all copies.
+#
+# THE SOFTWARE IS PROVIDED "AS IS" AND THE AUTHOR DISCLAIMS ALL WARRANTIES
+# WITH REGARD TO THIS SOFTWARE INCLUDING ALL IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR
+# ANY SPECIAL, DIRECT, INDIRECT, OR CONSEQUENTIAL DAMAGES OR ANY DAMAGES
+# WHATSOEVER RESULTING FROM LOSS OF USE, DATA OR PROFITS, WHETHER IN AN
+# ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION, ARISING OUT OF
+# OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
+
+import memberdef
+
+# The TypeMap of each target. See get_type_map().
+type_maps = {}
+
+def get_type_map(target):
+    """Get the TypeMap of this target, making it if needed."""
+    return_value = type_maps.get(target)
+
+    if return_value is None:
+        return_value = TypeMap(target)
+        type_maps[target] = return_value
+
+    return return_value
+
+class TypeMap:
+    """A cache of the native types a target makes from signatures.
+
+    Each type is made once for each kind, interface, signature and any other
+    arguments it depends on, then shared by all of the templates. A type is
+    made again if the named types have changed or if another interface with
+    the same name is used. The members are:
+
+    target = string # The target language.
+    hits = int      # The number of types found in the cache.
+    misses = int    # The number of types made."""
+
+    def __init__(self, target):
+        """Initialize an instance of the TypeMap class."""
+        self.target = target
+        self.hits = 0
+        self.misses = 0
+        self.__types = {}
+        return
+
+    def get(self, kind, interface, signature, make, *args):
+        """Get the type of this kind for the signature in the interface.
+
+        If it isn't cached the type is make(interface, signature, *args).
+        args must be hashable and must include everything else the type
+        depends on."""
+        if interface is None:
+            name = None
+        else:
+            name = interface.interface_full_name
+
+        if type(signature) is str:
+            signature = intern(signature)
+
+        key = (kind, name, signature, args)
+        entry = self.__types.get(key)
+
+        if (entry is not None and entry[0] is interface and
+            entry[1] == memberdef.type_generation):
+            self.hits += 1
+            return entry[2]
+
+        self.misses += 1
+        return_value = make(interface, signature, *args)
+        self.__types[key] = (interface, memberdef.type_generation, return_value)
+        return return_value
+
+    def get_hit_rate(self):
+        """Return the fraction of types found in the cache."""
+        total = self.hits + self.misses
+
+        if total == 0:
+            return 0.0
+
+        return float(self.hits) / total
+
+    def clear(self):
+        """Forget all the types made. The counters are kept."""
+        self.__types.clear()
+        return
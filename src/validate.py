@@ -12,8 +12,7 @@
 # ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION, ARISING OUT OF
 # OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
 
-from xml.etree import ElementTree
-import string
+from xml.sax import saxutils
 import re
 
 class ValidateException(Exception):
@@ -21,10 +20,40 @@ class ValidateException(Exception):
 
 max_name_length = 255
 
+# The maximum length of the xml shown with an error or warning.
+max_excerpt_length = 160
+
+# If False warnings are neither formatted nor printed. Set by --no-warnings.
+report_warnings = True
+
+# The patterns of the valid names of each kind. An element, such as one part
+# of an interface name, is ASCII letters, digits and '_' and doesn't begin
+# with a digit. Hyphens are only rejected by some of the validators.
+name_patterns = {
+    "interface" : re.compile(r"[A-Za-z_][A-Za-z0-9_]*(?:\.[A-Za-z_][A-Za-z0-9_]*)+\Z"),
+    "member" : re.compile(r"[A-Za-z_][A-Za-z0-9_]*\Z"),
+    "type" : re.compile(r"[A-Za-z_-][A-Za-z0-9_-]*\Z"),
+    "path" : re.compile(r"/\Z|(?:/[A-Za-z0-9_]+)+\Z"),
+    }
+
+element_pattern = re.compile(r"(?:[A-Za-z_-][A-Za-z0-9_-]*)?\Z")
+invalid_path_character_pattern = re.compile(r"[^A-Za-z0-9_]")
+
+# The (kind, name) of the names already accepted by the name validators. It
+# is emptied when it reaches max_accepted_names so it can't grow without
+# limit.
+accepted_names = set()
+max_accepted_names = 8192
+
 def raise_exception(xml, message):
     message = get_xml_error(xml, message)
     raise ValidateException(message)
 
+def check_not_frozen(item, description):
+    """Raise a ValidateException if item was made read-only by Service.freeze()."""
+    if item.frozen:
+        raise ValidateException("{0} is frozen and can't be changed.".format(description))
+
 # Validator methods for many objects.
 #
 # The following validators are implemented:
@@ -44,11 +73,18 @@ def raise_exception(xml, message):
 def alljoyn_data(service, target):
     """Validates the AllJoyn service data.
 
+    Every interface is elaborated first. See Interface.elaborate().
     Throws a ValidateException on an error."""
 
     if service.alljoyn_object is None:
         raise ValidateException("No root node found.")
 
+    if service.parse_filter is not None and not service.interfaces:
+        raise ValidateException("No interfaces match the object and interface filters.")
+
+    for key in sorted(service.interfaces):
+        service.interfaces[key].elaborate()
+
     __validate_aj_object(service.alljoyn_object)
 
     if target == "tl":
@@ -127,6 +163,9 @@ def data_signature(signature, xml = None):
 
 def type_name(name, xml = None):
     """Validates the name of a named type."""
+    if __is_accepted("type", name):
+        return
+
     if name is None or len(name) == 0:
         error = "Named types must have a name."
         error = get_xml_error(xml, error)
@@ -285,6 +324,9 @@ def bus_object_path(name, xml = None):
     # Multiple '/' characters cannot occur in sequence.
     # A trailing '/' character is not allowed unless the path is the root
     # path (a single '/' character).
+    if __is_accepted("path", name, False):
+        return
+
     if name is None or len(name) == 0:
         error = "Bus object name is required."
         error = get_xml_error(xml, error)
@@ -307,7 +349,6 @@ def bus_object_path(name, xml = None):
         error = get_xml_error(xml, error)
         raise ValidateException(error)
 
-    valid_chars = "{0}{1}_".format(string.digits, string.ascii_letters)
     ex_format = "'{0}' is an invalid character."
     elements = name.split('/')
 
@@ -319,12 +360,15 @@ def bus_object_path(name, xml = None):
             error = get_xml_error(xml, error)
             raise ValidateException(error)
 
-        for c in e:
-            if string.find(valid_chars, c) == -1:
-                explanation = ex_format.format(c)
-                error = error_format.format(name, explanation)
-                error = get_xml_error(xml, error)
-                raise ValidateException(error)
+        invalid = invalid_path_character_pattern.search(e)
+
+        if invalid is not None:
+            explanation = ex_format.format(invalid.group())
+            error = error_format.format(name, explanation)
+            error = get_xml_error(xml, error)
+            raise ValidateException(error)
+
+    return
 
 def well_known_name(name):
     """Validates a well-known name.
@@ -339,6 +383,9 @@ def interface_name(name, xml = None):
     """Validates an interface name.
 
     Throws a ValidateException on invalid name."""
+    if __is_accepted("interface", name):
+        return
+
     if name is None:
         error = "Interface name is required."
         error = get_xml_error(xml, error)
@@ -358,6 +405,9 @@ def arg_name(name, xml = None):
 
     Argument name restrictions are the same as member names.
     Throws a ValidateException on invalid name."""
+    if __is_accepted("member", name):
+        return
+
     if name is None or len(name) == 0:
         error = "An argument name is required or the use of the '-l' option."
         error = get_xml_error(xml, error)
@@ -379,6 +429,9 @@ def member_name(name, xml = None):
     """Validates a member (method or signal) name.
 
     Throws a ValidateException on invalid name."""
+    if __is_accepted("member", name):
+        return
+
     if name is None or len(name) == 0:
         error = "A member name is required."
         error = get_xml_error(xml, error)
@@ -395,6 +448,28 @@ def member_name(name, xml = None):
     # Member name restrictions are essentially the same as an element name.
     __element_test(name, "member", xml)
 
+def __is_accepted(kind, name, limit_length = True):
+    """Return True if name is a valid name of this kind.
+
+    Names already accepted are found in accepted_names. Otherwise the name is
+    matched with the pattern of its kind. If False the name may still be
+    valid so the validator must test it step by step to report the error."""
+    key = (kind, name)
+
+    if key in accepted_names:
+        return True
+
+    if (name is None or
+        limit_length and len(name) > max_name_length or
+        name_patterns[kind].match(name) is None):
+        return False
+
+    if len(accepted_names) >= max_accepted_names:
+        accepted_names.clear()
+
+    accepted_names.add(key)
+    return True
+
 def __common_name_tests(name, xml = None):
     """Do tests common to all names."""
     __name_length_check(name, xml)
@@ -404,16 +479,48 @@ def __common_name_tests(name, xml = None):
 def get_xml_error(xml, message):
     """Returns a string for error reporting using the xml and a message.
 
-    If xml is None then just returns message."""
+    The location of the xml in its file is given if it is known along with
+    the start tag of the xml. If xml is None then just returns message."""
 
     if xml is not None:
-        s = ElementTree.tostring(xml)
-        return_value = "{0}\nFound here:\n{1}".format(message, s)
+        s = __get_xml_excerpt(xml)
+        location = getattr(xml, "location", None)
+
+        if location is not None:
+            f = "{0}\nFound here: {1}:{2}:{3}\n{4}"
+            return_value = f.format(message, location[0], location[1],
+                                    location[2], s)
+        else:
+            return_value = "{0}\nFound here:\n{1}".format(message, s)
     else:
         return_value = message
 
     return return_value
 
+def warning(xml, message, *args):
+    """Print a warning about the xml.
+
+    message is formatted with args only when the warning is reported so
+    that warnings cost nothing when report_warnings is False."""
+    if report_warnings:
+        if args:
+            message = message.format(*args)
+
+        print(get_xml_error(xml, message))
+
+    return
+
+def __get_xml_excerpt(xml):
+    """Get the start tag of the xml limited to max_excerpt_length."""
+    attributes = ["{0}={1}".format(k, saxutils.quoteattr(v))
+                  for k, v in sorted(xml.items())]
+    return_value = "<{0}>".format(" ".join([xml.tag] + attributes))
+
+    if len(return_value) > max_excerpt_length:
+        return_value = return_value[:max_excerpt_length - 5] + " ...>"
+
+    return return_value
+
 def __name_length_check(name, xml):
     """Test for maximum length."""
     length = len(name)
@@ -462,20 +569,12 @@ def __element_test(e, name_type, xml):
 Each {0} must only contain the ASCII characters "[A-Z][a-z][0-9]_" and must
 not begin with a digit."""
 
-    for c in e:
-        if string.find(string.digits, e[0]) != -1:
-            error = error_format.format(name_type, e)
-            error = get_xml_error(xml, error)
-            raise ValidateException(error)
-
-        # Underscores are valid and hyphens are handled elsewhere.
-        if (c != '_' and c != '-' and
-            string.find(string.ascii_letters, c) == -1 and
-            string.find(string.digits, c) == -1):
+    # Underscores are valid and hyphens are handled elsewhere.
+    if element_pattern.match(e) is None:
+        error = error_format.format(name_type, e)
+        error = get_xml_error(xml, error)
+        raise ValidateException(error)
 
-            error = error_format.format(name_type, e)
-            error = get_xml_error(xml, error)
-            raise ValidateException(error)
     return
 
 def __validate_aj_object(node):
@@ -485,13 +584,10 @@ def __validate_aj_object(node):
     Each subnode is also checked for validity.
     Throws a ValidateException on an error."""
 
-    if len(node.alljoyn_objects) == 0 and len(node.interfaces) == 0:
-        mess = "Node '{0}' is empty.".format(node.name)
-        raise ValidateException(mess)
-
-    for key in sorted(node.alljoyn_objects):
-        n = node.alljoyn_objects[key]
-        __validate_aj_object(n)
+    for n, full_name, depth in node.walk():
+        if len(n.alljoyn_objects) == 0 and len(n.interfaces) == 0:
+            mess = "Node '{0}' is empty.".format(n.name)
+            raise ValidateException(mess)
 
     return
 
@@ -538,6 +634,10 @@ def __thin_library_service(service):
     for k in sorted(service.interfaces):
         i = service.interfaces[k]
 
+        # These were checked when the catalogue was written.
+        if i.from_catalogue:
+            continue
+
         for m in i.methods:
             __search_for_multidimension_array(m.args)
             __search_for_tl_arg_keywords(m.args)
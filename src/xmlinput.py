@@ -0,0 +1,168 @@
+# Copyright AllSeen Alliance. All rights reserved.
+#
+# Permission to use, copy, modify, and/or distribute this software for any
+# purpose with or without fee is hereby granted, provided that the above
+# copyright notice and this permission notice appear in all copies.
+#
+# THE SOFTWARE IS PROVIDED "AS IS" AND THE AUTHOR DISCLAIMS ALL WARRANTIES
+# WITH REGARD TO THIS SOFTWARE INCLUDING ALL IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR
+# ANY SPECIAL, DIRECT, INDIRECT, OR CONSEQUENTIAL DAMAGES OR ANY DAMAGES
+# WHATSOEVER RESULTING FROM LOSS OF USE, DATA OR PROFITS, WHETHER IN AN
+# ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION, ARISING OUT OF
+# OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
+
+import sys
+import zlib
+
+try:
+    import bz2
+except ImportError:
+    bz2 = None
+
+try:
+    import lzma
+except ImportError:
+    try:
+        from backports import lzma
+    except ImportError:
+        lzma = None
+
+# The xml input name which means the standard input.
+stdin_name = "-"
+
+# The name used for the standard input in the generated code.
+stdin_display_name = "stdin"
+
+# The suffixes of the xml files found when searching directories.
+xml_suffixes = (".xml", ".xml.gz", ".xml.bz2", ".xml.xz")
+
+# The number of bytes needed to recognize a compressed input.
+magic_length = 6
+
+def open_input(filename):
+    """Open the xml input filename for reading.
+
+    filename may be stdin_name to read the standard input. Input compressed
+    with gzip, bzip2 or xz is recognized by its first bytes and decompressed
+    as it is read. Nothing is written to a temporary file or read completely
+    into memory. xz needs the lzma (or backports.lzma) module.
+
+    Returns a file like object with read() and close()."""
+    if filename == stdin_name:
+        source = sys.stdin
+        is_stdin = True
+    else:
+        source = open(filename, "rb")
+        is_stdin = False
+
+    try:
+        magic = source.read(magic_length)
+        decompressor = __get_decompressor(magic)
+    except:
+        if not is_stdin:
+            source.close()
+        raise
+
+    if decompressor is None and not is_stdin:
+        # A plain file is read directly.
+        source.seek(0)
+        return source
+
+    return DecompressingReader(source, decompressor, magic, not is_stdin)
+
+def get_display_name(filename):
+    """Get the name of the xml input filename used in the generated code."""
+    if filename == stdin_name:
+        return stdin_display_name
+
+    return filename
+
+def __get_decompressor(magic):
+    """Get a decompressor for the input which starts with magic or None."""
+    if magic.startswith("\x1f\x8b"):
+        # Tell zlib to expect a gzip header and trailer.
+        return zlib.decompressobj(16 + zlib.MAX_WBITS)
+
+    if magic.startswith("BZh"):
+        if bz2 is None:
+            raise IOError("The bz2 module is needed to read bzip2 input.")
+        return bz2.BZ2Decompressor()
+
+    if magic.startswith("\xfd7zXZ\x00"):
+        if lzma is None:
+            raise IOError("The lzma module is needed to read xz input.")
+        return lzma.LZMADecompressor()
+
+    return None
+
+class DecompressingReader:
+    """A file like object which decompresses another file as it is read.
+
+    data is any input already read from source. If decompressor is None the
+    input is returned unchanged. source is only closed by close() if
+    close_source is True."""
+
+    # The number of bytes read from the source at a time.
+    block_size = 64 * 1024
+
+    def __init__(self, source, decompressor, data = "", close_source = True):
+        """Initialize an instance of the DecompressingReader class."""
+        self.source = source
+        self.decompressor = decompressor
+        self.close_source = close_source
+        self.at_end = False
+        self.buffer = self.__decompress(data)
+        self.offset = 0
+        return
+
+    def read(self, size = -1):
+        """Read at most size decompressed bytes or all of them if size < 0.
+
+        The bytes before offset in buffer have already been read. They are
+        only removed when more data is added or all of buffer has been read,
+        so that small reads don't copy the rest of buffer each time."""
+        available = len(self.buffer) - self.offset
+        blocks = []
+
+        while not self.at_end and (size < 0 or available < size):
+            data = self.source.read(self.block_size)
+
+            if data:
+                data = self.__decompress(data)
+            else:
+                self.at_end = True
+
+                if hasattr(self.decompressor, "flush"):
+                    data = self.decompressor.flush()
+
+            blocks.append(data)
+            available += len(data)
+
+        if blocks:
+            blocks.insert(0, self.buffer[self.offset:])
+            self.buffer = "".join(blocks)
+            self.offset = 0
+
+        if size < 0 or size >= available:
+            return_value = self.buffer[self.offset:]
+            self.buffer = ""
+            self.offset = 0
+        else:
+            return_value = self.buffer[self.offset:self.offset + size]
+            self.offset += size
+
+        return return_value
+
+    def close(self):
+        """Close the source if it is owned by this reader."""
+        if self.close_source:
+            self.source.close()
+
+        return
+
+    def __decompress(self, data):
+        if self.decompressor is None or not data:
+            return data
+
+        return self.decompressor.decompress(data)
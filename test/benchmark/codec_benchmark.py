@@ -0,0 +1,106 @@
+# Copyright AllSeen Alliance. All rights reserved.
+#
+# Permission to use, copy, modify, and/or distribute this software for any
+# purpose with or without fee is hereby granted, provided that the above
+# copyright notice and this permission notice appear in all copies.
+#
+# THE SOFTWARE IS PROVIDED "AS IS" AND THE AUTHOR DISCLAIMS ALL WARRANTIES
+# WITH REGARD TO THIS SOFTWARE INCLUDING ALL IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR
+# ANY SPECIAL, DIRECT, INDIRECT, OR CONSEQUENTIAL DAMAGES OR ANY DAMAGES
+# WHATSOEVER RESULTING FROM LOSS OF USE, DATA OR PROFITS, WHETHER IN AN
+# ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION, ARISING OUT OF
+# OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
+
+"""Compares the encoding of a service by modelcodec with pickle.
+
+Run from this directory with the code generator on the PYTHONPATH as for the
+unit tests:
+
+    python codec_benchmark.py [member_count]
+
+The service of memory_benchmark.py with member_count members is encoded and
+decoded both ways. The size, the time to encode, the time to decode all of
+it and the time to decode a single interface are reported."""
+
+import sys
+import time
+import shutil
+import tempfile
+import cPickle as pickle
+
+import AllJoynCodeGen.config as config
+import AllJoynCodeGen.codegen as codegen
+import AllJoynCodeGen.parseajxml as parseajxml
+import AllJoynCodeGen.validate as validate
+import AllJoynCodeGen.modelcodec as modelcodec
+
+import memory_benchmark
+
+def best_time(function, *args):
+    """Return the best time of 3 calls of function and its last result."""
+    best = None
+
+    for n in range(3):
+        start = time.time()
+        result = function(*args)
+        elapsed = time.time() - start
+
+        if best is None or elapsed < best:
+            best = elapsed
+
+    return best, result
+
+def pickle_interface(data, name):
+    """Unpickle the service and return one interface as pickle must."""
+    return pickle.loads(data).interfaces[name]
+
+def decode_interface(data, name):
+    return modelcodec.ModelReader(data).get_interface(name)
+
+def main():
+    member_count = 50000
+
+    if len(sys.argv) > 1:
+        member_count = int(sys.argv[1])
+
+    interface_count = max(1, member_count // memory_benchmark.members_per_interface)
+    path = tempfile.mkdtemp()
+
+    try:
+        filename = memory_benchmark.make_xml_file(path, interface_count)
+
+        sys.argv = ["codec_benchmark.py", "-tandroid", "-wTest.Foo", filename]
+        c = config.Config()
+        codegen.register_targets(c)
+        c.parse()
+
+        p = parseajxml.ParseAjXml(filename, "sax")
+        service = p.parse(c.command_line)
+        validate.alljoyn_data(service, "android")
+        service.analyze()
+        service.freeze()
+    finally:
+        shutil.rmtree(path)
+
+    name = sorted(service.interfaces)[interface_count // 2]
+
+    pickle_encode, pickled = best_time(pickle.dumps, service, pickle.HIGHEST_PROTOCOL)
+    pickle_decode, unused = best_time(pickle.loads, pickled)
+    pickle_one, unused = best_time(pickle_interface, pickled, name)
+
+    codec_encode, encoded = best_time(modelcodec.encode, service)
+    codec_decode, unused = best_time(modelcodec.decode, encoded)
+    codec_one, unused = best_time(decode_interface, encoded, name)
+
+    print("{0} members in {1} interfaces.".format(
+          interface_count * memory_benchmark.members_per_interface, interface_count))
+    f = "  {0:7} {1:6.2f} MB  encode {2:6.3f} s  decode {3:6.3f} s  one interface {4:6.3f} s"
+    print(f.format("pickle", len(pickled) / (1024.0 * 1024.0),
+                   pickle_encode, pickle_decode, pickle_one))
+    print(f.format("codec", len(encoded) / (1024.0 * 1024.0),
+                   codec_encode, codec_decode, codec_one))
+    return
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,87 @@
+# Copyright AllSeen Alliance. All rights reserved.
+#
+# Permission to use, copy, modify, and/or distribute this software for any
+# purpose with or without fee is hereby granted, provided that the above
+# copyright notice and this permission notice appear in all copies.
+#
+# THE SOFTWARE IS PROVIDED "AS IS" AND THE AUTHOR DISCLAIMS ALL WARRANTIES
+# WITH REGARD TO THIS SOFTWARE INCLUDING ALL IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR
+# ANY SPECIAL, DIRECT, INDIRECT, OR CONSEQUENTIAL DAMAGES OR ANY DAMAGES
+# WHATSOEVER RESULTING FROM LOSS OF USE, DATA OR PROFITS, WHETHER IN AN
+# ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION, ARISING OUT OF
+# OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
+
+"""Times AllJoynObject.get_interface_index() as the objects grow.
+
+Run from this directory with the code generator on the PYTHONPATH as for the
+unit tests:
+
+    python interface_index_benchmark.py [largest_count]
+
+Services are built with 10 objects which each implement count interfaces of
+count methods, for count doubling up to largest_count. The index of every
+interface in every object is looked up as the Thin Library templates do. The
+time per lookup should not grow with count."""
+
+import sys
+import time
+from xml.etree import ElementTree
+
+import AllJoynCodeGen.service as service
+
+object_count = 10
+
+def make_xml(count):
+    """Return the xml of a service with count interfaces of count methods."""
+    methods = "".join(['<method name="Method{0}"><arg name="a" type="i" direction="in"/></method>'.format(m)
+                       for m in range(count)])
+    interfaces = "".join(['<interface name="org.example.Index{0}">{1}</interface>'.format(i, methods)
+                          for i in range(count)])
+    parts = ['<node name="/org/example">']
+
+    for o in range(object_count):
+        parts.append('<node name="Object{0}">{1}</node>'.format(o, interfaces))
+
+    parts.append('</node>')
+    return "".join(parts)
+
+def time_lookups(count):
+    """Print the time taken to look up every interface in every object."""
+    root = ElementTree.fromstring(make_xml(count))
+    s = service.Service(root.get("name"))
+    s.parse(root, False)
+
+    lookups = 0
+    start = time.time()
+
+    for key in sorted(s.interfaces):
+        i = s.interfaces[key]
+
+        for o in i.parents:
+            o.get_interface_index(i)
+            lookups += 1
+
+    elapsed = time.time() - start
+    per_lookup = elapsed * 1000000.0 / lookups
+
+    f = "  {0:5} interfaces of {0:5} methods  {1:7} lookups  {2:7.3f} s  {3:7.3f} us per lookup"
+    print(f.format(count, lookups, elapsed, per_lookup))
+    return
+
+def main():
+    largest_count = 256
+
+    if len(sys.argv) > 1:
+        largest_count = int(sys.argv[1])
+
+    count = 8
+
+    while count <= largest_count:
+        time_lookups(count)
+        count *= 2
+
+    return
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,129 @@
+# Copyright AllSeen Alliance. All rights reserved.
+#
+# Permission to use, copy, modify, and/or distribute this software for any
+# purpose with or without fee is hereby granted, provided that the above
+# copyright notice and this permission notice appear in all copies.
+#
+# THE SOFTWARE IS PROVIDED "AS IS" AND THE AUTHOR DISCLAIMS ALL WARRANTIES
+# WITH REGARD TO THIS SOFTWARE INCLUDING ALL IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR
+# ANY SPECIAL, DIRECT, INDIRECT, OR CONSEQUENTIAL DAMAGES OR ANY DAMAGES
+# WHATSOEVER RESULTING FROM LOSS OF USE, DATA OR PROFITS, WHETHER IN AN
+# ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION, ARISING OUT OF
+# OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
+
+"""Measures the memory used by the model of a service with many members.
+
+Run from this directory with the code generator on the PYTHONPATH as for the
+unit tests:
+
+    python memory_benchmark.py [member_count]
+
+A file with member_count methods, signals, properties and arguments in all
+is generated and parsed with the sax parser so that no xml tree is kept. The
+growth of the resident memory of the process is reported."""
+
+import os
+import gc
+import sys
+import time
+import shutil
+import tempfile
+
+import AllJoynCodeGen.config as config
+import AllJoynCodeGen.codegen as codegen
+import AllJoynCodeGen.parseajxml as parseajxml
+import AllJoynCodeGen.validate as validate
+
+interface_format = """  <node name="Object{0}">
+    <interface name="org.example.Memory{0}">
+      <struct name="Point">
+        <field name="x" type="i"/>
+        <field name="y" type="i"/>
+      </struct>
+      <dict name="Table">
+        <key type="s"/>
+        <value type="[Point]"/>
+      </dict>
+      <method name="Move">
+        <arg name="from" type="[Point]" direction="in"/>
+        <arg name="to" type="[Point]" direction="in"/>
+        <arg name="distance" type="d" direction="out"/>
+      </method>
+      <method name="Lookup">
+        <arg name="names" type="as" direction="in"/>
+        <arg name="table" type="[Table]" direction="out"/>
+      </method>
+      <signal name="Moved">
+        <arg name="position" type="[Point]"/>
+        <arg name="when" type="t"/>
+      </signal>
+      <property name="Name" type="s" access="readwrite"/>
+    </interface>
+  </node>
+"""
+
+# The members of each interface: 2 fields, the key and the value, 2 methods
+# with 5 arguments, 1 signal with 2 arguments and 1 property with 1 argument.
+members_per_interface = 16
+
+def make_xml_file(path, interface_count):
+    """Write an xml file with interface_count interfaces and return its name."""
+    filename = os.path.join(path, "memory.xml")
+
+    with open(filename, "w") as f:
+        f.write('<node name="/org/example">\n')
+
+        for i in range(interface_count):
+            f.write(interface_format.format(i))
+
+        f.write("</node>\n")
+
+    return filename
+
+def get_resident_memory():
+    """Return the resident memory of this process in bytes."""
+    with open("/proc/self/statm") as f:
+        pages = int(f.read().split()[1])
+
+    return pages * os.sysconf("SC_PAGE_SIZE")
+
+def main():
+    member_count = 200000
+
+    if len(sys.argv) > 1:
+        member_count = int(sys.argv[1])
+
+    interface_count = max(1, member_count // members_per_interface)
+    path = tempfile.mkdtemp()
+
+    try:
+        filename = make_xml_file(path, interface_count)
+
+        sys.argv = ["memory_benchmark.py", "-tandroid", "-wTest.Foo", filename]
+        c = config.Config()
+        codegen.register_targets(c)
+        c.parse()
+
+        gc.collect()
+        before = get_resident_memory()
+        start = time.time()
+
+        p = parseajxml.ParseAjXml(filename, "sax")
+        service = p.parse(c.command_line)
+        validate.alljoyn_data(service, "android")
+
+        elapsed = time.time() - start
+        gc.collect()
+        used = get_resident_memory() - before
+    finally:
+        shutil.rmtree(path)
+
+    count = interface_count * members_per_interface
+    f = "{0} members in {1} interfaces: {2:.1f} MB resident, {3} bytes per member, {4:.2f} s."
+    print(f.format(count, interface_count, used / (1024.0 * 1024.0),
+                   used // count, elapsed))
+    return
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,133 @@
+# Copyright AllSeen Alliance. All rights reserved.
+#
+# Permission to use, copy, modify, and/or distribute this software for any
+# purpose with or without fee is hereby granted, provided that the above
+# copyright notice and this permission notice appear in all copies.
+#
+# THE SOFTWARE IS PROVIDED "AS IS" AND THE AUTHOR DISCLAIMS ALL WARRANTIES
+# WITH REGARD TO THIS SOFTWARE INCLUDING ALL IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR
+# ANY SPECIAL, DIRECT, INDIRECT, OR CONSEQUENTIAL DAMAGES OR ANY DAMAGES
+# WHATSOEVER RESULTING FROM LOSS OF USE, DATA OR PROFITS, WHETHER IN AN
+# ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION, ARISING OUT OF
+# OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
+
+"""Compares the time taken by each of the xml parsers on a large input.
+
+Run from this directory with the code generator on the PYTHONPATH as for the
+unit tests:
+
+    python parser_benchmark.py [interface_count]
+
+A file with interface_count objects, each with one interface, is generated
+and parsed several times with each parser. The best time is reported."""
+
+import os
+import sys
+import time
+import shutil
+import tempfile
+
+import AllJoynCodeGen.config as config
+import AllJoynCodeGen.codegen as codegen
+import AllJoynCodeGen.parseajxml as parseajxml
+
+interface_format = """  <node name="Object{0}">
+    <interface name="org.example.Benchmark{0}">
+      <annotation name="org.alljoyn.Bus.Item.IsSecure" value="true"/>
+      <struct name="Point">
+        <field name="x" type="i"/>
+        <field name="y" type="i"/>
+      </struct>
+      <dict name="Table">
+        <key type="s"/>
+        <value type="[Point]"/>
+      </dict>
+      <method name="Move">
+        <arg name="from" type="[Point]" direction="in"/>
+        <arg name="to" type="[Point]" direction="in"/>
+        <arg name="distance" type="d" direction="out"/>
+      </method>
+      <method name="Lookup">
+        <annotation name="org.alljoyn.Bus.Item.IsSecure" value="true"/>
+        <arg name="names" type="as" direction="in"/>
+        <arg name="table" type="[Table]" direction="out"/>
+      </method>
+      <signal name="Moved">
+        <arg name="position" type="[Point]"/>
+      </signal>
+      <property name="Name" type="s" access="readwrite">
+        <annotation name="org.freedesktop.DBus.Property.EmitsChangedSignal" value="true"/>
+      </property>
+    </interface>
+  </node>
+"""
+
+repeat_count = 3
+
+def make_xml_file(path, interface_count):
+    """Write an xml file with interface_count interfaces and return its name."""
+    filename = os.path.join(path, "benchmark.xml")
+
+    with open(filename, "w") as f:
+        f.write('<node name="/org/example">\n')
+
+        for i in range(interface_count):
+            f.write(interface_format.format(i))
+
+        f.write("</node>\n")
+
+    return filename
+
+def time_parser(filename, parser, command_line):
+    """Return the best time to read and parse the file with parser."""
+    best = None
+
+    for i in range(repeat_count):
+        start = time.time()
+        p = parseajxml.ParseAjXml(filename, parser)
+        p.parse(command_line)
+        elapsed = time.time() - start
+
+        if best is None or elapsed < best:
+            best = elapsed
+
+    return best
+
+def main():
+    interface_count = 2000
+
+    if len(sys.argv) > 1:
+        interface_count = int(sys.argv[1])
+
+    path = tempfile.mkdtemp()
+
+    try:
+        filename = make_xml_file(path, interface_count)
+
+        sys.argv = ["parser_benchmark.py", "-ttl", "-wTest.Foo", filename]
+        c = config.Config()
+        codegen.register_targets(c)
+        c.parse()
+
+        size = os.path.getsize(filename) / 1024
+        f = "Parsing {0} interfaces ({1} KB), best of {2}."
+        print(f.format(interface_count, size, repeat_count))
+
+        tree_time = None
+
+        for parser in parseajxml.parsers:
+            elapsed = time_parser(filename, parser, c.command_line)
+
+            if tree_time is None:
+                tree_time = elapsed
+
+            f = "  {0:8} {1:8.3f} s  {2:5.2f}x"
+            print(f.format(parser, elapsed, tree_time / elapsed))
+    finally:
+        shutil.rmtree(path)
+
+    return
+
+if __name__ == '__main__':
+    main()
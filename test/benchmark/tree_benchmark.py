@@ -0,0 +1,97 @@
+# Copyright AllSeen Alliance. All rights reserved.
+#
+# Permission to use, copy, modify, and/or distribute this software for any
+# purpose with or without fee is hereby granted, provided that the above
+# copyright notice and this permission notice appear in all copies.
+#
+# THE SOFTWARE IS PROVIDED "AS IS" AND THE AUTHOR DISCLAIMS ALL WARRANTIES
+# WITH REGARD TO THIS SOFTWARE INCLUDING ALL IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR
+# ANY SPECIAL, DIRECT, INDIRECT, OR CONSEQUENTIAL DAMAGES OR ANY DAMAGES
+# WHATSOEVER RESULTING FROM LOSS OF USE, DATA OR PROFITS, WHETHER IN AN
+# ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION, ARISING OUT OF
+# OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
+
+"""Times the walks of the object tree on very wide and very deep trees.
+
+Run from this directory with the code generator on the PYTHONPATH as for the
+unit tests:
+
+    python tree_benchmark.py [object_count]
+
+Two trees with object_count objects are built. The wide one has every object
+directly below the root. The deep one is made of chains of 1000 objects each.
+The time to parse, list, print and validate each tree is reported."""
+
+import sys
+import time
+from xml.etree import ElementTree
+
+import AllJoynCodeGen.service as service
+import AllJoynCodeGen.validate as validate
+
+interface_xml = '<interface name="org.example.Tree"><method name="Ping"/></interface>'
+
+chain_length = 1000
+
+def make_wide_xml(object_count):
+    """Return the xml of a tree with object_count objects below the root."""
+    parts = ['<node name="/org/example">']
+
+    for i in range(object_count):
+        parts.append('<node name="Object{0}">{1}</node>'.format(i, interface_xml))
+
+    parts.append('</node>')
+    return "".join(parts)
+
+def make_deep_xml(object_count):
+    """Return the xml of a tree with object_count objects in deep chains."""
+    parts = ['<node name="/org/example">']
+
+    for i in range(object_count // chain_length):
+        parts.append('<node name="Chain{0}">'.format(i))
+        parts.append('<node name="Link">' * (chain_length - 1))
+        parts.append(interface_xml)
+        parts.append('</node>' * chain_length)
+
+    parts.append('</node>')
+    return "".join(parts)
+
+def time_tree(name, xml):
+    """Print the time taken by each operation on the tree in xml."""
+    root = ElementTree.fromstring(xml)
+
+    start = time.time()
+    s = service.Service(root.get("name"))
+    s.parse(root, False)
+    parse_time = time.time() - start
+
+    start = time.time()
+    objects = s.get_objects()
+    objects_time = time.time() - start
+
+    start = time.time()
+    str(s.alljoyn_object)
+    str_time = time.time() - start
+
+    start = time.time()
+    validate.alljoyn_data(s, "android")
+    validate_time = time.time() - start
+
+    f = "  {0:6} {1:7} objects  parse {2:6.3f} s  objects {3:6.3f} s  str {4:6.3f} s  validate {5:6.3f} s"
+    print(f.format(name, len(objects), parse_time, objects_time, str_time, validate_time))
+    return
+
+def main():
+    object_count = 100000
+
+    if len(sys.argv) > 1:
+        object_count = int(sys.argv[1])
+
+    print("Recursion limit {0}.".format(sys.getrecursionlimit()))
+    time_tree("wide", make_wide_xml(object_count))
+    time_tree("deep", make_deep_xml(object_count))
+    return
+
+if __name__ == '__main__':
+    main()
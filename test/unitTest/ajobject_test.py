@@ -17,9 +17,11 @@ import unittest
 import fnmatch
 import os
 import sys
+import cPickle as pickle
 
 import AllJoynCodeGen.ajobject as ajobject
 import AllJoynCodeGen.service as service
+import AllJoynCodeGen.validate as validate
 
 class TestAjObject(unittest.TestCase):
     """Tests the AllJoynObject class."""
@@ -105,6 +107,25 @@ class TestAjObject(unittest.TestCase):
 
         self.assertEqual(found_nodes, 2)
 
+        o = s.get_object("/root/sub1/sub2/sub3")
+        self.assertEqual(o.name, "sub2/sub3")
+        self.assertIs(s.get_object("/root"), s.alljoyn_object)
+        self.assertIsNone(s.get_object("/root/sub2"))
+
+        # The names are cached until the object cache is deleted.
+        self.assertEqual(o.get_full_coded_name(), "_root_sub1_sub2_sub3")
+        self.assertEqual(o.get_full_coded_name(True), "rootSub1Sub2Sub3")
+        o.parent.name = "renamed"
+        self.assertEqual(o.get_full_name(), "/root/sub1/sub2/sub3")
+        self.assertEqual(o.get_full_coded_name(), "_root_sub1_sub2_sub3")
+
+        s.delete_object_cache()
+        self.assertEqual(o.get_full_name(), "/root/renamed/sub2/sub3")
+        self.assertEqual(o.get_full_coded_name(), "_root_renamed_sub2_sub3")
+        self.assertEqual(o.get_full_coded_name(True), "rootRenamedSub2Sub3")
+        self.assertIs(s.get_object("/root/renamed/sub2/sub3"), o)
+        self.assertIsNone(s.get_object("/root/sub1/sub2/sub3"))
+
     def test_get_interface_index(self):
         """Tests get_interface_index()."""
         test_xml = """
@@ -137,6 +158,28 @@ class TestAjObject(unittest.TestCase):
                 self.assertEqual(o.get_interface_index(i), index)
                 index += 1
 
+        root = s.alljoyn_object
+        sub = root.alljoyn_objects["sub"]
+        self.assertIsNone(root.get_interface_index(s.get_interface("i.i2")))
+
+        # Interfaces are found by identity so an equal copy is not found.
+        i0 = s.get_interface("i.i0")
+        copy = pickle.loads(pickle.dumps(i0, pickle.HIGHEST_PROTOCOL))
+        self.assertEqual(copy, i0)
+        self.assertIsNone(sub.get_interface_index(copy))
+
+        # The index is rebuilt for the new instances when unpickled.
+        s = pickle.loads(pickle.dumps(s, pickle.HIGHEST_PROTOCOL))
+        sub = s.alljoyn_object.alljoyn_objects["sub"]
+        self.assertEqual(sub.get_interface_index(s.get_interface("i.i0")), 1)
+        self.assertEqual(sub.get_interface_index(s.get_interface("i.i2")), 2)
+
+        # A change made directly to the list is noticed.
+        sub.interfaces.reverse()
+        self.assertEqual(sub.get_interface_index(s.get_interface("i.i2")), 0)
+        sub.interfaces.pop()
+        self.assertIsNone(sub.get_interface_index(s.get_interface("i.i1")))
+
     def test_has_properties(self):
         """Tests has_properties()."""
 
@@ -228,3 +271,79 @@ class TestAjObject(unittest.TestCase):
         self.assertEqual(o.get_full_coded_name(), "_root_sub0_sub1")
         self.assertEqual(o.get_full_coded_name(False), "_root_sub0_sub1")
         self.assertEqual(o.get_full_coded_name(True), "rootSub0Sub1")
+
+    def test_str(self):
+        """Tests __str__()."""
+        test_xml = """
+            <node name="/root">
+                <interface name="i.i0">
+                    <method name="m0" />
+                </interface>
+                <node name="b">
+                    <node name="c">
+                        <interface name="i.i1">
+                            <method name="m1" />
+                        </interface>
+                    </node>
+                </node>
+                <node name="a">
+                    <interface name="i.i0">
+                        <method name="m0" />
+                    </interface>
+                </node>
+            </node>"""
+
+        node = ElementTree.fromstring(test_xml)
+        s = service.Service(node.get("name"))
+        s.parse(node, False)
+
+        expected = ("Obj name: '/root'\nFull name: '/root'\nInterfaces:\n"
+                    "  i.i0\n\nChild objects:\n"
+                    "  Obj name: 'a'\n  Full name: '/root/a'\n  Interfaces:\n"
+                    "    i.i0\n\n"
+                    "  Obj name: 'b'\n  Full name: '/root/b'\n  Interfaces:\n\n"
+                    "  Child objects:\n"
+                    "    Obj name: 'c'\n    Full name: '/root/b/c'\n    Interfaces:\n"
+                    "      i.i1\n\n\n")
+
+        self.assertEqual(str(s.alljoyn_object), expected)
+
+    def test_deep_and_wide_trees(self):
+        """Tests objects nested deeper than the recursion limit."""
+        depth = sys.getrecursionlimit() + 500
+        width = 2000
+        interface_xml = '<interface name="i.i0"><method name="m0"/></interface>'
+
+        deep_xml = "".join(['<node name="/root">',
+                            '<node name="n">' * depth,
+                            interface_xml,
+                            '</node>' * depth,
+                            '</node>'])
+
+        wide_xml = "".join(['<node name="/root">'] +
+                           ['<node name="n{0:04}">{1}</node>'.format(i, interface_xml)
+                            for i in range(width)] +
+                           ['</node>'])
+
+        node = ElementTree.fromstring(deep_xml)
+        s = service.Service(node.get("name"))
+        s.parse(node, False)
+
+        objects = s.get_objects()
+        self.assertEqual(len(objects), depth + 1)
+        self.assertEqual(objects[-1].get_full_name(), "/root" + "/n" * depth)
+        self.assertEqual(objects[-1].index, 0)
+        self.assertEqual(str(s.alljoyn_object).count("Obj name:"), depth + 1)
+        validate.alljoyn_data(s, "android")
+
+        node = ElementTree.fromstring(wide_xml)
+        s = service.Service(node.get("name"))
+        s.parse(node, False)
+
+        objects = s.get_objects()
+        self.assertEqual(len(objects), width + 1)
+        self.assertEqual([o.name for o in objects[1:]],
+                         ["n{0:04}".format(i) for i in range(width)])
+
+        names = [full_name for o, full_name, d in s.alljoyn_object.walk()]
+        self.assertEqual(names, [o.get_full_name() for o in objects])
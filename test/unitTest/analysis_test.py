@@ -0,0 +1,98 @@
+# Copyright AllSeen Alliance. All rights reserved.
+#
+# Permission to use, copy, modify, and/or distribute this software for any
+# purpose with or without fee is hereby granted, provided that the above
+# copyright notice and this permission notice appear in all copies.
+#
+# THE SOFTWARE IS PROVIDED "AS IS" AND THE AUTHOR DISCLAIMS ALL WARRANTIES
+# WITH REGARD TO THIS SOFTWARE INCLUDING ALL IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR
+# ANY SPECIAL, DIRECT, INDIRECT, OR CONSEQUENTIAL DAMAGES OR ANY DAMAGES
+# WHATSOEVER RESULTING FROM LOSS OF USE, DATA OR PROFITS, WHETHER IN AN
+# ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION, ARISING OUT OF
+# OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
+from xml.etree import ElementTree
+import unittest
+
+import AllJoynCodeGen.analysis as analysis
+import AllJoynCodeGen.service as service
+import AllJoynCodeGen.validate as validate
+
+test_xml = """
+    <node name="/root">
+        <interface name="i.Props">
+            <property name="Name" type="s" access="read"/>
+            <property name="Level" type="aai" access="write"/>
+        </interface>
+        <interface name="i.Signals">
+            <signal name="Changed">
+                <arg name="values" type="a{s(i(ss))}"/>
+            </signal>
+            <signal name="Reset"/>
+            <method name="Get">
+                <arg name="key" type="s" direction="in"/>
+            </method>
+        </interface>
+        <node name="sub">
+            <interface name="i.Signals">
+                <signal name="Changed">
+                    <arg name="values" type="a{s(i(ss))}"/>
+                </signal>
+                <signal name="Reset"/>
+                <method name="Get">
+                    <arg name="key" type="s" direction="in"/>
+                </method>
+            </interface>
+        </node>
+    </node>"""
+
+class TestAnalysis(unittest.TestCase):
+    """Tests the summaries made by analysis.analyze()."""
+
+    def test_analyze(self):
+        """Tests the aggregates of the service, objects and interfaces."""
+        node = ElementTree.fromstring(test_xml)
+        s = service.Service(node.get("name"))
+        s.parse(node, False)
+        validate.alljoyn_data(s, "android")
+
+        summary = s.analyze()
+        self.assertIs(s.get_summary(), summary)
+        self.assertTrue(summary.has_properties)
+        self.assertTrue(summary.has_read_properties)
+        self.assertTrue(summary.has_write_properties)
+        self.assertTrue(summary.has_dictionaries)
+        self.assertTrue(summary.has_signals)
+        self.assertEqual(summary.number_of_signals, 4)
+        self.assertEqual(s.number_of_signals(), 4)
+        self.assertTrue(summary.needs_persistent_data(True))
+        self.assertTrue(summary.needs_persistent_data(False))
+
+        props = summary.get_interface(s.get_interface("i.Props"))
+        self.assertTrue(props.has_read_properties)
+        self.assertTrue(props.has_write_properties)
+        self.assertFalse(props.has_dictionaries)
+        self.assertEqual(props.number_of_signals, 0)
+
+        signals = summary.get_interface(s.get_interface("i.Signals"))
+        self.assertFalse(signals.has_properties)
+        self.assertTrue(signals.has_dictionaries)
+        self.assertEqual(signals.number_of_signals, 2)
+        self.assertTrue(signals.needs_persistent_data(True))
+        self.assertTrue(signals.needs_persistent_data(False))
+
+        root = summary.get_object(s.alljoyn_object)
+        self.assertTrue(root.has_properties)
+        self.assertEqual(root.number_of_signals, 2)
+        sub = summary.get_object(s.get_object("/root/sub"))
+        self.assertFalse(sub.has_read_properties)
+        self.assertEqual(sub.number_of_signals, 2)
+
+        self.assertRaises(AttributeError, setattr, summary, "has_signals", False)
+        self.assertRaises(AttributeError, setattr, sub, "number_of_signals", 0)
+
+        # A change to the service needs a new summary.
+        s.delete_object_cache()
+        self.assertIsNone(s.summary)
+        self.assertIsNot(s.get_summary(), summary)
+        return
@@ -19,7 +19,11 @@ import sys
 import random
 
 import AllJoynCodeGen.argdef as argdef
+import AllJoynCodeGen.interface as interface
 import AllJoynCodeGen.memberdef as memberdef
+import AllJoynCodeGen.fielddef as fielddef
+import AllJoynCodeGen.structdef as structdef
+import AllJoynCodeGen.dictdef as dictdef
 
 class TestArg(unittest.TestCase):
     """Tests the ArgDef class."""
@@ -193,3 +197,59 @@ class TestArg(unittest.TestCase):
                 self.assertEqual(fields[j], frags[j])
 
         return
+
+    def test_flattened_signature_cache(self):
+        """Tests that cached flattened signatures are remade after changes."""
+        i = interface.Interface()
+
+        inner = structdef.StructDef()
+        inner.name = "Inner"
+        inner.add_field(None, fielddef.FieldDef("x", "i"))
+        i.add_declared_struct(None, inner)
+
+        outer = dictdef.DictDef()
+        outer.name = "Outer"
+        outer.set_key_signature("s")
+        outer.set_value_signature("a[Inner]")
+        i.add_declared_dict(None, outer)
+
+        for m in (inner.fields[0], outer.key, outer.value):
+            m.interface = i
+
+        a = argdef.ArgDef(None, "myArg", "a[Outer]", "in")
+        a.interface = i
+        self.assertEqual(a.get_flattened_signature(), "aa{sa(i)}")
+
+        hits = memberdef.flattened_hits
+        self.assertEqual(a.get_flattened_signature(), "aa{sa(i)}")
+        self.assertEqual(memberdef.flattened_hits, hits + 1)
+
+        # Adding a field changes every type which contains the struct.
+        inner.add_field(None, fielddef.FieldDef("y", "d"))
+        inner.fields[1].interface = i
+        self.assertEqual(a.get_flattened_signature(), "aa{sa(id)}")
+
+        # Changing arg_type is found without any notice.
+        a.arg_type = "[Inner]"
+        self.assertEqual(a.get_flattened_signature(), "(id)")
+        self.assertTrue(a.is_structure())
+        self.assertFalse(a.is_array())
+
+        a.interface = None
+        a.arg_type = "ai"
+        self.assertEqual(a.get_flattened_signature(), "ai")
+        self.assertTrue(0.0 < memberdef.get_flattened_hit_rate() < 1.0)
+        return
+
+
+    def test_slots(self):
+        """Tests that the members have no per-instance dictionary."""
+        a = argdef.ArgDef(None, "myArg", "a(is)", "in")
+        self.assertFalse(hasattr(a, "__dict__"))
+        self.assertRaises(AttributeError, setattr, a, "input_arg_info", None)
+
+        f = fielddef.FieldDef("x", "i")
+        self.assertFalse(hasattr(f, "__dict__"))
+        self.assertFalse(hasattr(structdef.StructDef(), "__dict__"))
+        self.assertFalse(hasattr(dictdef.DictDef(), "__dict__"))
+        return
@@ -0,0 +1,179 @@
+# Copyright AllSeen Alliance. All rights reserved.
+#
+# Permission to use, copy, modify, and/or distribute this software for any
+# purpose with or without fee is hereby granted, provided that the above
+# copyright notice and this permission notice appear in all copies.
+#
+# THE SOFTWARE IS PROVIDED "AS IS" AND THE AUTHOR DISCLAIMS ALL WARRANTIES
+# WITH REGARD TO THIS SOFTWARE INCLUDING ALL IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR
+# ANY SPECIAL, DIRECT, INDIRECT, OR CONSEQUENTIAL DAMAGES OR ANY DAMAGES
+# WHATSOEVER RESULTING FROM LOSS OF USE, DATA OR PROFITS, WHETHER IN AN
+# ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION, ARISING OUT OF
+# OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
+
+import unittest
+import os
+import sys
+import shutil
+import tempfile
+import struct
+import cPickle as pickle
+
+import AllJoynCodeGen.catalogue as catalogue
+import AllJoynCodeGen.parseajxml as parseajxml
+import AllJoynCodeGen.validate as validate
+import util
+
+library_xml = """<node name="/Library">
+  <interface name="org.example.Light">
+    <struct name="Color">
+      <field name="hue" type="d"/>
+      <field name="saturation" type="d"/>
+    </struct>
+    <method name="SetColor">
+      <arg name="color" type="[Color]" direction="in"/>
+    </method>
+  </interface>
+  <interface name="org.example.Door">
+    <method name="Open"/>
+    <signal name="Opened"/>
+  </interface>
+</node>
+"""
+
+project_xml = """<node name="/Project">
+  <interface name="org.example.Light"/>
+  <node name="Front">
+    <interface name="org.example.Door"/>
+  </node>
+</node>
+"""
+
+missing_xml = """<node name="/Project">
+  <interface name="org.example.Window"/>
+</node>
+"""
+
+class TestCatalogue(unittest.TestCase):
+    """Tests the Catalogue class."""
+
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+        self.library = self.__parse(self.__write("library.xml", library_xml))
+        self.catalogue = os.path.join(self.path, "library.ajcat")
+        # Catalogues are written from the frozen model by codegen.
+        self.library.freeze()
+        catalogue.write(self.catalogue, self.library.interfaces.values(), "tl")
+        return
+
+    def tearDown(self):
+        shutil.rmtree(self.path)
+        return
+
+    def test_lookup(self):
+        """Test looking up interfaces in the catalogue."""
+        c = catalogue.Catalogue(self.catalogue, "tl")
+
+        for name, i in self.library.interfaces.items():
+            found = c.get_interface(name)
+            self.assertEqual(found, i)
+            self.assertTrue(found.from_catalogue)
+            self.assertEqual(found.parents, [])
+            self.assertFalse(found.frozen)
+            self.assertEqual(len(i.parents), 1)
+
+        self.assertTrue(c.get_interface("org.example.A") is None)
+        self.assertTrue(c.get_interface("org.example.Z") is None)
+        c.close()
+
+        c = catalogue.Catalogue(self.catalogue, "android")
+
+        with self.assertRaises(catalogue.CatalogueException) as cm:
+            c.get_interface("org.example.Light")
+
+        self.assertTrue(str.find(cm.exception.message, "target 'android'") != -1)
+        return
+
+    def test_entries(self):
+        """Test that each entry holds only its own interface."""
+        c = catalogue.Catalogue(self.catalogue, "tl")
+        light = c.get_interface("org.example.Light")
+
+        for a in light.get_method("SetColor").args:
+            self.assertTrue(a.interface is light)
+
+        for f in light.get_named_type("Color").fields:
+            self.assertTrue(f.interface is light)
+
+        # The entries don't grow with the rest of the service.
+        index_size = struct.calcsize(catalogue.index_format)
+
+        for n in range(c.count):
+            offset = c.index_offset + n * index_size
+            entry = struct.unpack_from(catalogue.index_format, c.map, offset)
+            self.assertTrue(entry[3] < 1024)
+
+        c.close()
+
+        with open(self.catalogue, "r+b") as f:
+            data = f.read()
+            f.seek(0)
+            f.write(data.replace("AJMODEL", "XXXXXXX"))
+
+        c = catalogue.Catalogue(self.catalogue, "tl")
+        self.assertRaises(catalogue.CatalogueException,
+                          c.get_interface, "org.example.Door")
+        c.close()
+        return
+
+    def test_reference(self):
+        """Test xml which names interfaces in the catalogue."""
+        project = self.__write("project.xml", project_xml)
+        args = ["--catalogue", self.catalogue]
+
+        for parser in parseajxml.parsers:
+            service = self.__parse(project, parser, args)
+            validate.alljoyn_data(service, "tl")
+
+            self.assertEqual(sorted(service.interfaces),
+                             sorted(self.library.interfaces))
+
+            for name, i in service.interfaces.items():
+                self.assertTrue(i.from_catalogue)
+                self.assertEqual(i, self.library.interfaces[name])
+                self.assertEqual(len(i.parents), 1)
+
+            # The catalogue is reopened after pickling.
+            copy = pickle.loads(pickle.dumps(service, pickle.HIGHEST_PROTOCOL))
+            i = copy.catalogues[0].get_interface("org.example.Door")
+            self.assertEqual(i, service.interfaces["org.example.Door"])
+
+        missing = self.__write("missing.xml", missing_xml)
+
+        with self.assertRaises(validate.ValidateException) as cm:
+            self.__parse(missing, "tree", args)
+
+        message = cm.exception.message
+        self.assertTrue(str.find(message, "Incompletely specified interface") != -1)
+        return
+
+    def __write(self, name, xml):
+        filename = os.path.join(self.path, name)
+
+        with open(filename, "w") as f:
+            f.write(xml)
+
+        return filename
+
+    def __parse(self, filename, parser = "tree", additional_args = None):
+        sys.argv = ["catalogue_test.py", "-ttl", "-wTest.Foo", filename]
+
+        if additional_args is not None:
+            sys.argv.extend(additional_args)
+
+        command_line = util.get_config().command_line
+        return parseajxml.ParseAjXml(filename, parser).parse(command_line)
+
+if __name__ == '__main__':
+    unittest.main()
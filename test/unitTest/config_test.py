@@ -16,8 +16,10 @@ import unittest
 import fnmatch
 import os
 import sys
+import StringIO
 
 import AllJoynCodeGen.config as config
+import AllJoynCodeGen.validate as validate
 import util
 
 class TestConfig(unittest.TestCase):
@@ -57,6 +59,29 @@ class TestConfig(unittest.TestCase):
         self.assertTrue(c.command_line.client_only)
         return
 
+    def test_input_files(self):
+        """Test giving several xml input files and the jobs (-j) flag."""
+        args = ["arg0", "-ttl", "-wTest.Foo", "file1.xml", "file2.xml"]
+        sys.argv = args
+        c = util.get_config()
+        self.assertEqual(c.command_line.xml_input_files, ["file1.xml", "file2.xml"])
+        self.assertEqual(c.command_line.xml_input_file, "file1.xml, file2.xml")
+        self.assertEqual(c.command_line.jobs, None)
+
+        c = self.__one_arg_test("-j4")
+        self.assertEqual(c.command_line.jobs, 4)
+
+        args = ["arg0", "-j0", "-ttl", "-wTest.Foo", "file.xml"]
+        sys.argv = args
+        self.assertRaises(config.ConfigException, util.get_config)
+
+        args = ["arg0", "-ttl", "-wTest.Foo", "-"]
+        sys.argv = args
+        c = util.get_config()
+        self.assertEqual(c.command_line.xml_input_file, "stdin")
+        self.assertEqual(c.command_line.absolute_path_xml_input_file, "stdin")
+        return
+
     def test_lax_naming(self):
         """Test the lax naming (-l) flag."""
         c = self.__one_arg_test("-b/TestFoo")
@@ -66,6 +91,18 @@ class TestConfig(unittest.TestCase):
         self.assertTrue(c.command_line.lax_naming)
         return
 
+    def test_parser(self):
+        """Test the xml parser (--parser) flag."""
+        c = self.__one_arg_test("-b/TestFoo")
+        self.assertEqual(c.command_line.parser, "tree")
+
+        c = self.__one_arg_test("--parser=stream")
+        self.assertEqual(c.command_line.parser, "stream")
+
+        with self.assertRaises(SystemExit) as cm:
+            c = self.__one_arg_test("--parser=Foo")
+        return
+
     def test_runnable(self):
         """Test the runnable (-R) flag."""
         c = self.__one_arg_test("-b/TestFoo")
@@ -123,6 +160,28 @@ class TestConfig(unittest.TestCase):
         self.assertTrue(c.command_line.xml)
         return
 
+    def test_no_warnings(self):
+        """Test the no warnings (-q) flag."""
+        c = self.__one_arg_test("-b/TestFoo")
+        self.assertFalse(c.command_line.no_warnings)
+        self.assertTrue(validate.report_warnings)
+
+        stdout = sys.stdout
+
+        try:
+            c = self.__one_arg_test("-q")
+            self.assertTrue(c.command_line.no_warnings)
+            self.assertFalse(validate.report_warnings)
+
+            sys.stdout = StringIO.StringIO()
+            validate.warning(None, "Unused '{0}'.", "name")
+            self.assertEqual(sys.stdout.getvalue(), "")
+        finally:
+            sys.stdout = stdout
+            validate.report_warnings = True
+
+        return
+
     def __one_arg_test(self, arg_to_test):
         """Test this one argument when creating a configuration."""
         args = ["arg0", arg_to_test, "-ttl", "-wTest.Foo", "file.xml"]
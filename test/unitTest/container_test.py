@@ -91,5 +91,25 @@ class TestInterface(unittest.TestCase):
 
             self.assertEqual(len(dicts) + len(structs), case[0], mess)
 
+            both_dicts = {}
+            both_structs = {}
+            c.extract_containers(both_structs, both_dicts)
+            self.assertEqual(sorted(both_dicts), sorted(dicts), mess)
+            self.assertEqual(sorted(both_structs), sorted(structs), mess)
+
+        return
+
+    def test_existing_containers(self):
+        """Tests that containers already in the lists are kept."""
+        named = container.Container("(bad)", "Named")
+        structs = {"(bad)" : named}
+        dicts = {}
+
+        c = container.Container("a{s(i(bad))}")
+        c.extract_containers(structs, dicts)
+        self.assertIs(structs["(bad)"], named)
+        self.assertEqual(sorted(structs), ["(bad)", "(i(bad))"])
+        self.assertEqual(list(dicts), ["{s(i(bad))}"])
+        self.assertIsNone(structs["(i(bad))"].name)
         return
 
@@ -12,6 +12,7 @@
 # ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION, ARISING OUT OF
 # OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
 
+from xml.etree import ElementTree
 import unittest
 import fnmatch
 import os
@@ -22,6 +23,8 @@ import AllJoynCodeGen.propertydef as propertydef
 import AllJoynCodeGen.methoddef as methoddef
 import AllJoynCodeGen.signaldef as signaldef
 import AllJoynCodeGen.ajobject as ajobject
+import AllJoynCodeGen.argdef as argdef
+import AllJoynCodeGen.validate as validate
 
 class TestInterface(unittest.TestCase):
     """Tests the Interface class."""
@@ -103,6 +106,74 @@ class TestInterface(unittest.TestCase):
         self.__do_parent_test()
         return
 
+    def test_fingerprint(self):
+        """Tests that fingerprints agree with the == operator."""
+        i1 = self.__make_interface(("One", "Two"), "in")
+        i2 = self.__make_interface(("Two", "One"), "in")
+        self.assertEqual(i1, i2)
+        self.assertEqual(i1.get_fingerprint(), i2.get_fingerprint())
+
+        i3 = self.__make_interface(("One", "Two"), "out")
+        self.assertNotEqual(i1, i3)
+        self.assertNotEqual(i1.get_fingerprint(), i3.get_fingerprint())
+
+        # Adding a member changes the fingerprint.
+        fingerprint = i1.get_fingerprint()
+        p = propertydef.PropertyDef()
+        p.name = "Prop"
+        i1.add_property(None, p)
+        self.assertNotEqual(fingerprint, i1.get_fingerprint())
+        return
+
+    def test_elaborate(self):
+        """Tests that the containers and named types are made when needed."""
+        xml = """
+            <interface name="Foo.Bar">
+                <method name="Set">
+                    <arg name="point" type="(ii)" direction="in"/>
+                    {0}
+                </method>
+            </interface>"""
+
+        i = interface.Interface()
+        i.parse(ElementTree.fromstring(xml.format("")), False)
+        arg = i.get_method("Set").args[0]
+        self.assertFalse(i.elaborated)
+        self.assertEqual(i.structures, {})
+        self.assertEqual(arg.arg_type, "(ii)")
+        self.assertIsNone(arg.interface)
+        fingerprint = i.get_method("Set").get_fingerprint()
+
+        self.assertIsNotNone(i.get_named_type("point_ii"))
+        self.assertTrue(i.elaborated)
+        self.assertEqual(i.structures.keys(), ["(ii)"])
+        self.assertEqual(arg.arg_type, "[point_ii]")
+        self.assertTrue(arg.interface is i)
+
+        # The argument types changed so the fingerprint is made again.
+        self.assertNotEqual(i.get_method("Set").get_fingerprint(), fingerprint)
+
+        # Elaborating again changes nothing.
+        i.elaborate()
+        self.assertEqual(len(i.declared_structs), 1)
+
+        missing = '<arg name="missing" type="[Missing]" direction="in"/>'
+        i = interface.Interface()
+        i.parse(ElementTree.fromstring(xml.format(missing)), False)
+
+        with self.assertRaises(validate.ValidateException) as cm:
+            i.elaborate()
+
+        message = cm.exception.message
+        self.assertTrue(str.find(message, " references unknown named type.") != -1)
+
+        # A failed interface is not taken to be elaborated.
+        self.assertFalse(i.elaborated)
+        self.assertRaises(validate.ValidateException, i.elaborate)
+        self.assertRaises(validate.ValidateException, i.get_fingerprint)
+        self.assertFalse(i.elaborated)
+        return
+
     def test_str(self):
         """Tests the generation of the string representation of an
         interface."""
@@ -114,6 +185,19 @@ class TestInterface(unittest.TestCase):
         self.assertTrue(str.find(toString, "Full: " + name) != -1)
         return
 
+    def __make_interface(self, method_names, direction):
+        """Make an interface with a method with one argument for each name."""
+        i = interface.Interface()
+        i.set_name("Foo.Bar")
+
+        for name in method_names:
+            m = methoddef.MethodDef()
+            m.name = name
+            m.add_arg(None, argdef.ArgDef(None, "arg", "i", direction))
+            i.add_method(None, m)
+
+        return i
+
     def __do_name_eq_test(self):
         """Tests the two interfaces for (in)equality with various names."""
         i1 = interface.Interface()
@@ -0,0 +1,197 @@
+# Copyright AllSeen Alliance. All rights reserved.
+#
+# Permission to use, copy, modify, and/or distribute this software for any
+# purpose with or without fee is hereby granted, provided that the above
+# copyright notice and this permission notice appear in all copies.
+#
+# THE SOFTWARE IS PROVIDED "AS IS" AND THE AUTHOR DISCLAIMS ALL WARRANTIES
+# WITH REGARD TO THIS SOFTWARE INCLUDING ALL IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR
+# ANY SPECIAL, DIRECT, INDIRECT, OR CONSEQUENTIAL DAMAGES OR ANY DAMAGES
+# WHATSOEVER RESULTING FROM LOSS OF USE, DATA OR PROFITS, WHETHER IN AN
+# ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION, ARISING OUT OF
+# OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
+
+import unittest
+import os
+import sys
+import shutil
+import tempfile
+import StringIO
+
+import AllJoynCodeGen.codegen as codegen
+import AllJoynCodeGen.modelcache as modelcache
+import AllJoynCodeGen.parseajxml as parseajxml
+import util
+
+xml = """<node name="/Cache">
+  <interface name="org.alljoyn.Cache">
+    <method name="Get">
+      <arg name="value" type="s" direction="out"/>
+    </method>
+  </interface>
+</node>
+"""
+
+class TestModelCache(unittest.TestCase):
+    """Tests the ModelCache class."""
+
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+        self.xml_file = os.path.join(self.path, "cache.xml")
+
+        with open(self.xml_file, "w") as f:
+            f.write(xml)
+
+        self.cache = modelcache.ModelCache(os.path.join(self.path, "cache"))
+        return
+
+    def tearDown(self):
+        shutil.rmtree(self.path)
+        return
+
+    def test_store_and_load(self):
+        """Test that a stored service is loaded unchanged."""
+        command_line = self.__get_command_line()
+        key = self.cache.get_key(command_line, [self.xml_file])
+        self.assertTrue(self.cache.load(key) is None)
+
+        service = parseajxml.ParseAjXml(self.xml_file).parse(command_line)
+        self.cache.store(key, service)
+
+        cached = self.cache.load(key)
+        self.assertTrue(cached is not None)
+        self.assertEqual(str(cached), str(service))
+        self.assertTrue("org.alljoyn.Cache" in cached.interfaces)
+        return
+
+    def test_key(self):
+        """Test that the key changes with the input and the options."""
+        command_line = self.__get_command_line()
+        key = self.cache.get_key(command_line, [self.xml_file])
+        self.assertEqual(key, self.cache.get_key(command_line, [self.xml_file]))
+
+        other = self.__get_command_line(["-l"])
+        self.assertNotEqual(key, self.cache.get_key(other, [self.xml_file]))
+
+        with open(self.xml_file, "a") as f:
+            f.write("\n")
+
+        self.assertNotEqual(key, self.cache.get_key(command_line,
+                                                    [self.xml_file]))
+
+        missing = os.path.join(self.path, "missing.xml")
+        self.assertTrue(self.cache.get_key(command_line, [missing]) is None)
+        return
+
+    def test_damaged_file(self):
+        """Test that a damaged cache file is treated as a miss."""
+        command_line = self.__get_command_line()
+        key = self.cache.get_key(command_line, [self.xml_file])
+        self.cache.store(key, self.__get_service())
+
+        filename = os.path.join(self.cache.path, key + modelcache.cache_suffix)
+
+        with open(filename, "r+b") as f:
+            data = f.read()
+            f.seek(0)
+            f.write(data[:len(data) // 2])
+            f.truncate()
+
+        self.assertTrue(self.cache.load(key) is None)
+        self.assertFalse(os.path.exists(filename))
+
+        self.cache.store(key, self.__get_service())
+
+        with open(filename, "wb") as f:
+            f.write("not a model")
+
+        self.assertTrue(self.cache.load(key) is None)
+        self.assertFalse(os.path.exists(filename))
+        return
+
+    def test_eviction(self):
+        """Test that the least recently used files are removed."""
+        service = self.__get_service()
+        self.cache.max_size = 1
+        self.cache.store("first", service)
+        self.cache.store("second", service)
+
+        files = os.listdir(self.cache.path)
+        self.assertEqual(len(files), 0)
+
+        self.cache.max_size = 1024
+        self.cache.store("first", service)
+        filename = os.path.join(self.cache.path, "first" + modelcache.cache_suffix)
+        os.utime(filename, (0, 0))
+        self.cache.max_size = os.path.getsize(filename) + 1
+        self.cache.store("second", service)
+
+        self.assertTrue(self.cache.load("first") is None)
+        self.assertEqual(str(self.cache.load("second")), str(service))
+        return
+
+    def test_generated_code(self):
+        """Test that the code generated from the cache is unchanged."""
+        files = ("methods/method_struct_basic.xml",
+                 "signals/signal_struct_basic.xml")
+
+        for f in files:
+            for target in ("tl", "android"):
+                cache_dir = os.path.join(self.path, target, f, "cache")
+                cold = self.__generate(f, target, cache_dir, "cold")
+                warm = self.__generate(f, target, cache_dir, "warm")
+
+                self.assertEqual(len(os.listdir(cache_dir)), 1)
+                self.assertTrue(len(cold) > 0)
+                self.assertEqual(sorted(warm), sorted(cold))
+
+                for name in cold:
+                    self.assertEqual(warm[name], cold[name],
+                                     "{0} {1}: {2}".format(target, f, name))
+
+        return
+
+    def __generate(self, filename, target, cache_dir, name):
+        """Generate the code and return the contents of each file made."""
+        output_path = os.path.join(self.path, target, filename, name)
+        os.makedirs(output_path)
+        sys.argv = ["modelcache_test.py", "-t" + target, "-wcom.example.Test",
+                    "-p" + output_path, "--model-cache-dir", cache_dir,
+                    filename]
+        stdout = sys.stdout
+
+        try:
+            sys.stdout = StringIO.StringIO()
+            codegen.main()
+        finally:
+            sys.stdout = stdout
+
+        return_value = {}
+
+        for dirpath, dirs, files in os.walk(output_path):
+            for f in files:
+                full_name = os.path.join(dirpath, f)
+
+                key = os.path.relpath(full_name, output_path)
+
+                with open(full_name, "rb") as source:
+                    return_value[key] = source.read()
+
+        return return_value
+
+    def __get_service(self):
+        command_line = self.__get_command_line()
+        return parseajxml.ParseAjXml(self.xml_file).parse(command_line)
+
+    def __get_command_line(self, additional_args = None):
+        args = ["modelcache_test.py", "-ttl", "-wTest.Foo", self.xml_file]
+
+        if additional_args is not None:
+            args.extend(additional_args)
+
+        sys.argv = args
+        return util.get_config().command_line
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,124 @@
+# Copyright AllSeen Alliance. All rights reserved.
+#
+# Permission to use, copy, modify, and/or distribute this software for any
+# purpose with or without fee is hereby granted, provided that the above
+# copyright notice and this permission notice appear in all copies.
+#
+# THE SOFTWARE IS PROVIDED "AS IS" AND THE AUTHOR DISCLAIMS ALL WARRANTIES
+# WITH REGARD TO THIS SOFTWARE INCLUDING ALL IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR
+# ANY SPECIAL, DIRECT, INDIRECT, OR CONSEQUENTIAL DAMAGES OR ANY DAMAGES
+# WHATSOEVER RESULTING FROM LOSS OF USE, DATA OR PROFITS, WHETHER IN AN
+# ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION, ARISING OUT OF
+# OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
+
+from xml.etree import ElementTree
+import unittest
+
+import AllJoynCodeGen.service as service
+import AllJoynCodeGen.modelcodec as modelcodec
+import AllJoynCodeGen.validate as validate
+
+test_xml = """
+    <node name="/root">
+        <interface name="org.example.Light">
+            <dict name="Levels">
+                <key type="s"/>
+                <value type="i"/>
+            </dict>
+            <struct name="Pair">
+                <field name="first" type="i"/>
+                <field name="second" type="i"/>
+            </struct>
+            <struct name="Color">
+                <field name="hue" type="d"/>
+                <field name="saturation" type="d"/>
+            </struct>
+            <method name="SetColor">
+                <arg name="color" type="[Color]" direction="in"/>
+                <arg name="pair" type="[Pair]" direction="in"/>
+                <arg name="levels" type="[Levels]" direction="out"/>
+            </method>
+            <signal name="Changed">
+                <arg name="color" type="[Color]"/>
+            </signal>
+            <property name="Name" type="s" access="read"/>
+        </interface>
+        <node name="sub">
+            <interface name="org.example.Door">
+                <method name="Open"/>
+            </interface>
+        </node>
+    </node>"""
+
+class TestModelCodec(unittest.TestCase):
+    """Tests the modelcodec module."""
+
+    def setUp(self):
+        node = ElementTree.fromstring(test_xml)
+        self.service = service.Service(node.get("name"))
+        self.service.parse(node, False)
+        validate.alljoyn_data(self.service, "android")
+        self.service.freeze()
+        self.data = modelcodec.encode(self.service)
+        return
+
+    def test_round_trip(self):
+        """Test that a decoded service is the same as the encoded one."""
+        s = modelcodec.decode(self.data)
+
+        self.assertEqual(str(s), str(self.service))
+        self.assertTrue(s.frozen)
+        self.assertEqual(sorted(s.interfaces), sorted(self.service.interfaces))
+
+        for name, i in s.interfaces.items():
+            self.assertEqual(i, self.service.interfaces[name])
+            self.assertTrue(i.frozen)
+
+        light = s.get_interface("org.example.Light")
+        self.assertEqual(light.parents, [s.get_object("/root")])
+        self.assertTrue(light.get_method("SetColor").args[0].interface is light)
+        self.assertTrue(s.get_object("/root/sub").frozen)
+        self.assertEqual(s.get_summary().number_of_signals, 1)
+        return
+
+    def test_declaration_order(self):
+        """Test that the containers are declared in the same order."""
+        s = modelcodec.decode(self.data)
+        light = self.service.get_interface("org.example.Light")
+        names = [c.name for c in light.get_containers_in_declaration_order()]
+        self.assertEqual(names, ["Color", "Pair", "Levels"])
+
+        decoded = s.get_interface("org.example.Light")
+        self.assertEqual([c.name for c in decoded.get_containers_in_declaration_order()],
+                         names)
+        return
+
+    def test_reader(self):
+        """Test decoding single interfaces with a ModelReader."""
+        reader = modelcodec.ModelReader(self.data)
+
+        self.assertEqual(reader.get_interface_names(),
+                         ["org.example.Door", "org.example.Light"])
+
+        for name, i in self.service.interfaces.items():
+            found = reader.get_interface(name)
+            self.assertEqual(found, i)
+            self.assertEqual(found.parents, [])
+
+        self.assertTrue(reader.get_interface("org.example.Window") is None)
+        return
+
+    def test_damaged(self):
+        """Test that damaged data is reported."""
+        damaged = (self.data[:len(self.data) // 2],
+                   "AJMODEL\x00" + self.data[len(modelcodec.magic):],
+                   "")
+
+        for data in damaged:
+            self.assertRaises(modelcodec.CodecException, modelcodec.decode, data)
+
+        return
+
+if __name__ == '__main__':
+    unittest.main()
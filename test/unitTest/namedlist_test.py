@@ -0,0 +1,81 @@
+# Copyright AllSeen Alliance. All rights reserved.
+#
+# Permission to use, copy, modify, and/or distribute this software for any
+# purpose with or without fee is hereby granted, provided that the above
+# copyright notice and this permission notice appear in all copies.
+#
+# THE SOFTWARE IS PROVIDED "AS IS" AND THE AUTHOR DISCLAIMS ALL WARRANTIES
+# WITH REGARD TO THIS SOFTWARE INCLUDING ALL IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR
+# ANY SPECIAL, DIRECT, INDIRECT, OR CONSEQUENTIAL DAMAGES OR ANY DAMAGES
+# WHATSOEVER RESULTING FROM LOSS OF USE, DATA OR PROFITS, WHETHER IN AN
+# ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION, ARISING OUT OF
+# OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
+import unittest
+import cPickle as pickle
+
+import AllJoynCodeGen.namedlist as namedlist
+import AllJoynCodeGen.argdef as argdef
+import AllJoynCodeGen.interface as interface
+import AllJoynCodeGen.methoddef as methoddef
+import AllJoynCodeGen.validate as validate
+
+class TestNamedList(unittest.TestCase):
+    """Tests the NamedList class."""
+
+    def test_get(self):
+        """Tests finding items by name in short and indexed lists."""
+        for count in (3, namedlist.index_threshold + 5):
+            args = namedlist.NamedList()
+
+            for n in range(count):
+                args.append(argdef.ArgDef(None, "arg{0}".format(n), "i"))
+
+            self.assertEqual(len(args), count)
+            self.assertEqual([a.name for a in args],
+                             ["arg{0}".format(n) for n in range(count)])
+
+            for a in args:
+                self.assertIs(args.get(a.name), a)
+
+            self.assertIsNone(args.get("missing"))
+            self.assertEqual(args.get("missing", 0), 0)
+
+            # The first item with a name is the one found.
+            duplicate = argdef.ArgDef(None, "arg0", "s")
+            args.append(duplicate)
+            self.assertIsNot(args.get("arg0"), duplicate)
+
+            del args[0]
+            self.assertIs(args.get("arg0"), duplicate)
+            args.remove(duplicate)
+            self.assertIsNone(args.get("arg0"))
+        return
+
+    def test_pickle(self):
+        """Tests that the index is rebuilt when unpickled."""
+        args = namedlist.NamedList()
+
+        for n in range(namedlist.index_threshold * 2):
+            args.append(argdef.ArgDef(None, "arg{0}".format(n), "i"))
+
+        copy = pickle.loads(pickle.dumps(args, pickle.HIGHEST_PROTOCOL))
+        self.assertIsInstance(copy, namedlist.NamedList)
+        self.assertEqual([a.name for a in copy], [a.name for a in args])
+        self.assertIs(copy.get("arg9"), copy[9])
+        return
+
+    def test_duplicates(self):
+        """Tests that duplicate members are found in a large interface."""
+        i = interface.Interface()
+
+        for n in range(namedlist.index_threshold * 2):
+            m = methoddef.MethodDef()
+            m.name = "Method{0}".format(n)
+            i.add_method(None, m)
+
+        self.assertIs(i.get_method("Method12"), i.methods[12])
+        m = methoddef.MethodDef()
+        m.name = "Method3"
+        self.assertRaises(validate.ValidateException, i.add_method, None, m)
+        return
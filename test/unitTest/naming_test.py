@@ -0,0 +1,88 @@
+# Copyright AllSeen Alliance. All rights reserved.
+#
+# Permission to use, copy, modify, and/or distribute this software for any
+# purpose with or without fee is hereby granted, provided that the above
+# copyright notice and this permission notice appear in all copies.
+#
+# THE SOFTWARE IS PROVIDED "AS IS" AND THE AUTHOR DISCLAIMS ALL WARRANTIES
+# WITH REGARD TO THIS SOFTWARE INCLUDING ALL IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR
+# ANY SPECIAL, DIRECT, INDIRECT, OR CONSEQUENTIAL DAMAGES OR ANY DAMAGES
+# WHATSOEVER RESULTING FROM LOSS OF USE, DATA OR PROFITS, WHETHER IN AN
+# ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION, ARISING OUT OF
+# OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
+
+from xml.etree import ElementTree
+import unittest
+
+import AllJoynCodeGen.naming as naming
+import AllJoynCodeGen.service as service
+import AllJoynCodeGen.validate as validate
+
+clash_xml = """
+    <node name="/root">
+        <node name="a/b_c">
+            <interface name="org.example.a_b.c">
+                <method name="m0"/>
+            </interface>
+        </node>
+        <node name="a_b/c">
+            <interface name="org.example.a.b_c">
+                <method name="m1"/>
+            </interface>
+        </node>
+    </node>"""
+
+class TestNaming(unittest.TestCase):
+    """Tests the naming module."""
+
+    def test_identifiers(self):
+        """Test that the identifiers are made once and are unchanged."""
+        self.assertEqual(naming.camel_case("/com/example/Demo"), "comExampleDemo")
+        self.assertEqual(naming.camel_case("com.example.Demo", "."), "comExampleDemo")
+        self.assertEqual(naming.camel_case("SetColor", None), "setColor")
+        self.assertEqual(naming.coded_name("/com/example/Demo", "/"),
+                         "_com_example_Demo")
+        self.assertEqual(naming.clean_name("a(i{sv})[Name]"), "a_i_sv_Name")
+        self.assertEqual(naming.format_identifier("APP_{0:_>2}_{1}", 3, "m"),
+                         "APP__3_m")
+
+        misses = naming.identifier_misses
+        hits = naming.identifier_hits
+        name = naming.camel_case("/com/example/Demo")
+
+        self.assertTrue(name is naming.camel_case("/com/example/Demo"))
+        self.assertEqual(naming.identifier_misses, misses)
+        self.assertEqual(naming.identifier_hits, hits + 2)
+
+        naming.clear()
+        self.assertEqual(naming.camel_case("/com/example/Demo"), name)
+        self.assertEqual(naming.identifier_misses, misses + 1)
+        return
+
+    def test_name_index(self):
+        """Test that objects and interfaces with the same identifier are found."""
+        node = ElementTree.fromstring(clash_xml)
+        s = service.Service(node.get("name"))
+        s.parse(node, False)
+
+        # The camel case names differ.
+        index = naming.NameIndex(s, "camel", "camel")
+        self.assertTrue(index.get_object("rootAB_c") is s.get_object("/root/a/b_c"))
+        self.assertIsNone(index.get_object("_root_a_b_c"))
+
+        with self.assertRaises(validate.ValidateException) as cm:
+            naming.NameIndex(s, "coded", None)
+
+        e = "Object paths '/root/a/b_c' and '/root/a_b/c' both make the identifier '_root_a_b_c'."
+        self.assertTrue(str.find(cm.exception.message, e) != -1)
+
+        with self.assertRaises(validate.ValidateException) as cm:
+            naming.NameIndex(s, None, "coded")
+
+        e = "Interfaces 'org.example.a.b_c' and 'org.example.a_b.c'"
+        self.assertTrue(str.find(cm.exception.message, e) != -1)
+        return
+
+if __name__ == '__main__':
+    unittest.main()
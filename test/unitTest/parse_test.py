@@ -16,6 +16,11 @@ import unittest
 import fnmatch
 import os
 import sys
+import tempfile
+import shutil
+import gzip
+import bz2
+import StringIO
 
 sys.path.append("../../src")
 import AllJoynCodeGen.parseajxml as parseajxml
@@ -590,6 +595,366 @@ class TestParse(unittest.TestCase):
 
         return
 
+    def test_other_parsers(self):
+        """Tests the other parsers build the same service as the tree parser."""
+        directories = ("classes_and_instances", "arrays", "structs", "methods",
+                       "properties", "samples", "signals", "unnamed")
+
+        for d in directories:
+            for f in self.__directory_xml_files(d):
+                args = ("-b/com/example",) if d == "unnamed" else None
+                tree_service = self.__parse_with(f, "tree", args)
+
+                for parser in parseajxml.parsers[1:]:
+                    service = self.__parse_with(f, parser, args)
+
+                    mess = "Parse of '{0}' with '{1}' differs.".format(f, parser)
+                    self.assertEqual(str(tree_service), str(service), mess)
+                    self.assertEqual(tree_service.interfaces,
+                                     service.interfaces, mess)
+
+        # The results of the test cases, including any errors, are the same.
+        for f in self.__directory_xml_files("../xml_testcases"):
+            tree_result = self.__parse_result(f, "tree")
+
+            for parser in parseajxml.parsers[1:]:
+                mess = "Parse of '{0}' with '{1}' differs.".format(f, parser)
+                result = self.__parse_result(f, parser)
+                self.assertEqual(tree_result, result, mess)
+
+        # The errors must also be the same.
+        f = "../xml_testcases/invalid_nested_same_name.xml"
+        for parser in parseajxml.parsers:
+            with self.assertRaises(validate.ValidateException) as cm:
+                self.__parse_with(f, parser)
+
+            message = cm.exception.message
+            self.assertTrue(str.find(message, "Duplicate node name ") != -1)
+
+        f = "../xml_testcases/invalid_multiple_root_nodes.xml"
+        for parser in parseajxml.parsers[1:]:
+            with self.assertRaises(parseajxml.ParseException) as cm:
+                self.__parse_with(f, parser)
+
+            message = cm.exception.message
+            self.assertTrue(str.find(message, "junk after document element:") != -1)
+        return
+
+    def test_error_location(self):
+        """Tests that errors give the file, line and column of the xml."""
+        f = "../xml_testcases/invalid_nested_same_name.xml"
+
+        for parser in parseajxml.parsers:
+            with self.assertRaises(validate.ValidateException) as cm:
+                self.__parse_with(f, parser)
+
+            message = cm.exception.message
+            self.assertTrue(str.find(message, "Found here: {0}:".format(f)) != -1)
+            self.assertTrue(str.find(message, "</node>") == -1)
+        return
+
+    def test_compressed_input(self):
+        """Tests compressed files and the standard input."""
+        f = "samples/sample_1.xml"
+        expected = str(self.__parse_with(f, "tree"))
+
+        with open(f, "rb") as source:
+            xml = source.read()
+
+        path = tempfile.mkdtemp()
+
+        try:
+            gz_file = os.path.join(path, "sample_1.xml.gz")
+            gz = gzip.GzipFile(gz_file, "wb")
+            gz.write(xml)
+            gz.close()
+
+            bz2_file = os.path.join(path, "sample_1.xml.bz2")
+            with open(bz2_file, "wb") as compressed:
+                compressed.write(bz2.compress(xml))
+
+            for parser in parseajxml.parsers:
+                for name in (gz_file, bz2_file):
+                    service = self.__parse_with(name, parser)
+                    self.assertEqual(expected, str(service))
+
+                    mess = "Compressed file '{0}' not found.".format(name)
+                    found = parseajxml.get_input_files(path)
+                    self.assertTrue(name in found, mess)
+
+                for name in (f, gz_file):
+                    stdin = sys.stdin
+
+                    try:
+                        sys.stdin = open(name, "rb")
+                        service = self.__parse_with("-", parser)
+                    finally:
+                        sys.stdin.close()
+                        sys.stdin = stdin
+
+                    self.assertEqual(expected, str(service))
+        finally:
+            shutil.rmtree(path)
+
+        return
+
+    def test_parse_filter(self):
+        """Tests that filtered objects and interfaces are never parsed."""
+        xml = """<node name="/org/example">
+  <interface name="org.example.Root">
+    <method name="Ping"/>
+  </interface>
+  <node name="Light">
+    <interface name="org.example.Light">
+      <method name="On"/>
+    </interface>
+    <interface name="org.example.Secret">
+      <method name="bad name!"/>
+    </interface>
+  </node>
+  <node name="Door">
+    <interface name="bad interface name!"/>
+    <node name="Lock">
+      <interface name="org.example.Lock">
+        <method name="Open"/>
+      </interface>
+    </node>
+  </node>
+</node>
+"""
+        path = self.__make_xml_files({"filter.xml" : xml})
+        f = os.path.join(path, "filter.xml")
+        args = ("--include-object=/org/example/Light*",
+                "--exclude-interface=org.example.Secret")
+
+        try:
+            for parser in parseajxml.parsers:
+                service = self.__parse_with(f, parser, args)
+                validate.alljoyn_data(service, "tl")
+
+                names = [o.get_full_name() for o in service.get_objects()]
+                self.assertEqual(names, ["/org/example", "/org/example/Light"])
+                self.assertEqual(sorted(service.interfaces), ["org.example.Light"])
+
+                # Nothing left.
+                service = self.__parse_with(f, parser,
+                                            ("--include-interface=com.example.*",))
+
+                with self.assertRaises(validate.ValidateException) as cm:
+                    validate.alljoyn_data(service, "tl")
+
+                message = cm.exception.message
+                self.assertTrue(str.find(message, "No interfaces match") != -1)
+        finally:
+            shutil.rmtree(path)
+
+        return
+
+    def test_annotations(self):
+        """Tests known annotations are applied and unknown ones summarized."""
+        xml = """<node name="/org/example">
+  <interface name="org.example.Doc">
+    <annotation name="org.example.Doc" value="Interface"/>
+    <annotation name="org.alljoyn.Bus.Item.IsSecure" value="true"/>
+    <annotation name="org.example.Doc" value="Again"/>
+    <method name="Do">
+      <annotation name="org.example.Doc" value="Method"/>
+      <annotation name="org.freedesktop.DBus.Method.NoReply" value="true"/>
+      <arg name="how" type="s" direction="in">
+        <annotation name="org.example.Other" value="Arg"/>
+      </arg>
+    </method>
+  </interface>
+</node>
+"""
+        path = self.__make_xml_files({"annotations.xml" : xml})
+        f = os.path.join(path, "annotations.xml")
+
+        try:
+            for parser in parseajxml.parsers:
+                stdout = sys.stdout
+                sys.stdout = StringIO.StringIO()
+
+                try:
+                    service = self.__parse_with(f, parser)
+                    output = sys.stdout.getvalue()
+                finally:
+                    sys.stdout = stdout
+
+                i = service.interfaces["org.example.Doc"]
+                self.assertTrue(i.is_secure)
+                self.assertTrue(i.methods[0].no_reply)
+
+                self.assertEqual(output.count("Ignoring unknown annotations"), 1)
+                self.assertTrue(str.find(output, "'org.example.Doc' 3 time(s)") != -1)
+                self.assertTrue(str.find(output, "'org.example.Other' 1 time(s)") != -1)
+
+            # The annotations of the files parsed by the worker processes are
+            # reported once.
+            other = xml.replace("org.example.Other", "org.example.Doc")
+            self.__make_xml_files({"other.xml" : other}, path)
+            command_line = self.__get_command_line(path)
+
+            for jobs in (1, 2):
+                stdout = sys.stdout
+                sys.stdout = StringIO.StringIO()
+
+                try:
+                    parseajxml.ParseAjXml(path, "tree", jobs).parse(command_line)
+                    output = sys.stdout.getvalue()
+                finally:
+                    sys.stdout = stdout
+
+                self.assertEqual(output.count("Ignoring unknown annotations"), 1)
+                self.assertTrue(str.find(output, "'org.example.Doc' 7 time(s)") != -1)
+                self.assertTrue(str.find(output, "'org.example.Other' 1 time(s)") != -1)
+        finally:
+            shutil.rmtree(path)
+
+        return
+
+    def test_multiple_files(self):
+        """Tests parsing and merging several files, directories and globs."""
+        files = {"a.xml" : """
+                    <node name="/com/example">
+                        <interface name="com.example.A">
+                            <method name="m0" />
+                        </interface>
+                    </node>""",
+                 "b.xml" : """
+                    <node name="/com/example">
+                        <interface name="com.example.A">
+                            <method name="m0" />
+                        </interface>
+                        <node name="sub">
+                            <interface name="com.example.A">
+                                <method name="m0" />
+                            </interface>
+                            <interface name="com.example.B">
+                                <signal name="s0" />
+                            </interface>
+                        </node>
+                    </node>"""}
+        path = self.__make_xml_files(files)
+
+        try:
+            full_a = os.path.join(path, "a.xml")
+            full_b = os.path.join(path, "b.xml")
+
+            for names in ([full_a, full_b], path, os.path.join(path, "*.xml")):
+                p = parseajxml.ParseAjXml(names, "tree", 2)
+                self.assertEqual(p.filenames, [full_a, full_b])
+
+                service = p.parse(self.__get_command_line(full_a))
+                validate.alljoyn_data(service, "tl")
+
+                self.assertEqual(sorted(service.interfaces),
+                                 ["com.example.A", "com.example.B"])
+
+                full_names = [o.get_full_name() for o in service.get_objects()]
+                self.assertEqual(full_names, ["/com/example", "/com/example/sub"])
+
+                # Identical interfaces are collapsed into one.
+                a = service.get_interface("com.example.A")
+                for o in service.get_objects():
+                    self.assertTrue(o.interfaces[0] is a)
+                self.assertEqual(len(a.parents), 2)
+
+            # Different root objects are merged below '/'. An object is made
+            # for each element of their paths.
+            files = {"c.xml" : """
+                        <node name="/org/other">
+                            <interface name="com.example.A">
+                                <method name="m0" />
+                            </interface>
+                        </node>"""}
+            self.__make_xml_files(files, path)
+            p = parseajxml.ParseAjXml(path, "stream", 1)
+            service = p.parse(self.__get_command_line(full_a))
+            validate.alljoyn_data(service, "tl")
+
+            full_names = [o.get_full_name() for o in service.get_objects()]
+            self.assertEqual(full_names, ["/", "/com", "/com/example",
+                                          "/com/example/sub", "/org",
+                                          "/org/other"])
+            self.assertEqual(len(service.get_interface("com.example.A").parents), 3)
+
+            # Conflicting interfaces report the files.
+            files = {"d.xml" : """
+                        <node name="/com/example">
+                            <interface name="com.example.A">
+                                <method name="m1" />
+                            </interface>
+                        </node>"""}
+            self.__make_xml_files(files, path)
+            p = parseajxml.ParseAjXml(path)
+
+            with self.assertRaises(validate.ValidateException) as cm:
+                p.parse(self.__get_command_line(full_a))
+
+            message = cm.exception.message
+            e = "has multiple definitions with different signatures."
+            self.assertTrue(str.find(message, e) != -1)
+            self.assertTrue(str.find(message, "a.xml") != -1)
+            self.assertTrue(str.find(message, "d.xml") != -1)
+
+            # Errors in one file name the file.
+            files = {"e.xml" : """
+                        <node name="/com/example">
+                            <interface name="com.example.E" />
+                        </node>"""}
+            self.__make_xml_files(files, path)
+            full_e = os.path.join(path, "e.xml")
+            p = parseajxml.ParseAjXml([full_a, full_e])
+
+            with self.assertRaises(validate.ValidateException) as cm:
+                p.parse(self.__get_command_line(full_a))
+
+            message = cm.exception.message
+            self.assertTrue(str.find(message, "Incompletely specified interface") != -1)
+            self.assertTrue(str.find(message, full_e) != -1)
+
+            with self.assertRaises(parseajxml.ParseException) as cm:
+                parseajxml.ParseAjXml(os.path.join(path, "*.foo"))
+        finally:
+            shutil.rmtree(path)
+
+        return
+
+    def __make_xml_files(self, files, path = None):
+        """Write each of the xml strings in files to a (temporary) directory."""
+        if path is None:
+            path = tempfile.mkdtemp()
+
+        for name, xml in files.items():
+            with open(os.path.join(path, name), "w") as f:
+                f.write(xml)
+
+        return path
+
+    def __get_command_line(self, filename, additional_args = None):
+        """Get the command line used to parse the file."""
+        args = ["parse_test.py", "-ttl", "-wTest.Foo", filename]
+
+        if additional_args is not None:
+            args.extend(additional_args)
+
+        sys.argv = args
+        return util.get_config().command_line
+
+    def __parse_with(self, filename, parser, additional_args = None):
+        """Parse the file with the given xml parser and return the service."""
+        command_line = self.__get_command_line(filename, additional_args)
+        p = parseajxml.ParseAjXml(filename, parser)
+        return p.parse(command_line)
+
+    def __parse_result(self, filename, parser):
+        """Get the service as a string or the error from parsing the file."""
+        try:
+            return str(self.__parse_with(filename, parser, ("-l",)))
+        except (parseajxml.ParseException, validate.ValidateException) as e:
+            return e.message
+
     def __directory_xml_files(self, path):
         """Traverses the entire directory path returns all XML files."""
         return_value = []
@@ -671,6 +1036,7 @@ class TestParse(unittest.TestCase):
                 #    all structures should have a signature starting with '('
                 #    all dictionaries should have a signature starting with '{'
                 # [checks for issue ASADT-3]
+                service_interface.elaborate()
                 for struct in service_interface.structures:
                     mess_format = "Container extraction gave malformed struct signature {0} in {1}."
                     message = mess_format.format(struct, filename)
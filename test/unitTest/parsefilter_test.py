@@ -0,0 +1,64 @@
+# Copyright AllSeen Alliance. All rights reserved.
+#
+# Permission to use, copy, modify, and/or distribute this software for any
+# purpose with or without fee is hereby granted, provided that the above
+# copyright notice and this permission notice appear in all copies.
+#
+# THE SOFTWARE IS PROVIDED "AS IS" AND THE AUTHOR DISCLAIMS ALL WARRANTIES
+# WITH REGARD TO THIS SOFTWARE INCLUDING ALL IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR
+# ANY SPECIAL, DIRECT, INDIRECT, OR CONSEQUENTIAL DAMAGES OR ANY DAMAGES
+# WHATSOEVER RESULTING FROM LOSS OF USE, DATA OR PROFITS, WHETHER IN AN
+# ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION, ARISING OUT OF
+# OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
+
+import unittest
+
+import AllJoynCodeGen.parsefilter as parsefilter
+
+class TestParseFilter(unittest.TestCase):
+    """Tests the ParseFilter class."""
+
+    def test_objects(self):
+        """Test the include and exclude object patterns."""
+        f = parsefilter.ParseFilter(["/org/example/Light*", "/org/example/Door"],
+                                    ["/org/example/Light/Broken"])
+
+        self.assertTrue(f.accepts_object("/org/example/Light"))
+        self.assertTrue(f.accepts_object("/org/example/Light/Bulb/1"))
+        self.assertTrue(f.accepts_object("/org/example/Door"))
+        self.assertFalse(f.accepts_object("/org/example"))
+        self.assertFalse(f.accepts_object("/org/example/Door/Lock"))
+        self.assertFalse(f.accepts_object("/org/example/Light/Broken"))
+
+        # The parents of the included objects can't be skipped.
+        self.assertFalse(f.skips_object("/"))
+        self.assertFalse(f.skips_object("/org"))
+        self.assertFalse(f.skips_object("/org/example"))
+        self.assertFalse(f.skips_object("/org/example/Lights"))
+        self.assertFalse(f.skips_object("/org/example/Door"))
+
+        self.assertTrue(f.skips_object("/com"))
+        self.assertTrue(f.skips_object("/org/examples"))
+        self.assertTrue(f.skips_object("/org/example/Doors"))
+        self.assertTrue(f.skips_object("/org/example/Door/Lock"))
+        self.assertTrue(f.skips_object("/org/example/Window"))
+        self.assertTrue(f.skips_object("/org/example/Light/Broken"))
+        return
+
+    def test_interfaces(self):
+        """Test the include and exclude interface patterns."""
+        f = parsefilter.ParseFilter(None, None, ["org.example.*"],
+                                    ["org.example.Secret*"])
+
+        self.assertTrue(f.accepts_interface("org.example.Light"))
+        self.assertFalse(f.accepts_interface("org.example.SecretDoor"))
+        self.assertFalse(f.accepts_interface("com.example.Light"))
+
+        # Without object patterns every object is kept.
+        self.assertTrue(f.accepts_object("/anything"))
+        self.assertFalse(f.skips_object("/anything"))
+        return
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,156 @@
+# Copyright AllSeen Alliance. All rights reserved.
+#
+# Permission to use, copy, modify, and/or distribute this software for any
+# purpose with or without fee is hereby granted, provided that the above
+# copyright notice and this permission notice appear in all copies.
+#
+# THE SOFTWARE IS PROVIDED "AS IS" AND THE AUTHOR DISCLAIMS ALL WARRANTIES
+# WITH REGARD TO THIS SOFTWARE INCLUDING ALL IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR
+# ANY SPECIAL, DIRECT, INDIRECT, OR CONSEQUENTIAL DAMAGES OR ANY DAMAGES
+# WHATSOEVER RESULTING FROM LOSS OF USE, DATA OR PROFITS, WHETHER IN AN
+# ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION, ARISING OUT OF
+# OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
+from xml.etree import ElementTree
+import unittest
+
+import AllJoynCodeGen.service as service
+import AllJoynCodeGen.interface as interface
+import AllJoynCodeGen.methoddef as methoddef
+import AllJoynCodeGen.ajobject as ajobject
+import AllJoynCodeGen.validate as validate
+
+test_xml = """
+    <node name="/root">
+        <interface name="i.i0">
+            <method name="m0"/>
+        </interface>
+        <node name="sub">
+            <interface name="i.i0">
+                <method name="m0"/>
+            </interface>
+        </node>
+    </node>"""
+
+other_xml = """
+    <node name="/root">
+        <node name="other">
+            <interface name="i.i1">
+                <method name="m1"/>
+            </interface>
+        </node>
+    </node>"""
+
+merge_xml = ("""
+    <node name="/a">
+        <interface name="i.i0">
+            <method name="m0"/>
+        </interface>
+    </node>""", """
+    <node name="/a/b">
+        <interface name="i.i1">
+            <method name="m1"/>
+        </interface>
+    </node>""", """
+    <node name="/a">
+        <node name="b">
+            <interface name="i.i2">
+                <method name="m2"/>
+            </interface>
+        </node>
+    </node>""")
+
+class TestService(unittest.TestCase):
+    """Tests the Service class."""
+
+    def test_merge(self):
+        """Tests merging services with nested and overlapping roots."""
+        merged = service.Service("/")
+
+        for xml in merge_xml:
+            node = ElementTree.fromstring(xml)
+            s = service.Service(node.get("name"))
+            s.parse(node, False)
+            merged.merge(s)
+
+        objects = merged.get_objects()
+        names = [o.get_full_name() for o in objects]
+        self.assertEqual(names, ["/", "/a", "/a/b"])
+
+        a = merged.get_object("/a")
+        b = merged.get_object("/a/b")
+        self.assertEqual(a.alljoyn_objects.keys(), ["b"])
+        self.assertTrue(b.parent is a)
+        self.assertEqual([i.interface_full_name for i in b.interfaces],
+                         ["i.i1", "i.i2"])
+        self.assertEqual([i.interface_full_name for i in a.interfaces],
+                         ["i.i0"])
+        return
+
+    def test_add_interface(self):
+        """Tests that duplicate interfaces are found by their fingerprints."""
+        node = ElementTree.fromstring(test_xml)
+        s = service.Service(node.get("name"))
+        s.parse(node, False)
+
+        # The duplicate in the child object is not elaborated to compare it.
+        i = s.get_interface("i.i0")
+        self.assertFalse(i.elaborated)
+
+        same = interface.Interface()
+        same.parse(node.find("interface"), False)
+        self.assertTrue(s.add_interface(same, None) is i)
+        self.assertFalse(i.elaborated)
+        self.assertFalse(same.elaborated)
+
+        other_node = ElementTree.fromstring(other_xml)
+        other = service.Service(other_node.get("name"))
+        other.parse(other_node, False)
+
+        different = other.get_interface("i.i1")
+        different.set_name("i.i0")
+        self.assertRaises(validate.ValidateException,
+                          s.add_interface, different, None)
+        self.assertTrue(s.get_interface("i.i0") is i)
+        return
+
+    def test_freeze(self):
+        """Tests that a frozen service can't be changed."""
+        node = ElementTree.fromstring(test_xml)
+        s = service.Service(node.get("name"))
+        s.parse(node, False)
+        validate.alljoyn_data(s, "tl")
+        s.freeze()
+        s.freeze()
+
+        self.assertTrue(s.frozen)
+        self.assertIsNotNone(s.summary)
+        self.assertEqual(len(s.get_objects()), 2)
+        text = str(s)
+
+        other_node = ElementTree.fromstring(other_xml)
+        other = service.Service(other_node.get("name"))
+        other.parse(other_node, False)
+
+        i = s.get_interface("i.i0")
+        o = s.get_object("/root/sub")
+        m = methoddef.MethodDef()
+        m.name = "m1"
+
+        changes = ((s.parse, (node, False)),
+                   (s.merge, (other,)),
+                   (s.add_interface, (other.get_interface("i.i1"), None)),
+                   (s.delete_object_cache, ()),
+                   (o.add_child, (ajobject.AllJoynObject("child", o),)),
+                   (o.add_interface, (None, other.get_interface("i.i1"), s)),
+                   (i.add_method, (None, m)),
+                   (i.add_parent, (o,)),
+                   (i.set_name, ("i.renamed",)))
+
+        for change, args in changes:
+            self.assertRaises(validate.ValidateException, change, *args)
+
+        self.assertEqual(str(s), text)
+        self.assertEqual(s.get_object("/root/sub").get_full_name(), "/root/sub")
+        self.assertIsNone(i.get_method("m1"))
+        return
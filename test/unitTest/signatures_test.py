@@ -0,0 +1,80 @@
+# Copyright AllSeen Alliance. All rights reserved.
+#
+# Permission to use, copy, modify, and/or distribute this software for any
+# purpose with or without fee is hereby granted, provided that the above
+# copyright notice and this permission notice appear in all copies.
+#
+# THE SOFTWARE IS PROVIDED "AS IS" AND THE AUTHOR DISCLAIMS ALL WARRANTIES
+# WITH REGARD TO THIS SOFTWARE INCLUDING ALL IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR
+# ANY SPECIAL, DIRECT, INDIRECT, OR CONSEQUENTIAL DAMAGES OR ANY DAMAGES
+# WHATSOEVER RESULTING FROM LOSS OF USE, DATA OR PROFITS, WHETHER IN AN
+# ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION, ARISING OUT OF
+# OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
+import unittest
+
+import AllJoynCodeGen.signatures as signatures
+
+class TestSignatures(unittest.TestCase):
+    """Tests the Signature class."""
+
+    def test_get(self):
+        """Tests that each signature is parsed once and shared."""
+        s = signatures.get("aa(is)")
+        self.assertIs(signatures.get("aa(is)"), s)
+        self.assertIs(signatures.signature_table["aa(is)"], s)
+        self.assertIsNot(signatures.get("a(is)"), s)
+
+        self.assertRaises(AttributeError, setattr, s, "base", "i")
+        self.assertEqual(s.base, "(is)")
+        return
+
+    def test_members(self):
+        """Tests the precomputed members."""
+        s = signatures.get("aa{s(ia{sv}aai)}")
+        self.assertEqual(s.text, "aa{s(ia{sv}aai)}")
+        self.assertEqual(str(s), s.text)
+        self.assertEqual(s.base, "{s(ia{sv}aai)}")
+        self.assertEqual(s.indirection_level, 2)
+        self.assertEqual(s.max_array_dimension, 2)
+        self.assertEqual(s.max_structure_depth, 1)
+        self.assertEqual(s.max_dictionary_depth, 2)
+        self.assertTrue(s.is_array)
+        self.assertFalse(s.is_structure)
+        self.assertTrue(s.is_dictionary)
+        self.assertTrue(s.is_dictionary_array)
+        self.assertFalse(s.is_basic_type)
+
+        s = signatures.get("u")
+        self.assertEqual(s.base, "u")
+        self.assertEqual(s.indirection_level, 0)
+        self.assertFalse(s.is_array)
+        self.assertTrue(s.is_basic_type)
+        self.assertFalse(signatures.get("v").is_basic_type)
+        return
+
+    def test_fields(self):
+        """Tests the tree of fields."""
+        s = signatures.get("(ia(sv)a{s(ii)}aay)")
+        texts = [f.text for f in s.fields]
+        self.assertEqual(texts, ["i", "a(sv)", "a{s(ii)}", "aay"])
+
+        self.assertIs(s.fields[1], signatures.get("a(sv)"))
+        struct = signatures.get(s.fields[1].base)
+        self.assertEqual([f.text for f in struct.fields], ["s", "v"])
+        self.assertEqual(s.fields[0].fields, ())
+
+        d = signatures.get("{s(ii)}")
+        self.assertEqual([f.text for f in d.fields], ["s", "(ii)"])
+        self.assertEqual([f.text for f in d.fields[1].fields], ["i", "i"])
+        return
+
+    def test_containers(self):
+        """Tests the structures and dictionaries found in a signature."""
+        s = signatures.get("a{s(i(ss)a{s(ss)})}")
+        self.assertEqual(s.structures, ("(ss)", "(i(ss)a{s(ss)})"))
+        self.assertEqual(s.dictionaries, ("{s(ss)}", "{s(i(ss)a{s(ss)})}"))
+
+        self.assertEqual(signatures.get("aai").structures, ())
+        self.assertEqual(signatures.get("aai").dictionaries, ())
+        return
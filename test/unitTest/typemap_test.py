@@ -0,0 +1,61 @@
+# Copyright AllSeen Alliance. All rights reserved.
+#
+# Permission to use, copy, modify, and/or distribute this software for any
+# purpose with or without fee is hereby granted, provided that the above
+# copyright notice and this permission notice appear in all copies.
+#
+# THE SOFTWARE IS PROVIDED "AS IS" AND THE AUTHOR DISCLAIMS ALL WARRANTIES
+# WITH REGARD TO THIS SOFTWARE INCLUDING ALL IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR
+# ANY SPECIAL, DIRECT, INDIRECT, OR CONSEQUENTIAL DAMAGES OR ANY DAMAGES
+# WHATSOEVER RESULTING FROM LOSS OF USE, DATA OR PROFITS, WHETHER IN AN
+# ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION, ARISING OUT OF
+# OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
+
+import unittest
+
+import AllJoynCodeGen.typemap as typemap
+import AllJoynCodeGen.interface as interface
+import AllJoynCodeGen.memberdef as memberdef
+
+class TestTypeMap(unittest.TestCase):
+    """Tests the TypeMap class."""
+
+    def test_get(self):
+        """Test that each type is made once until it is out of date."""
+        made = []
+
+        def make(i, signature, suffix):
+            made.append(signature)
+            return signature + suffix
+
+        m = typemap.TypeMap("test")
+        i = interface.Interface()
+        i.set_name("org.example.One")
+
+        self.assertEqual(m.get("t", i, "[Color]", make, "!"), "[Color]!")
+        self.assertEqual(m.get("t", i, "[Color]", make, "!"), "[Color]!")
+        self.assertEqual(m.get("t", i, "[Color]", make, "?"), "[Color]?")
+        self.assertEqual(m.get("t", None, "i", make, "!"), "i!")
+        self.assertEqual((m.hits, m.misses), (1, 3))
+
+        # Another interface with the same name or a change to a named type
+        # makes the type again.
+        other = interface.Interface()
+        other.set_name("org.example.One")
+        m.get("t", other, "[Color]", make, "!")
+        memberdef.types_changed()
+        m.get("t", other, "[Color]", make, "!")
+        self.assertEqual(m.misses, 5)
+
+        m.clear()
+        m.get("t", other, "[Color]", make, "!")
+        self.assertEqual((m.hits, m.misses), (1, 6))
+        self.assertEqual(len(made), 6)
+        self.assertAlmostEqual(m.get_hit_rate(), 1.0 / 7)
+
+        self.assertTrue(typemap.get_type_map("test") is typemap.get_type_map("test"))
+        return
+
+if __name__ == '__main__':
+    unittest.main()
@@ -17,6 +17,8 @@ import string
 import os
 import sys
 
+from xml.etree import ElementTree
+
 import AllJoynCodeGen.validate as validate
 
 class TestValidate(unittest.TestCase):
@@ -198,6 +200,41 @@ class TestValidate(unittest.TestCase):
             self.assertTrue(string.find(message, name) != -1)
         return
 
+    def test_accepted_names(self):
+        """Test that valid names are remembered and invalid names are not."""
+        validate.accepted_names.clear()
+        validate.interface_name("org.example.Door")
+        validate.member_name("Open")
+        validate.bus_object_path("/org/example/door1")
+
+        self.assertEqual(validate.accepted_names,
+                         {("interface", "org.example.Door"),
+                          ("member", "Open"),
+                          ("path", "/org/example/door1")})
+
+        for name in ("1Open", "Op-en", "Op.en"):
+            self.assertRaises(validate.ValidateException,
+                              validate.member_name, name)
+            self.assertRaises(validate.ValidateException,
+                              validate.member_name, name)
+
+        # Names are limited in length but bus object paths are not.
+        name = "a" * (validate.max_name_length + 1)
+        self.assertRaises(validate.ValidateException, validate.arg_name, name)
+        validate.bus_object_path("/" + name)
+        self.assertEqual(len(validate.accepted_names), 4)
+
+        max_accepted_names = validate.max_accepted_names
+
+        try:
+            validate.max_accepted_names = 3
+            validate.type_name("Color")
+            self.assertEqual(validate.accepted_names, {("type", "Color")})
+        finally:
+            validate.max_accepted_names = max_accepted_names
+
+        return
+
     def test_flat_data_signature(self):
         """Test validation for flattened argument signatures."""
         self.__flat_data_signature_empty_tests()
@@ -248,6 +285,26 @@ class TestValidate(unittest.TestCase):
         self.__property_access_invalid_test("READWRITE")
         return
 
+    def test_xml_error(self):
+        """Test the location and excerpt given with an xml error."""
+        xml = ElementTree.fromstring('<method name="Foo"><arg type="s"/></method>')
+        message = validate.get_xml_error(xml, "Bad method.")
+        self.assertEqual(message, 'Bad method.\nFound here:\n<method name="Foo">')
+
+        xml.location = ("test.xml", 12, 5)
+        message = validate.get_xml_error(xml, "Bad method.")
+        expected = 'Bad method.\nFound here: test.xml:12:5\n<method name="Foo">'
+        self.assertEqual(message, expected)
+
+        xml.set("name", "F" * (2 * validate.max_excerpt_length))
+        message = validate.get_xml_error(xml, "Bad method.")
+        excerpt = message.split("\n")[-1]
+        self.assertEqual(len(excerpt), validate.max_excerpt_length)
+        self.assertTrue(excerpt.endswith(" ...>"))
+
+        self.assertEqual(validate.get_xml_error(None, "Bad."), "Bad.")
+        return
+
     def __property_access_invalid_test(self, access):
         """Test to make sure this type of access is flagged as invalid."""
         with self.assertRaises(validate.ValidateException) as cm: